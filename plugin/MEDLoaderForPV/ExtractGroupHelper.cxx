@@ -20,15 +20,14 @@
 
 #include "ExtractGroupHelper.h"
 #include "MEDFileFieldRepresentationTree.hxx"
+#include "MEDHierarchy.hxx"
 
 #include "vtkInformation.h"
 #include "vtkInformationDataObjectMetaDataKey.h"
-#include "vtkAdjacentVertexIterator.h"
 #include "vtkMutableDirectedGraph.h"
-#include "vtkDataSetAttributes.h"
-#include "vtkStringArray.h"
 
 #include <cstring>
+#include <limits>
 
 const char ExtractGroupGrp::START[]="GRP_";
 
@@ -106,18 +105,8 @@ bool ExtractGroupInternal::IndependantIsInformationOK(vtkInformationDataObjectMe
   vtkMutableDirectedGraph *sil(vtkMutableDirectedGraph::SafeDownCast(info->Get(medReaderMetaData)));
   if(!sil)
     return false;
-  int idNames(0);
-  vtkAbstractArray *verticesNames(sil->GetVertexData()->GetAbstractArray("Names",idNames));
-  vtkStringArray *verticesNames2(vtkStringArray::SafeDownCast(verticesNames));
-  if(!verticesNames2)
-    return false;
-  for(int i=0;i<verticesNames2->GetNumberOfValues();i++)
-    {
-      vtkStdString &st(verticesNames2->GetValue(i));
-      if(st=="MeshesFamsGrps")
-        return true;
-    }
-  return false;
+  std::shared_ptr<const MEDHierarchy> hierarchy(MEDHierarchy::GetOrBuildFrom(sil));
+  return hierarchy->findVertex("MeshesFamsGrps")!=-1;
 }
 
 const char *ExtractGroupInternal::getMeshName() const
@@ -125,68 +114,45 @@ const char *ExtractGroupInternal::getMeshName() const
   return this->_mesh_name.c_str();
 }
 
+/*!
+ * Loads the groups and families of the meshes in \a sil. Nothing is done if \a sil has already been loaded.
+ */
 void ExtractGroupInternal::loadFrom(vtkMutableDirectedGraph *sil)
 {
+  std::shared_ptr<const MEDHierarchy> hierarchy(MEDHierarchy::GetOrBuildFrom(sil));
+  if(hierarchy && hierarchy==_hierarchy)
+    return ;
+  vtkIdType id0(hierarchy?hierarchy->findVertex("MeshesFamsGrps"):-1);
+  if(id0==-1)
+    throw INTERP_KERNEL::Exception("There is an internal error ! The tree on server side has not the expected look !");
   std::vector<ExtractGroupGrp> oldGrps(_groups); _groups.clear();
   std::vector<ExtractGroupFam> oldFams(_fams); _fams.clear();
-  int idNames(0);
-  vtkAbstractArray *verticesNames(sil->GetVertexData()->GetAbstractArray("Names",idNames));
-  vtkStringArray *verticesNames2(vtkStringArray::SafeDownCast(verticesNames));
-  vtkIdType id0;
-  bool found(false);
-  for(int i=0;i<verticesNames2->GetNumberOfValues();i++)
+  const MEDHierarchy& h(*hierarchy);
+  for(vtkIdType i0=0;i0<h.getNumberOfChildren(id0);i0++)
     {
-      vtkStdString &st(verticesNames2->GetValue(i));
-      if(st=="MeshesFamsGrps")
+      vtkIdType id1(h.getChild(id0,i0));
+      this->_mesh_name=h.getNameOf(id1);
+      vtkIdType idZeGrps(h.getChild(id1,0));//zeGroups
+      vtkIdType nbOfGrps(h.getNumberOfChildren(idZeGrps));
+      _groups.reserve(_groups.size()+nbOfGrps);
+      for(vtkIdType i1=0;i1<nbOfGrps;i1++)
         {
-          id0=i;
-          found=true;
-        }
-    }
-  if(!found)
-    throw INTERP_KERNEL::Exception("There is an internal error ! The tree on server side has not the expected look !");
-  vtkAdjacentVertexIterator *it0(vtkAdjacentVertexIterator::New());
-  sil->GetAdjacentVertices(id0,it0);
-  while(it0->HasNext())
-    {
-      vtkIdType id1(it0->Next());
-      std::string meshName(verticesNames2->GetValue(id1).c_str());
-      this->_mesh_name=meshName;
-      vtkAdjacentVertexIterator *it1(vtkAdjacentVertexIterator::New());
-      sil->GetAdjacentVertices(id1,it1);
-      vtkIdType idZeGrps(it1->Next());//zeGroups
-      vtkAdjacentVertexIterator *itGrps(vtkAdjacentVertexIterator::New());
-      sil->GetAdjacentVertices(idZeGrps,itGrps);
-      while(itGrps->HasNext())
-        {
-          vtkIdType idg(itGrps->Next());
-          ExtractGroupGrp grp(verticesNames2->GetValue(idg).c_str());
-          vtkAdjacentVertexIterator *itGrps2(vtkAdjacentVertexIterator::New());
-          sil->GetAdjacentVertices(idg,itGrps2);
-          std::vector<std::string> famsOnGroup;
-          while(itGrps2->HasNext())
-            {
-              vtkIdType idgf(itGrps2->Next());
-              famsOnGroup.push_back(std::string(verticesNames2->GetValue(idgf)).c_str());
-            }
+          vtkIdType idg(h.getChild(idZeGrps,i1));
+          ExtractGroupGrp grp(h.getNameOf(idg));
+          std::vector<std::string> famsOnGroup(h.getNumberOfChildren(idg));
+          for(vtkIdType i2=0;i2<h.getNumberOfChildren(idg);i2++)
+            famsOnGroup[i2]=h.getNameOf(h.getChild(idg,i2));
           grp.setFamilies(famsOnGroup);
-          itGrps2->Delete();
           _groups.push_back(grp);
         }
-      itGrps->Delete();
-      vtkIdType idZeFams(it1->Next());//zeFams
-      it1->Delete();
-      vtkAdjacentVertexIterator *itFams(vtkAdjacentVertexIterator::New());
-      sil->GetAdjacentVertices(idZeFams,itFams);
-      while(itFams->HasNext())
-        {
-          vtkIdType idf(itFams->Next());
-          ExtractGroupFam fam(verticesNames2->GetValue(idf).c_str());
-          _fams.push_back(fam);
-        }
-      itFams->Delete();
+      vtkIdType idZeFams(h.getChild(id1,1));//zeFams
+      vtkIdType nbOfFams(h.getNumberOfChildren(idZeFams));
+      _fams.reserve(_fams.size()+nbOfFams);
+      for(vtkIdType i1=0;i1<nbOfFams;i1++)
+        _fams.push_back(ExtractGroupFam(h.getNameOf(h.getChild(idZeFams,i1))));
     }
-  it0->Delete();
+  _hierarchy=hierarchy;
+  this->buildIndexOfEntries();
   //
   std::size_t szg(_groups.size()),szf(_fams.size());
   if(szg==oldGrps.size() && szf==oldFams.size())
@@ -234,28 +200,39 @@ void ExtractGroupInternal::setStatusOfEntryStr(const char *entry, bool status)
 
 const ExtractGroupStatus& ExtractGroupInternal::getEntry(const char *entry) const
 {
-  std::string entryCpp(entry);
-  for(std::vector<ExtractGroupGrp>::const_iterator it0=_groups.begin();it0!=_groups.end();it0++)
-    if(entryCpp==(*it0).getKeyOfEntry())
-      return *it0;
-  for(std::vector<ExtractGroupFam>::const_iterator it0=_fams.begin();it0!=_fams.end();it0++)
-    if(entryCpp==(*it0).getKeyOfEntry())
-      return *it0;
-  std::ostringstream oss; oss << "vtkExtractGroupInternal::getEntry : no such entry \"" << entry << "\"!";
-  throw INTERP_KERNEL::Exception(oss.str().c_str());
+  std::unordered_map<std::string,int>::const_iterator it(_pos_of_keys.find(entry));
+  if(it==_pos_of_keys.end())
+    {
+      std::ostringstream oss; oss << "vtkExtractGroupInternal::getEntry : no such entry \"" << entry << "\"!";
+      throw INTERP_KERNEL::Exception(oss.str().c_str());
+    }
+  int sz0((int)_groups.size());
+  if((*it).second<sz0)
+    return _groups[(*it).second];
+  return _fams[(*it).second-sz0];
 }
 
 ExtractGroupStatus& ExtractGroupInternal::getEntry(const char *entry)
 {
-  std::string entryCpp(entry);
-  for(std::vector<ExtractGroupGrp>::iterator it0=_groups.begin();it0!=_groups.end();it0++)
-    if(entryCpp==(*it0).getKeyOfEntry())
-      return *it0;
-  for(std::vector<ExtractGroupFam>::iterator it0=_fams.begin();it0!=_fams.end();it0++)
-    if(entryCpp==(*it0).getKeyOfEntry())
-      return *it0;
-  std::ostringstream oss; oss << "vtkExtractGroupInternal::getEntry : no such entry \"" << entry << "\"!";
-  throw INTERP_KERNEL::Exception(oss.str().c_str());
+  const ExtractGroupInternal *constThis(this);
+  return const_cast<ExtractGroupStatus&>(constThis->getEntry(entry));
+}
+
+/*!
+ * Fills the indexes giving in constant time an entry from its key and a family id from its name. As with a linear search, the first one wins.
+ */
+void ExtractGroupInternal::buildIndexOfEntries()
+{
+  _pos_of_keys.clear();
+  _id_of_fams.clear();
+  int pos(0);
+  for(std::vector<ExtractGroupGrp>::const_iterator it=_groups.begin();it!=_groups.end();it++,pos++)
+    _pos_of_keys.emplace((*it).getKeyOfEntry(),pos);
+  for(std::vector<ExtractGroupFam>::const_iterator it=_fams.begin();it!=_fams.end();it++,pos++)
+    {
+      _pos_of_keys.emplace((*it).getKeyOfEntry(),pos);
+      _id_of_fams.emplace((*it).getName(),(*it).getId());
+    }
 }
 
 void ExtractGroupInternal::printMySelf(std::ostream& os) const
@@ -270,11 +247,9 @@ void ExtractGroupInternal::printMySelf(std::ostream& os) const
 
 int ExtractGroupInternal::getIdOfFamily(const std::string& famName) const
 {
-  for(std::vector<ExtractGroupFam>::const_iterator it=_fams.begin();it!=_fams.end();it++)
-    {
-      if((*it).getName()==famName)
-        return (*it).getId();
-    }
+  std::unordered_map<std::string,int>::const_iterator it(_id_of_fams.find(famName));
+  if(it!=_id_of_fams.end())
+    return (*it).second;
   return std::numeric_limits<int>::max();
 }
 
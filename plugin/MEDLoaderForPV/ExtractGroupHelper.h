@@ -24,6 +24,8 @@
 #include <vector>
 #include <set>
 #include <map>
+#include <memory>
+#include <unordered_map>
 
 #include "MEDLoaderForPV.h"
 
@@ -75,6 +77,7 @@ private:
 class vtkInformationDataObjectMetaDataKey;
 class vtkMutableDirectedGraph;
 class vtkInformation;
+class MEDHierarchy;
 
 class MEDLOADERFORPV_EXPORT ExtractGroupInternal
 {
@@ -93,11 +96,18 @@ public:
   static bool IndependantIsInformationOK(vtkInformationDataObjectMetaDataKey *medReaderMetaData, vtkInformation *info);
 private:
   std::map<std::string,int> computeFamStrIdMap() const;
+  void buildIndexOfEntries();
   const ExtractGroupStatus& getEntry(const char *entry) const;
   ExtractGroupStatus& getEntry(const char *entry);
 private:
+  //! hierarchy from which _groups and _fams have been loaded.
+  std::shared_ptr<const MEDHierarchy> _hierarchy;
   std::vector<ExtractGroupGrp> _groups;
   std::vector<ExtractGroupFam> _fams;
+  //! position of each entry (groups then families) regarding its key. Filled by loadFrom.
+  std::unordered_map<std::string,int> _pos_of_keys;
+  //! id of each family regarding its name. Filled by loadFrom.
+  std::unordered_map<std::string,int> _id_of_fams;
   mutable std::vector< std::pair<std::string,bool> > _selection;
   std::string _mesh_name;
 };
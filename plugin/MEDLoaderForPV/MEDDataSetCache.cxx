@@ -0,0 +1,105 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#include "MEDDataSetCache.hxx"
+
+#include "vtkDataSet.h"
+
+MEDDataSetCache::MEDDataSetCache():_max_size_in_mb(0),_size_in_kib(0),_nb_of_hits(0),_nb_of_misses(0),_nb_of_evictions(0)
+{
+}
+
+void MEDDataSetCache::setMaxSizeInMB(int maxSizeInMB)
+{
+  _max_size_in_mb=maxSizeInMB>0?maxSizeInMB:0;
+  evictUntil(((unsigned long)_max_size_in_mb)*1024);
+}
+
+/*!
+ * Returns a new instance (to be deallocated by the caller) sharing its arrays with the cached dataset having key \a key.
+ * If there is no such entry 0 is returned. In case of hit \a internalInfo (if not null) is filled with the info stored with the entry.
+ */
+vtkDataSet *MEDDataSetCache::retrieve(const std::string& key, ExportedTinyInfo *internalInfo)
+{
+  if(!isEnabled())
+    return 0;
+  std::map<std::string,Entry>::iterator it(_entries.find(key));
+  if(it==_entries.end())
+    {
+      _nb_of_misses++;
+      return 0;
+    }
+  _nb_of_hits++;
+  _lru.splice(_lru.begin(),_lru,(*it).second._pos_in_lru);
+  if(internalInfo)
+    *internalInfo=(*it).second._info;
+  vtkDataSet *ret((*it).second._ds->NewInstance());
+  ret->ShallowCopy((*it).second._ds);
+  return ret;
+}
+
+/*!
+ * Stores a shallow copy of \a ds with key \a key. Least recently used entries are evicted to respect the budget.
+ * Datasets larger than the budget are not stored.
+ */
+void MEDDataSetCache::store(const std::string& key, vtkDataSet *ds, const ExportedTinyInfo *internalInfo)
+{
+  if(!isEnabled() || !ds)
+    return ;
+  unsigned long maxSize(((unsigned long)_max_size_in_mb)*1024),sz(ds->GetActualMemorySize());
+  if(sz>maxSize)
+    return ;
+  std::map<std::string,Entry>::iterator it(_entries.find(key));
+  if(it!=_entries.end())
+    {
+      _size_in_kib-=(*it).second._size_in_kib;
+      _lru.erase((*it).second._pos_in_lru);
+      _entries.erase(it);
+    }
+  evictUntil(maxSize-sz);
+  Entry& entry(_entries[key]);
+  entry._ds.TakeReference(ds->NewInstance());
+  entry._ds->ShallowCopy(ds);
+  if(internalInfo)
+    entry._info=*internalInfo;
+  entry._size_in_kib=sz;
+  _lru.push_front(key);
+  entry._pos_in_lru=_lru.begin();
+  _size_in_kib+=sz;
+}
+
+void MEDDataSetCache::clear()
+{
+  _lru.clear();
+  _entries.clear();
+  _size_in_kib=0;
+}
+
+void MEDDataSetCache::evictUntil(unsigned long sizeInKiB)
+{
+  while(_size_in_kib>sizeInKiB && !_lru.empty())
+    {
+      std::map<std::string,Entry>::iterator it(_entries.find(_lru.back()));
+      _size_in_kib-=(*it).second._size_in_kib;
+      _entries.erase(it);
+      _lru.pop_back();
+      _nb_of_evictions++;
+    }
+}
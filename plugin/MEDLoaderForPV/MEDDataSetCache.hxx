@@ -0,0 +1,77 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#ifndef __MEDDATASETCACHE_HXX__
+#define __MEDDATASETCACHE_HXX__
+
+#include "MEDLoaderForPV.h"
+#include "MEDUtilities.hxx"
+
+#include "vtkSmartPointer.h"
+
+#include <list>
+#include <map>
+#include <string>
+
+class vtkDataSet;
+
+/*!
+ * Bounded LRU cache of the datasets built by MEDFileFieldRepresentationTree::buildVTKInstance.
+ * Entries are identified by a key (see MEDFileFieldRepresentationTree::getKeyOfVTKInstance) and are stored as shallow copies.
+ * The total size of the entries (computed with vtkDataSet::GetActualMemorySize) never exceeds the budget given in MB.
+ * A budget equal to 0 disables the cache.
+ */
+class MEDLOADERFORPV_EXPORT MEDDataSetCache
+{
+public:
+  MEDDataSetCache();
+  void setMaxSizeInMB(int maxSizeInMB);
+  int getMaxSizeInMB() const { return _max_size_in_mb; }
+  bool isEnabled() const { return _max_size_in_mb>0; }
+  vtkDataSet *retrieve(const std::string& key, ExportedTinyInfo *internalInfo);
+  void store(const std::string& key, vtkDataSet *ds, const ExportedTinyInfo *internalInfo);
+  void clear();
+  int getNumberOfEntries() const { return (int)_entries.size(); }
+  unsigned long getSizeInKiB() const { return _size_in_kib; }
+  int getNumberOfHits() const { return _nb_of_hits; }
+  int getNumberOfMisses() const { return _nb_of_misses; }
+  int getNumberOfEvictions() const { return _nb_of_evictions; }
+private:
+  void evictUntil(unsigned long sizeInKiB);
+private:
+  class Entry
+  {
+  public:
+    vtkSmartPointer<vtkDataSet> _ds;
+    ExportedTinyInfo _info;
+    unsigned long _size_in_kib;
+    std::list<std::string>::iterator _pos_in_lru;
+  };
+  int _max_size_in_mb;
+  unsigned long _size_in_kib;
+  //! most recently used key is at the front.
+  std::list<std::string> _lru;
+  std::map<std::string,Entry> _entries;
+  int _nb_of_hits;
+  int _nb_of_misses;
+  int _nb_of_evictions;
+};
+
+#endif
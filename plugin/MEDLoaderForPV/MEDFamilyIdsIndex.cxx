@@ -0,0 +1,141 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#include "MEDFamilyIdsIndex.hxx"
+
+#include "vtkDataArray.h"
+#include "vtkSMPTools.h"
+
+#include <algorithm>
+
+/*!
+ * \a famIds is expected to be the array of family ids (of type mcIdType) built by the reader. Nothing is done if the index
+ * has already been built from \a famIds and if it has not been modified since.
+ */
+void MEDFamilyIdsIndex::update(vtkDataArray *famIds)
+{
+  if(_fam_ids==famIds && _mtime==famIds->GetMTime())
+    return ;
+  _fam_ids=famIds; _mtime=famIds->GetMTime();
+  _ranges.clear();
+  vtkIdType nbOfTuples(famIds->GetNumberOfTuples());
+  const mcIdType *pt(reinterpret_cast<const mcIdType *>(famIds->GetVoidPointer(0)));
+  // tuples sharing a family id are often contiguous : the map is accessed once per run
+  for(vtkIdType i=0;i<nbOfTuples;)
+    {
+      vtkIdType j(i+1);
+      while(j<nbOfTuples && pt[j]==pt[i])
+        j++;
+      _ranges[pt[i]].second+=j-i;
+      i=j;
+    }
+  vtkIdType pos(0);
+  for(std::map<mcIdType, std::pair<vtkIdType,vtkIdType> >::iterator it=_ranges.begin();it!=_ranges.end();it++)
+    {
+      vtkIdType sz((*it).second.second);
+      (*it).second.first=pos; (*it).second.second=pos;
+      pos+=sz;
+    }
+  _ids.resize(nbOfTuples);
+  for(vtkIdType i=0;i<nbOfTuples;)
+    {
+      vtkIdType j(i+1);
+      while(j<nbOfTuples && pt[j]==pt[i])
+        j++;
+      vtkIdType& end(_ranges[pt[i]].second);
+      for(vtkIdType k=i;k<j;k++)
+        _ids[end++]=k;
+      i=j;
+    }
+}
+
+/*!
+ * Returns the number of tuples lying on one of the families \a famIds. A family appearing several times in \a famIds is counted once.
+ */
+vtkIdType MEDFamilyIdsIndex::getNumberOfTuplesOn(const std::vector<int>& famIds) const
+{
+  vtkIdType ret(0);
+  std::set<int> fams(famIds.begin(),famIds.end());
+  for(std::set<int>::const_iterator it=fams.begin();it!=fams.end();it++)
+    {
+      std::map<mcIdType, std::pair<vtkIdType,vtkIdType> >::const_iterator it2(_ranges.find(*it));
+      if(it2!=_ranges.end())
+        ret+=(*it2).second.second-(*it2).second.first;
+    }
+  return ret;
+}
+
+/*!
+ * Fills \a ids (of size getNumberOfTuplesOn(famIds)) with the sorted ids of the tuples lying on one of the families \a famIds.
+ */
+void MEDFamilyIdsIndex::fillTuplesOn(const std::vector<int>& famIds, vtkIdType *ids) const
+{
+  vtkIdType *pt(ids);
+  std::size_t nbOfRuns(0);
+  std::set<int> fams(famIds.begin(),famIds.end());
+  for(std::set<int>::const_iterator it=fams.begin();it!=fams.end();it++)
+    {
+      std::map<mcIdType, std::pair<vtkIdType,vtkIdType> >::const_iterator it2(_ranges.find(*it));
+      if(it2==_ranges.end())
+        continue;
+      vtkIdType *next(std::copy(_ids.data()+(*it2).second.first,_ids.data()+(*it2).second.second,pt));
+      if(nbOfRuns++>0)
+        std::inplace_merge(ids,pt,next);
+      pt=next;
+    }
+}
+
+/*!
+ * Fills \a selection with 1 for the tuples lying on a family of \a idsToKeep and 0 for the others.
+ * \a catchAll is set to true if each family of \a idsToKeep has at least one tuple, \a catchSmth if at least one has.
+ */
+void MEDFamilyIdsIndex::select(const std::set<int>& idsToKeep, std::vector<char>& selection, bool& catchAll, bool& catchSmth) const
+{
+  selection.assign(_ids.size(),0);
+  catchAll=true; catchSmth=false;
+  std::vector< std::pair<vtkIdType,vtkIdType> > ranges;
+  std::vector<vtkIdType> starts(1,0);
+  for(std::set<int>::const_iterator it=idsToKeep.begin();it!=idsToKeep.end();it++)
+    {
+      std::map<mcIdType, std::pair<vtkIdType,vtkIdType> >::const_iterator it2(_ranges.find(*it));
+      if(it2==_ranges.end())
+        {
+          catchAll=false;
+          continue;
+        }
+      catchSmth=true;
+      ranges.push_back((*it2).second);
+      starts.push_back(starts.back()+(*it2).second.second-(*it2).second.first);
+    }
+  // the selected ids are split evenly between threads whatever the size of the families
+  const vtkIdType *ids(_ids.data());
+  char *sel(selection.data());
+  vtkSMPTools::For(0,starts.back(),[ids,sel,&ranges,&starts](vtkIdType begin, vtkIdType end)
+    {
+      std::size_t k(std::upper_bound(starts.begin(),starts.end(),begin)-starts.begin()-1);
+      for(vtkIdType i=begin;i<end;k++)
+        {
+          vtkIdType stop(std::min(end,starts[k+1]));
+          const vtkIdType *src(ids+ranges[k].first+(i-starts[k]));
+          for(;i<stop;i++)
+            sel[*src++]=1;
+        }
+    });
+}
@@ -0,0 +1,58 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#ifndef __MEDFAMILYIDSINDEX_HXX__
+#define __MEDFAMILYIDSINDEX_HXX__
+
+#include "MEDLoaderForPV.h"
+#include "MCIdType.hxx"
+
+#include "vtkSmartPointer.h"
+#include "vtkType.h"
+
+#include <map>
+#include <set>
+#include <utility>
+#include <vector>
+
+class vtkDataArray;
+
+/*!
+ * Inverted index of an array of family ids : for each family id, the sorted ids of the tuples lying on it.
+ * It is built in two passes over the array and kept as long as the array is the same and is not modified (see update).
+ */
+class MEDLOADERFORPV_EXPORT MEDFamilyIdsIndex
+{
+public:
+  MEDFamilyIdsIndex():_mtime(0) { }
+  void update(vtkDataArray *famIds);
+  vtkIdType getNumberOfTuples() const { return (vtkIdType)_ids.size(); }
+  vtkIdType getNumberOfTuplesOn(const std::vector<int>& famIds) const;
+  void fillTuplesOn(const std::vector<int>& famIds, vtkIdType *ids) const;
+  void select(const std::set<int>& idsToKeep, std::vector<char>& selection, bool& catchAll, bool& catchSmth) const;
+private:
+  vtkSmartPointer<vtkDataArray> _fam_ids;
+  vtkMTimeType _mtime;
+  //! for each family id, the range in _ids of the tuples lying on it.
+  std::map<mcIdType, std::pair<vtkIdType,vtkIdType> > _ranges;
+  std::vector<vtkIdType> _ids;
+};
+
+#endif
@@ -20,6 +20,10 @@
 
 #include "MEDTimeReq.hxx"
 #include "MEDUtilities.hxx"
+#include "MEDTimeStepsPrefetcher.hxx"
+#include "MEDFileStructureIndex.hxx"
+#include "MEDFileMeshesPartitioner.hxx"
+#include "ExtractGroupHelper.h"
 
 #include "MEDFileFieldRepresentationTree.hxx"
 #include "MEDCouplingFieldDiscretization.hxx"
@@ -56,9 +60,19 @@
 #include "vtkPointData.h"
 #include "vtkFieldData.h"
 #include "vtkCellData.h"
+#include "vtkPoints.h"
+#include "vtkPointSet.h"
+#include "vtkSMPTools.h"
 
 #include "vtkMutableDirectedGraph.h"
 
+#include <algorithm>
+#include <cstring>
+#include <iterator>
+#include <numeric>
+#include <future>
+#include <typeinfo>
+
 using namespace MEDCoupling;
 
 const char MEDFileFieldRepresentationLeavesArrays::ZE_SEP[]="@@][@@";
@@ -208,6 +222,145 @@ ELGACmp::~ELGACmp()
 
 //=
 
+std::string MEDFloatingPointPrecision::getKey() const
+{
+  std::ostringstream oss; oss << (_single?"F":"D");
+  if(_single)
+    for(std::set<std::string>::const_iterator it=_double_arrays.begin();it!=_double_arrays.end();it++)
+      oss << "," << *it;
+  return oss.str();
+}
+
+/*!
+ * Returns a new single precision copy of \a arr (name, component names and information included).
+ * The conversion is done concurrently with vtkSMPTools.
+ */
+vtkFloatArray *ToSinglePrecision(vtkDoubleArray *arr)
+{
+  vtkFloatArray *ret(vtkFloatArray::New());
+  int nbOfCompo(arr->GetNumberOfComponents());
+  ret->SetNumberOfComponents(nbOfCompo);
+  ret->SetNumberOfTuples(arr->GetNumberOfTuples());
+  ret->SetName(arr->GetName());
+  for(int i=0;i<nbOfCompo;i++)
+    if(arr->GetComponentName(i))
+      ret->SetComponentName(i,arr->GetComponentName(i));
+  ret->CopyInformation(arr->GetInformation());
+  const double *src(arr->GetPointer(0));
+  float *dst(ret->GetPointer(0));
+  vtkSMPTools::For(0,arr->GetNumberOfValues(),[src,dst](vtkIdType begin, vtkIdType end)
+    {
+      for(vtkIdType i=begin;i<end;i++)
+        dst[i]=(float)src[i];
+    });
+  return ret;
+}
+
+/*!
+ * Replaces the double precision array named \a name in \a att by its single precision copy.
+ */
+void ReplaceBySinglePrecision(vtkFieldData *att, const std::string& name)
+{
+  vtkDoubleArray *arr(vtkDoubleArray::SafeDownCast(att->GetAbstractArray(name.c_str())));
+  if(!arr)
+    return ;
+  vtkFloatArray *arr2(ToSinglePrecision(arr));
+  att->AddArray(arr2);//replaces arr having the same name
+  arr2->Delete();
+}
+
+/*!
+ * Converts in single precision the coordinates of \a ds (points or axes of rectilinear grid).
+ */
+void ConvertCoordinatesToSinglePrecision(vtkDataSet *ds)
+{
+  vtkPointSet *ps(vtkPointSet::SafeDownCast(ds));
+  if(ps && ps->GetPoints())
+    {
+      vtkDoubleArray *coords(vtkDoubleArray::SafeDownCast(ps->GetPoints()->GetData()));
+      if(coords)
+        {
+          vtkFloatArray *coords2(ToSinglePrecision(coords));
+          ps->GetPoints()->SetData(coords2);
+          coords2->Delete();
+        }
+      return ;
+    }
+  vtkRectilinearGrid *rg(vtkRectilinearGrid::SafeDownCast(ds));
+  if(!rg)
+    return ;
+  vtkDoubleArray *axes[3]={vtkDoubleArray::SafeDownCast(rg->GetXCoordinates()),vtkDoubleArray::SafeDownCast(rg->GetYCoordinates()),vtkDoubleArray::SafeDownCast(rg->GetZCoordinates())};
+  vtkFloatArray *axes2[3]={0,0,0};
+  for(int i=0;i<3;i++)
+    if(axes[i])
+      axes2[i]=ToSinglePrecision(axes[i]);
+  if(axes2[0]) { rg->SetXCoordinates(axes2[0]); axes2[0]->Delete(); }
+  if(axes2[1]) { rg->SetYCoordinates(axes2[1]); axes2[1]->Delete(); }
+  if(axes2[2]) { rg->SetZCoordinates(axes2[2]); axes2[2]->Delete(); }
+}
+
+void MEDTimeStepsIndex::assign(const std::vector<double>& ts)
+{
+  _ts=ts;
+  _sorted_ids.resize(ts.size());
+  for(std::size_t i=0;i<ts.size();i++)
+    _sorted_ids[i]=i;
+  std::stable_sort(_sorted_ids.begin(),_sorted_ids.end(),[this](std::size_t a, std::size_t b) { return _ts[a]<_ts[b]; });
+}
+
+/*!
+ * Returns the position of the time step to be used when \a timeReq is requested : the first one equal to \a timeReq at 1e-14.
+ * If \a timeReq does not fit any time step the highest time step lower than \a timeReq is taken (a warning is printed if \a verbose).
+ * If there is no such time step the lowest one is taken.
+ */
+std::size_t MEDTimeStepsIndex::locate(double timeReq, bool verbose) const
+{
+  const double EPS=1e-14;
+  std::size_t sz(_ts.size());
+  if(sz<=1)
+    return 0;
+  auto lowerThan([this](std::size_t id, double val) { return _ts[id]<val; });
+  std::size_t ret(sz);
+  for(std::vector<std::size_t>::const_iterator it=std::lower_bound(_sorted_ids.begin(),_sorted_ids.end(),timeReq-EPS,lowerThan);it!=_sorted_ids.end() && _ts[*it]<=timeReq+EPS;it++)
+    if(fabs(_ts[*it]-timeReq)<EPS)
+      ret=std::min(ret,*it);
+  if(ret!=sz)
+    return ret;
+  //OK the time requested does not fit time series given to ParaView. It is typically the case if more than one MEDReader instance are created or TimeInspector in real time mode.
+  //In this case the default behaviour is taken. Keep the highest time step in this lower than timeReq.
+  std::vector<std::size_t>::const_iterator it(std::lower_bound(_sorted_ids.begin(),_sorted_ids.end(),timeReq,lowerThan));
+  if(it!=_sorted_ids.begin())
+    {
+      it--;
+      while(it!=_sorted_ids.begin() && _ts[*(it-1)]==_ts[*it])
+        it--;
+    }
+  // else timeReq is lower than all time steps. So let's keep the lowest time step greater than timeReq.
+  ret=*it;
+  if(verbose)
+    {
+      std::ostringstream oss; oss.precision(15); oss << "request for time " << timeReq << " but not in ";
+      std::copy(_ts.begin(),_ts.end(),std::ostream_iterator<double>(oss,","));
+      oss << " ! Keep time " << _ts[ret] << " at pos #" << ret;
+      std::cerr << oss.str() << std::endl;
+    }
+  return ret;
+}
+
+/*!
+ * Returns the position of the first time step exactly equal to \a timeReq. If none, the number of time steps is returned.
+ */
+std::size_t MEDTimeStepsIndex::find(double timeReq) const
+{
+  auto lowerThan([this](std::size_t id, double val) { return _ts[id]<val; });
+  std::vector<std::size_t>::const_iterator it(std::lower_bound(_sorted_ids.begin(),_sorted_ids.end(),timeReq,lowerThan));
+  if(it!=_sorted_ids.end() && _ts[*it]==timeReq)
+    return *it;
+  return _ts.size();
+}
+
+//=
+
 template<class T>
 class MEDFileVTKTraits
 {
@@ -364,22 +517,64 @@ void AssignToFieldData(MEDCoupling::DataArray *vPtr, const MEDTimeReq *tr, vtkFi
     }
 }
 
+/*!
+ * Returns a new VTK array (to be deallocated by the caller) gathering the time steps \a arrs (skipped ones excepted).
+ * Components of time step #i are stored after the ones of time step #i-1. They are named with \a tr to know the mode they come from.
+ */
+template<class T>
+vtkDataArray *AssignPackedToFieldData(const MEDTimeReq *tr, const std::vector<MEDFileFieldRepresentationLeavesArraysTS>& arrs)
+{
+  typedef typename MEDFileVTKTraits<T>::MCType MCType;
+  std::vector<const MCType *> steps;
+  std::vector<std::string> compoNames;
+  tr->initIterator();
+  for(int timeStepId=0;timeStepId<tr->size();timeStepId++,++(*tr))
+    {
+      if(arrs[timeStepId]._f1ts.isNull())
+        continue;
+      const MEDCoupling::DataArray *arr(arrs[timeStepId]._arr);
+      const MCType *vi(static_cast<const MCType *>(arr));
+      steps.push_back(vi);
+      for(std::size_t i=0;i<vi->getNumberOfComponents();i++)
+        compoNames.push_back(tr->buildName(vi->getVarOnComponent(i)));
+    }
+  std::size_t nbOfCompo(steps[0]->getNumberOfComponents()),nbOfSteps(steps.size());
+  vtkIdType nbOfTuples(steps[0]->getNumberOfTuples());
+  typename MEDFileVTKTraits<T>::VtkType *vtkd(MEDFileVTKTraits<T>::VtkType::New());
+  vtkd->SetNumberOfComponents((int)(nbOfCompo*nbOfSteps));
+  vtkd->SetNumberOfTuples(nbOfTuples);
+  for(std::size_t i=0;i<compoNames.size();i++)
+    vtkd->SetComponentName((vtkIdType)i,compoNames[i].c_str());
+  T *pt(vtkd->GetPointer(0));
+  for(std::size_t j=0;j<nbOfSteps;j++)
+    {
+      const T *src(steps[j]->begin());
+      for(vtkIdType t=0;t<nbOfTuples;t++)
+        std::copy(src+t*nbOfCompo,src+(t+1)*nbOfCompo,pt+t*nbOfCompo*nbOfSteps+j*nbOfCompo);
+    }
+  return vtkd;
+}
+
 //=
 
-MEDFileFieldRepresentationLeavesArrays::MEDFileFieldRepresentationLeavesArrays():_id(-1)
+MEDFileFieldRepresentationLeavesArrays::MEDFileFieldRepresentationLeavesArrays():_id(-1),_mesh_info(false),_reusable_on_cells(false)
 {
 }
 
-MEDFileFieldRepresentationLeavesArrays::MEDFileFieldRepresentationLeavesArrays(const MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS>& arr):MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS>(arr),_activated(false),_id(-1)
+MEDFileFieldRepresentationLeavesArrays::MEDFileFieldRepresentationLeavesArrays(const MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS>& arr):MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS>(arr),_activated(false),_id(-1),_reusable_on_cells(false)
+{
+  _ze_name=BuildZeName(arr);
+  _field_name=arr->getName();
+  _mesh_name=arr->getMeshName();
+  _mesh_info=MEDFileFieldRepresentationTree::IsFieldMeshRegardingInfo(arr->getInfo());
+}
+
+/*!
+ * Builds an array not bound to its field yet (see bind). Only its names are known.
+ */
+MEDFileFieldRepresentationLeavesArrays::MEDFileFieldRepresentationLeavesArrays(const MEDFileStructureIndexArray& desc, const std::string& meshName):_activated(false),_id(-1),_ze_name(desc._ze_name),
+                                                                                                                                                     _field_name(desc._field_name),_mesh_name(meshName),_mesh_info(desc._mesh_info),_reusable_on_cells(false)
 {
-  std::vector< std::vector<MEDCoupling::TypeOfField> > typs((operator->())->getTypesOfFieldAvailable());
-  if(typs.size()<1)
-    throw INTERP_KERNEL::Exception("There is a big internal problem in MEDLoader ! The field time spitting has failed ! A CRASH will occur soon !");
-  if(typs[0].size()!=1)
-    throw INTERP_KERNEL::Exception("There is a big internal problem in MEDLoader ! The field spitting by spatial discretization has failed ! A CRASH will occur soon !");
-  MEDCoupling::MCAuto<MEDCoupling::MEDCouplingFieldDiscretization> fd(MEDCouplingFieldDiscretization::New(typs[0][0]));
-  std::ostringstream oss2; oss2 << (operator->())->getName() << ZE_SEP << fd->getRepr();
-  _ze_name=oss2.str();
 }
 
 MEDFileFieldRepresentationLeavesArrays& MEDFileFieldRepresentationLeavesArrays::operator=(const MEDFileFieldRepresentationLeavesArrays& other)
@@ -389,9 +584,51 @@ MEDFileFieldRepresentationLeavesArrays& MEDFileFieldRepresentationLeavesArrays::
   _activated=false;
   _ze_name=other._ze_name;
   _ze_full_name.clear();
+  _field_name=other._field_name;
+  _mesh_name=other._mesh_name;
+  _mesh_info=other._mesh_info;
+  _reusable_arr=0;
+  _reusable_key.clear();
+  _selected_components=other._selected_components;
   return *this;
 }
 
+/*!
+ * Binds \a this, built from a MEDFileStructureIndexArray, to its field \a arr. Id, status and selected components are kept.
+ * Throws if \a arr is not the field described by the index, which means that the index is outdated.
+ */
+void MEDFileFieldRepresentationLeavesArrays::bind(const MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS>& arr, int nbOfTS)
+{
+  if(BuildZeName(arr)!=_ze_name || arr->getNumberOfTS()!=nbOfTS)
+    {
+      std::ostringstream oss; oss << "MEDFileFieldRepresentationLeavesArrays::bind : the field \"" << arr->getName() << "\" of the MED file differs from the one of the index \"" << _ze_name << "\" !";
+      throw INTERP_KERNEL::Exception(oss.str().c_str());
+    }
+  MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS>::operator=(arr);
+}
+
+/*!
+ * Fills the names of \a desc. The field of the MED file \a desc comes from is given by the caller.
+ */
+void MEDFileFieldRepresentationLeavesArrays::fillIndexArray(MEDFileStructureIndexArray& desc) const
+{
+  desc._field_name=_field_name;
+  desc._ze_name=_ze_name;
+  desc._mesh_info=_mesh_info;
+}
+
+std::string MEDFileFieldRepresentationLeavesArrays::BuildZeName(const MEDCoupling::MEDFileAnyTypeFieldMultiTS *arr)
+{
+  std::vector< std::vector<MEDCoupling::TypeOfField> > typs(arr->getTypesOfFieldAvailable());
+  if(typs.size()<1)
+    throw INTERP_KERNEL::Exception("There is a big internal problem in MEDLoader ! The field time spitting has failed ! A CRASH will occur soon !");
+  if(typs[0].size()!=1)
+    throw INTERP_KERNEL::Exception("There is a big internal problem in MEDLoader ! The field spitting by spatial discretization has failed ! A CRASH will occur soon !");
+  MEDCoupling::MCAuto<MEDCoupling::MEDCouplingFieldDiscretization> fd(MEDCouplingFieldDiscretization::New(typs[0][0]));
+  std::ostringstream oss2; oss2 << arr->getName() << ZE_SEP << fd->getRepr();
+  return oss2.str();
+}
+
 void MEDFileFieldRepresentationLeavesArrays::setId(int& id) const
 {
   _id=id++;
@@ -417,7 +654,7 @@ void MEDFileFieldRepresentationLeavesArrays::feedSIL(vtkMutableDirectedGraph* si
   vtkIdType refId(sil->AddChild(root,edge));
   names.push_back(_ze_name);
   //
-  if(MEDFileFieldRepresentationTree::IsFieldMeshRegardingInfo(((operator->())->getInfo())))
+  if(_mesh_info)
     {
       sil->AddChild(refId,edge);
       names.push_back(std::string());
@@ -439,23 +676,153 @@ bool MEDFileFieldRepresentationLeavesArrays::setStatus(bool status) const
 {
   bool ret(_activated!=status);
   _activated=status;
+  if(!status)
+    {// no need to keep the values of an array no more displayed
+      _reusable_arr=0;
+      _reusable_key.clear();
+    }
   return ret;
 }
 
-void MEDFileFieldRepresentationLeavesArrays::appendFields(const MEDTimeReq *tr, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshStruct *mst, vtkDataSet *ds, ExportedTinyInfo *internalInfo) const
+/*!
+ * Restricts the components of \a this given to VTK to \a compos (names or positions of components). Empty means all the components.
+ */
+void MEDFileFieldRepresentationLeavesArrays::setSelectedComponents(const std::vector<std::string>& compos) const
 {
-  //const int VTK_DATA_ARRAY_DELETE=vtkDataArrayTemplate<double>::VTK_DATA_ARRAY_DELETE; // todo: unused
+  if(compos==_selected_components)
+    return ;
+  _selected_components=compos;
+  _reusable_arr=0;
+  _reusable_key.clear();
+}
+
+/*!
+ * Returns the positions in \a arr of the selected components. A selected component is looked for by its name
+ * (with or without unit), then by its position.
+ */
+std::vector<std::size_t> MEDFileFieldRepresentationLeavesArrays::getIdsOfSelectedComponents(const MEDCoupling::DataArray *arr) const
+{
+  std::vector<std::size_t> ret;
+  std::size_t nbOfCompo(arr->getNumberOfComponents());
+  for(std::vector<std::string>::const_iterator it=_selected_components.begin();it!=_selected_components.end();it++)
+    {
+      std::size_t pos(0);
+      for(;pos<nbOfCompo;pos++)
+        if(arr->getInfoOnComponent(pos)==*it || arr->getVarOnComponent(pos)==*it)
+          break;
+      if(pos==nbOfCompo)
+        {
+          std::istringstream iss(*it);
+          if(!(iss >> pos) || !iss.eof() || pos>=nbOfCompo)
+            {
+              std::ostringstream oss; oss << "MEDFileFieldRepresentationLeavesArrays::getIdsOfSelectedComponents : no component \"" << *it << "\" in field \"" << (operator->())->getName() << "\" !";
+              throw INTERP_KERNEL::Exception(oss.str().c_str());
+            }
+        }
+      ret.push_back(pos);
+    }
+  return ret;
+}
+
+void MEDFileFieldRepresentationLeavesArrays::appendFields(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshStruct *mst, vtkDataSet *ds, ExportedTinyInfo *internalInfo) const
+{
+  std::vector<int> tsPos(getTimeStepsPositions(tr));
+  if(appendReusableArrayIfAny(tr,precision,tsPos,ds))
+    return ;
+  std::vector<MEDFileFieldRepresentationLeavesArraysTS> arrs(buildDataArrays(tsPos,globs,mml,mst));
+  assignDataArrays(tr,precision,globs,ds,internalInfo,arrs);
+  keepReusableArray(tr,precision,tsPos,ds);
+}
+
+/*!
+ * Returns a key identifying the array built for the time steps at positions \a tsPos requested by \a tr. \a arrName and \a onCells
+ * are set to the name of this array and to its location in the dataset.
+ * An empty key is returned if the array can't be reused as is : several time steps requested or fields on Gauss points.
+ */
+std::string MEDFileFieldRepresentationLeavesArrays::buildKeyOfReusableArray(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const std::vector<int>& tsPos, std::string& arrName, bool& onCells) const
+{
+  if(tsPos.size()!=1)
+    return std::string();
+  std::vector< std::vector<TypeOfField> > typs((operator->())->getTypesOfFieldAvailable());
+  if(typs.empty() || typs[0].size()!=1 || (typs[0][0]!=ON_CELLS && typs[0][0]!=ON_NODES))
+    return std::string();
+  onCells=typs[0][0]==ON_CELLS;
+  tr->initIterator();
+  arrName=tr->buildName((operator->())->getName());
+  std::ostringstream oss; oss << tsPos[0] << "/" << arrName << "/" << precision.isKeptInDoublePrecision((operator->())->getName());
+  return oss.str();
+}
+
+/*!
+ * Adds to \a ds the array kept by keepReusableArray if it is the one requested. This array is shared with the datasets previously returned.
+ * Returns false if nothing has been added.
+ */
+bool MEDFileFieldRepresentationLeavesArrays::appendReusableArrayIfAny(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const std::vector<int>& tsPos, vtkDataSet *ds) const
+{
+  if(!_reusable_arr)
+    return false;
+  std::string arrName;
+  bool onCells(false);
+  std::string key(buildKeyOfReusableArray(tr,precision,tsPos,arrName,onCells));
+  if(key.empty() || key!=_reusable_key)
+    return false;
+  vtkFieldData *att(onCells?static_cast<vtkFieldData *>(ds->GetCellData()):static_cast<vtkFieldData *>(ds->GetPointData()));
+  att->AddArray(_reusable_arr);
+  return true;
+}
+
+/*!
+ * Keeps the array just added to \a ds for the time steps at positions \a tsPos to reuse it as long as the same time step is requested.
+ */
+void MEDFileFieldRepresentationLeavesArrays::keepReusableArray(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const std::vector<int>& tsPos, vtkDataSet *ds) const
+{
+  std::string arrName;
+  bool onCells(false);
+  _reusable_arr=0;
+  _reusable_key=buildKeyOfReusableArray(tr,precision,tsPos,arrName,onCells);
+  if(_reusable_key.empty())
+    return ;
+  vtkFieldData *att(onCells?static_cast<vtkFieldData *>(ds->GetCellData()):static_cast<vtkFieldData *>(ds->GetPointData()));
+  _reusable_arr=att->GetArray(arrName.c_str());
+  if(!_reusable_arr)
+    _reusable_key.clear();
+}
+
+/*!
+ * Returns the positions of the time steps of \a this requested by \a tr. The iterator of \a tr is modified.
+ */
+std::vector<int> MEDFileFieldRepresentationLeavesArrays::getTimeStepsPositions(const MEDTimeReq *tr) const
+{
+  std::vector<int> ret;
   tr->setNumberOfTS((operator->())->getNumberOfTS());
   tr->initIterator();
   for(int timeStepId=0;timeStepId<tr->size();timeStepId++,++(*tr))
+    ret.push_back(tr->getCurrent());
+  return ret;
+}
+
+/*!
+ * Reads (if not already done) and converts to the VTK layout the time steps of \a this at positions \a tsPos.
+ * Only the read in the file (and the creation of the time steps, which refer to the globals shared by all the fields) is serialized
+ * by MEDUtilities::IOMutex. So this method can be called concurrently for different arrays provided that each thread gives its own
+ * copy of \a mml and \a mst (see BuildDataArrays). \a globs is only read.
+ */
+std::vector<MEDFileFieldRepresentationLeavesArraysTS> MEDFileFieldRepresentationLeavesArrays::buildDataArrays(const std::vector<int>& tsPos, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshStruct *mst) const
+{
+  std::vector<MEDFileFieldRepresentationLeavesArraysTS> ret(tsPos.size());
+  for(std::size_t i=0;i<tsPos.size();i++)
     {
-      MCAuto<MEDFileAnyTypeField1TS> f1ts((operator->())->getTimeStepAtPos(tr->getCurrent()));
+      MCAuto<MEDFileAnyTypeField1TS> f1ts;
+      {// the time step shares the globals of the whole file with the other fields, reference counters included
+        std::lock_guard<std::mutex> ioLock(MEDUtilities::IOMutex());
+        f1ts=(operator->())->getTimeStepAtPos(tsPos[i]);
+      }
       MEDFileAnyTypeField1TS *f1tsPtr(f1ts);
       MEDFileField1TS *f1tsPtrDbl(dynamic_cast<MEDFileField1TS *>(f1tsPtr));
       MEDFileInt32Field1TS *f1tsPtrInt(dynamic_cast<MEDFileInt32Field1TS *>(f1tsPtr));
       MEDFileInt64Field1TS *f1tsPtrInt64(dynamic_cast<MEDFileInt64Field1TS *>(f1tsPtr));
       MEDFileFloatField1TS *f1tsPtrFloat(dynamic_cast<MEDFileFloatField1TS *>(f1tsPtr));
-      MEDCoupling::DataArray *crudeArr(0),*postProcessedArr(0);
+      MEDCoupling::DataArray *crudeArr(0);
       if(f1tsPtrDbl)
         crudeArr=f1tsPtrDbl->getUndergroundDataArray();
       else if(f1tsPtrInt)
@@ -465,11 +832,52 @@ void MEDFileFieldRepresentationLeavesArrays::appendFields(const MEDTimeReq *tr,
       else if(f1tsPtrFloat)
         crudeArr=f1tsPtrFloat->getUndergroundDataArray();
       else
-        throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationLeavesArrays::appendFields : only FLOAT64, FLOAT32 and INT32 fields are dealt for the moment !");
+        throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationLeavesArrays::buildDataArrays : only FLOAT64, FLOAT32 and INT32 fields are dealt for the moment !");
+      ret[i]._loaded_here=!crudeArr->isAllocated();
+      {
+        std::lock_guard<std::mutex> ioLock(MEDUtilities::IOMutex());
+        f1ts->loadArraysIfNecessary();
+      }
       MEDFileField1TSStructItem fsst(MEDFileField1TSStructItem::BuildItemFrom(f1ts,mst));
-      f1ts->loadArraysIfNecessary();
-      MCAuto<MEDCoupling::DataArray> v(mml->buildDataArray(fsst,globs,crudeArr));
-      postProcessedArr=v;
+      ret[i]._arr=mml->buildDataArray(fsst,globs,crudeArr);
+      ret[i]._crude_arr=crudeArr;
+      ret[i]._f1ts=f1ts;
+      if(!_selected_components.empty())
+        {// only the selected components are given to VTK. The values of the other ones are not kept in memory.
+          ret[i]._arr=ret[i]._arr->keepSelectedComponents(getIdsOfSelectedComponents(ret[i]._arr));
+          ret[i]._crude_arr=0;
+          if(ret[i]._loaded_here)
+            f1ts->unloadArraysWithoutDataLoss();
+        }
+    }
+  return ret;
+}
+
+/*!
+ * Adds to \a ds the arrays \a arrs built by buildDataArrays with the positions returned by getTimeStepsPositions called with \a tr.
+ */
+void MEDFileFieldRepresentationLeavesArrays::assignDataArrays(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const MEDCoupling::MEDFileFieldGlobsReal *globs, vtkDataSet *ds, ExportedTinyInfo *internalInfo, const std::vector<MEDFileFieldRepresentationLeavesArraysTS>& arrs) const
+{
+  //const int VTK_DATA_ARRAY_DELETE=vtkDataArrayTemplate<double>::VTK_DATA_ARRAY_DELETE; // todo: unused
+  tr->setNumberOfTS((operator->())->getNumberOfTS());
+  tr->initIterator();
+  if((int)arrs.size()!=tr->size())
+    throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationLeavesArrays::assignDataArrays : internal error ! Mismatch of number of time steps !");
+  if(assignPackedDataArrays(tr,precision,ds,arrs))
+    return ;
+  tr->initIterator();
+  for(int timeStepId=0;timeStepId<tr->size();timeStepId++,++(*tr))
+    {
+      if(arrs[timeStepId]._f1ts.isNull())
+        continue;
+      MEDFileAnyTypeField1TS *f1ts(arrs[timeStepId]._f1ts.iAmATrollConstCast());
+      MEDFileField1TS *f1tsPtrDbl(dynamic_cast<MEDFileField1TS *>(f1ts));
+      MEDFileInt32Field1TS *f1tsPtrInt(dynamic_cast<MEDFileInt32Field1TS *>(f1ts));
+      MEDFileInt64Field1TS *f1tsPtrInt64(dynamic_cast<MEDFileInt64Field1TS *>(f1ts));
+      MEDFileFloatField1TS *f1tsPtrFloat(dynamic_cast<MEDFileFloatField1TS *>(f1ts));
+      MEDCoupling::DataArray *crudeArr(arrs[timeStepId]._crude_arr),*v(arrs[timeStepId]._arr.iAmATrollConstCast());
+      // In memory bounded mode values read here are given to VTK and forgotten by the MED structures.
+      bool release(tr->isMemoryBounded() && arrs[timeStepId]._loaded_here),noCpy(v==crudeArr && !release);
       //
       std::vector<TypeOfField> discs(f1ts->getTypesOfFieldAvailable());
       if(discs.size()!=1)
@@ -502,23 +910,83 @@ void MEDFileFieldRepresentationLeavesArrays::appendFields(const MEDTimeReq *tr,
         }
       if(f1tsPtrDbl)
         {
-          AssignToFieldData<double>(v,tr,att,f1ts->getName(),postProcessedArr==crudeArr,discs,_elga_cmp,globs,f1ts,ds,internalInfo);
+          AssignToFieldData<double>(v,tr,att,f1ts->getName(),noCpy,discs,_elga_cmp,globs,f1ts,ds,internalInfo);
+          if(!precision.isKeptInDoublePrecision(f1ts->getName()))
+            ReplaceBySinglePrecision(att,tr->buildName(f1ts->getName()));
         }
       else if(f1tsPtrInt)
         {
-          AssignToFieldData<int>(v,tr,att,f1ts->getName(),postProcessedArr==crudeArr,discs,_elga_cmp,globs,f1ts,ds,internalInfo);
+          AssignToFieldData<int>(v,tr,att,f1ts->getName(),noCpy,discs,_elga_cmp,globs,f1ts,ds,internalInfo);
         }
       else if(f1tsPtrFloat)
         {
-          AssignToFieldData<float>(v,tr,att,f1ts->getName(),postProcessedArr==crudeArr,discs,_elga_cmp,globs,f1ts,ds,internalInfo);
+          AssignToFieldData<float>(v,tr,att,f1ts->getName(),noCpy,discs,_elga_cmp,globs,f1ts,ds,internalInfo);
         }
       else if(f1tsPtrInt64)
         {
-          AssignToFieldData<Int64>(v,tr,att,f1ts->getName(),postProcessedArr==crudeArr,discs,_elga_cmp,globs,f1ts,ds,internalInfo);
+          AssignToFieldData<Int64>(v,tr,att,f1ts->getName(),noCpy,discs,_elga_cmp,globs,f1ts,ds,internalInfo);
         }
       else
         throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationLeavesArrays::appendFields : only FLOAT64 and INT32 fields are dealt for the moment ! Internal Error !");
+      if(release)
+        f1ts->unloadArrays();//VTK has now the ownership of the values
+    }
+}
+
+/*!
+ * If \a tr requests it, gathers the time steps \a arrs of cell or node fields into a single array having nbOfTS*nbOfCompo components.
+ * Returns false if \a arrs can't be packed (fields on Gauss points, different types or number of tuples). Nothing is done in this case.
+ */
+bool MEDFileFieldRepresentationLeavesArrays::assignPackedDataArrays(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, vtkDataSet *ds, const std::vector<MEDFileFieldRepresentationLeavesArraysTS>& arrs) const
+{
+  if(!tr->isPacked() || arrs.size()<2)
+    return false;
+  std::vector<const MEDFileFieldRepresentationLeavesArraysTS *> steps;
+  for(std::vector<MEDFileFieldRepresentationLeavesArraysTS>::const_iterator it=arrs.begin();it!=arrs.end();it++)
+    if((*it)._f1ts.isNotNull())
+      steps.push_back(&(*it));
+  if(steps.empty())
+    return false;
+  const MEDFileAnyTypeField1TS *f1ts(steps[0]->_f1ts);
+  std::vector<TypeOfField> discs(f1ts->getTypesOfFieldAvailable());
+  if(discs.size()!=1 || (discs[0]!=ON_CELLS && discs[0]!=ON_NODES))
+    return false;
+  const DataArray *ref(steps[0]->_arr);
+  for(std::vector<const MEDFileFieldRepresentationLeavesArraysTS *>::const_iterator it=steps.begin();it!=steps.end();it++)
+    {
+      const DataArray *arr((*it)->_arr);
+      if(arr->getNumberOfTuples()!=ref->getNumberOfTuples() || arr->getNumberOfComponents()!=ref->getNumberOfComponents() || typeid(*arr)!=typeid(*ref))
+        return false;
     }
+  vtkFieldData *att(discs[0]==ON_CELLS?static_cast<vtkFieldData *>(ds->GetCellData()):static_cast<vtkFieldData *>(ds->GetPointData()));
+  vtkDataArray *vtkd(0);
+  if(dynamic_cast<const DataArrayDouble *>(ref))
+    {
+      vtkd=AssignPackedToFieldData<double>(tr,arrs);
+      if(!precision.isKeptInDoublePrecision(f1ts->getName()))
+        {
+          vtkDataArray *vtkd2(ToSinglePrecision(vtkDoubleArray::SafeDownCast(vtkd)));
+          vtkd->Delete();
+          vtkd=vtkd2;
+        }
+    }
+  else if(dynamic_cast<const DataArrayInt32 *>(ref))
+    vtkd=AssignPackedToFieldData<int>(tr,arrs);
+  else if(dynamic_cast<const DataArrayFloat *>(ref))
+    vtkd=AssignPackedToFieldData<float>(tr,arrs);
+  else if(dynamic_cast<const DataArrayInt64 *>(ref))
+    vtkd=AssignPackedToFieldData<Int64>(tr,arrs);
+  else
+    return false;
+  vtkd->SetName(f1ts->getName().c_str());
+  att->AddArray(vtkd);
+  vtkd->Delete();
+  // values have been copied
+  if(tr->isMemoryBounded())
+    for(std::vector<const MEDFileFieldRepresentationLeavesArraysTS *>::const_iterator it=steps.begin();it!=steps.end();it++)
+      if((*it)->_loaded_here)
+        (*it)->_f1ts.iAmATrollConstCast()->unloadArrays();
+  return true;
 }
 
 void MEDFileFieldRepresentationLeavesArrays::appendELGAIfAny(vtkDataSet *ds) const
@@ -528,15 +996,31 @@ void MEDFileFieldRepresentationLeavesArrays::appendELGAIfAny(vtkDataSet *ds) con
 
 ////////////////////
 
-MEDFileFieldRepresentationLeaves::MEDFileFieldRepresentationLeaves():_cached_ds(0)
+MEDFileFieldRepresentationLeaves::MEDFileFieldRepresentationLeaves():_cached_ds(0),_cached_ds_single_precision(false),_ts_policy(-1)
 {
 }
 
 MEDFileFieldRepresentationLeaves::MEDFileFieldRepresentationLeaves(const std::vector< MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS> >& arr,
-                                                                   const MEDCoupling::MCAuto<MEDCoupling::MEDFileFastCellSupportComparator>& fsp):_arrays(arr.size()),_fsp(fsp),_cached_ds(0)
+                                                                   const MEDCoupling::MCAuto<MEDCoupling::MEDFileFastCellSupportComparator>& fsp):_arrays(arr.size()),_fsp(fsp),_cached_ds(0),_cached_ds_single_precision(false),_ts_policy(-1)
 {
   for(std::size_t i=0;i<arr.size();i++)
     _arrays[i]=MEDFileFieldRepresentationLeavesArrays(arr[i]);
+  if(!arr.empty())
+    {
+      _mesh_name=arr[0]->getMeshName();
+      _dt_unit=arr[0]->getDtUnit();
+      _dtits=arr[0]->getTimeSteps(_times);
+    }
+}
+
+/*!
+ * Builds a leaf whose arrays are not bound to their fields yet (see bind). Everything needed by the SIL and the time steps is read from \a desc.
+ */
+MEDFileFieldRepresentationLeaves::MEDFileFieldRepresentationLeaves(const MEDFileStructureIndexLeaf& desc):_mesh_name(desc._mesh_name),_dt_unit(desc._dt_unit),_dtits(desc._dtits),_times(desc._times),
+                                                                                                          _geo_types(desc._geo_types),_cached_ds(0),_cached_ds_single_precision(false),_ts_policy(-1)
+{
+  for(std::vector<MEDFileStructureIndexArray>::const_iterator it=desc._arrays.begin();it!=desc._arrays.end();it++)
+    _arrays.push_back(MEDFileFieldRepresentationLeavesArrays(*it,desc._mesh_name));
 }
 
 MEDFileFieldRepresentationLeaves::~MEDFileFieldRepresentationLeaves()
@@ -548,7 +1032,46 @@ MEDFileFieldRepresentationLeaves::~MEDFileFieldRepresentationLeaves()
 bool MEDFileFieldRepresentationLeaves::empty() const
 {
   const MEDFileFastCellSupportComparator *fcscp(_fsp);
-  return fcscp==0 || _arrays.empty();
+  return _arrays.empty() || (fcscp==0 && isBound());
+}
+
+/*!
+ * Returns false if \a this has been built from a MEDFileStructureIndexLeaf and not bound to its fields yet.
+ */
+bool MEDFileFieldRepresentationLeaves::isBound() const
+{
+  return _arrays.empty() || _arrays[0].isNotNull();
+}
+
+/*!
+ * Binds the arrays of \a this, built from a MEDFileStructureIndexLeaf, to their fields \a arr and their support comparator \a fsp.
+ */
+void MEDFileFieldRepresentationLeaves::bind(const std::vector< MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS> >& arr,
+                                            const MEDCoupling::MCAuto<MEDCoupling::MEDFileFastCellSupportComparator>& fsp)
+{
+  if(arr.size()!=_arrays.size())
+    throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationLeaves::bind : the number of fields differs from the one of the index !");
+  for(std::size_t i=0;i<arr.size();i++)
+    _arrays[i].bind(arr[i],getNumberOfTS());
+  _fsp=fsp;
+  _geo_types.clear();
+}
+
+/*!
+ * Returns the description of \a this to be stored in a MEDFileStructureIndex. The fields of the MED file the arrays come from are left to the caller.
+ */
+MEDFileStructureIndexLeaf MEDFileFieldRepresentationLeaves::buildIndexLeaf(const MEDCoupling::MEDFileMeshes *ms) const
+{
+  MEDFileStructureIndexLeaf ret;
+  ret._mesh_name=_mesh_name;
+  ret._dt_unit=_dt_unit;
+  ret._dtits=_dtits;
+  ret._times=_times;
+  ret._geo_types=getGeoTypes(ms);
+  ret._arrays.resize(_arrays.size());
+  for(std::size_t i=0;i<_arrays.size();i++)
+    _arrays[i].fillIndexArray(ret._arrays[i]);
+  return ret;
 }
 
 void MEDFileFieldRepresentationLeaves::setId(int& id) const
@@ -559,7 +1082,7 @@ void MEDFileFieldRepresentationLeaves::setId(int& id) const
 
 std::string MEDFileFieldRepresentationLeaves::getMeshName() const
 {
-  return _arrays[0]->getMeshName();
+  return _mesh_name;
 }
 
 int MEDFileFieldRepresentationLeaves::getNumberOfArrays() const
@@ -569,7 +1092,7 @@ int MEDFileFieldRepresentationLeaves::getNumberOfArrays() const
 
 int MEDFileFieldRepresentationLeaves::getNumberOfTS() const
 {
-  return _arrays[0]->getNumberOfTS();
+  return (int)_dtits.size();
 }
 
 void MEDFileFieldRepresentationLeaves::computeFullNameInLeaves(const std::string& tsName, const std::string& meshName, const std::string& comSupStr) const
@@ -580,13 +1103,12 @@ void MEDFileFieldRepresentationLeaves::computeFullNameInLeaves(const std::string
 
 /*!
  * \param [in] ms is the meshes pointer. It can be used only for information of geometric types. No special processing will be requested on ms.
- * \param [in] meshName
  * \param [in] sil
  * \param [in] root
  * \param [in] edge
  * \param [out] names
  */
-void MEDFileFieldRepresentationLeaves::feedSIL(const MEDCoupling::MEDFileMeshes *ms, const std::string& meshName, vtkMutableDirectedGraph* sil, vtkIdType root, vtkVariantArray *edge, std::vector<std::string>& names) const
+void MEDFileFieldRepresentationLeaves::feedSIL(const MEDCoupling::MEDFileMeshes *ms, vtkMutableDirectedGraph* sil, vtkIdType root, vtkVariantArray *edge, std::vector<std::string>& names) const
 {
   vtkIdType root2(sil->AddChild(root,edge));
   names.push_back(std::string("Arrs"));
@@ -595,13 +1117,7 @@ void MEDFileFieldRepresentationLeaves::feedSIL(const MEDCoupling::MEDFileMeshes
   //
   vtkIdType root3(sil->AddChild(root,edge));
   names.push_back(std::string("InfoOnGeoType"));
-  const MEDCoupling::MEDFileMesh *m(0);
-  if(ms)
-    m=ms->getMeshWithName(meshName);
-  const MEDCoupling::MEDFileFastCellSupportComparator *fsp(_fsp);
-  if(!fsp || fsp->getNumberOfTS()==0)
-    return ;
-  std::vector< INTERP_KERNEL::NormalizedCellType > gts(fsp->getGeoTypesAt(0,m));
+  std::vector< INTERP_KERNEL::NormalizedCellType > gts(getGeoTypes(ms));
   for(std::vector< INTERP_KERNEL::NormalizedCellType >::const_iterator it2=gts.begin();it2!=gts.end();it2++)
     {
       const INTERP_KERNEL::CellModel& cm(INTERP_KERNEL::CellModel::GetCellModel(*it2));
@@ -611,6 +1127,22 @@ void MEDFileFieldRepresentationLeaves::feedSIL(const MEDCoupling::MEDFileMeshes
     }
 }
 
+/*!
+ * Returns the geometric types of the support of the first time step of \a this. \a ms is used only if \a this is bound to its fields.
+ */
+std::vector<INTERP_KERNEL::NormalizedCellType> MEDFileFieldRepresentationLeaves::getGeoTypes(const MEDCoupling::MEDFileMeshes *ms) const
+{
+  const MEDCoupling::MEDFileFastCellSupportComparator *fsp(_fsp);
+  if(!fsp)
+    return _geo_types;
+  if(fsp->getNumberOfTS()==0)
+    return std::vector<INTERP_KERNEL::NormalizedCellType>();
+  const MEDCoupling::MEDFileMesh *m(0);
+  if(ms)
+    m=ms->getMeshWithName(_mesh_name);
+  return fsp->getGeoTypesAt(0,m);
+}
+
 bool MEDFileFieldRepresentationLeaves::containId(int id) const
 {
   for(std::vector<MEDFileFieldRepresentationLeavesArrays>::const_iterator it=_arrays.begin();it!=_arrays.end();it++)
@@ -630,12 +1162,42 @@ bool MEDFileFieldRepresentationLeaves::containZeName(const char *name, int& id)
   return false;
 }
 
+void MEDFileFieldRepresentationLeaves::feedIndexOfArrays(std::unordered_map<std::string,int>& idOfNames, std::vector<const MEDFileFieldRepresentationLeavesArrays *>& arrOfIds) const
+{
+  for(std::vector<MEDFileFieldRepresentationLeavesArrays>::const_iterator it=_arrays.begin();it!=_arrays.end();it++)
+    {
+      int id((*it).getId());
+      idOfNames[(*it).getZeName()]=id;
+      if(id>=(int)arrOfIds.size())
+        arrOfIds.resize(id+1,0);
+      arrOfIds[id]=&(*it);
+    }
+}
+
 void MEDFileFieldRepresentationLeaves::dumpState(std::map<std::string,bool>& status) const
 {
   for(std::vector<MEDFileFieldRepresentationLeavesArrays>::const_iterator it=_arrays.begin();it!=_arrays.end();it++)
     status[(*it).getZeName()]=(*it).getStatus();
 }
 
+/*!
+ * Returns the ids of the activated arrays of \a this separated by a comma.
+ */
+std::string MEDFileFieldRepresentationLeaves::getKeyOfActivatedArrays() const
+{
+  std::ostringstream oss;
+  for(std::vector<MEDFileFieldRepresentationLeavesArrays>::const_iterator it=_arrays.begin();it!=_arrays.end();it++)
+    if((*it).getStatus())
+      {
+        oss << (*it).getId();
+        const std::vector<std::string>& compos((*it).getSelectedComponents());
+        for(std::vector<std::string>::const_iterator it2=compos.begin();it2!=compos.end();it2++)
+          oss << "[" << *it2 << "]";
+        oss << ",";
+      }
+  return oss.str();
+}
+
 bool MEDFileFieldRepresentationLeaves::isActivated() const
 {
   for(std::vector<MEDFileFieldRepresentationLeavesArrays>::const_iterator it=_arrays.begin();it!=_arrays.end();it++)
@@ -663,6 +1225,14 @@ void MEDFileFieldRepresentationLeaves::activateAllArrays() const
     (*it).setStatus(true);
 }
 
+const MEDFileAnyTypeFieldMultiTS *MEDFileFieldRepresentationLeaves::getFieldAtPos(int pos) const
+{
+  if(pos<0 || pos>=(int)_arrays.size())
+    throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationLeaves::getFieldAtPos : invalid position !");
+  const MEDFileAnyTypeFieldMultiTS *ret(_arrays[pos]);
+  return ret;
+}
+
 const MEDFileFieldRepresentationLeavesArrays& MEDFileFieldRepresentationLeaves::getLeafArr(int id) const
 {
   for(std::vector<MEDFileFieldRepresentationLeavesArrays>::const_iterator it=_arrays.begin();it!=_arrays.end();it++)
@@ -672,29 +1242,35 @@ const MEDFileFieldRepresentationLeavesArrays& MEDFileFieldRepresentationLeaves::
 }
 
 std::vector<double> MEDFileFieldRepresentationLeaves::getTimeSteps(const TimeKeeper& tk) const
+{
+  return getTimeStepsIndex(tk).getTimeSteps();
+}
+
+/*!
+ * Returns the time steps of \a this regarding the policy of \a tk. They are computed and sorted only once per policy.
+ */
+const MEDTimeStepsIndex& MEDFileFieldRepresentationLeaves::getTimeStepsIndex(const TimeKeeper& tk) const
 {
   if(_arrays.size()<1)
     throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationLeaves::getTimeSteps : the array size must be at least of size one !");
-  std::vector<double> ret;
-  std::vector< std::pair<int,int> > dtits(_arrays[0]->getTimeSteps(ret));
-  return tk.getTimeStepsRegardingPolicy(dtits,ret);
+  if(_ts_policy!=tk.getPolicy())
+    {
+      _ts_index.assign(tk.getTimeStepsRegardingPolicy(_dtits,_times));
+      _ts_policy=tk.getPolicy();
+    }
+  return _ts_index;
 }
 
 std::vector< std::pair<int,int> > MEDFileFieldRepresentationLeaves::getTimeStepsInCoarseMEDFileFormat(std::vector<double>& ts) const
 {
-  if(!_arrays.empty())
-    return _arrays[0]->getTimeSteps(ts);
-  else
-    {
-      ts.clear();
-      return std::vector< std::pair<int,int> >();
-    }
+  ts=_times;
+  return _dtits;
 }
 
 std::string MEDFileFieldRepresentationLeaves::getHumanReadableOverviewOfTS() const
 {
   std::ostringstream oss;
-  oss << _arrays[0]->getNumberOfTS() << " time steps [" << _arrays[0]->getDtUnit() << "]\n(";
+  oss << getNumberOfTS() << " time steps [" << _dt_unit << "]\n(";
   std::vector<double> ret1;
   std::vector< std::pair<int,int> > ret2(getTimeStepsInCoarseMEDFileFormat(ret1));
   std::size_t sz(ret1.size());
@@ -714,17 +1290,200 @@ std::string MEDFileFieldRepresentationLeaves::getHumanReadableOverviewOfTS() con
   return oss.str();
 }
 
-void MEDFileFieldRepresentationLeaves::appendFields(const MEDTimeReq *tr, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshes *meshes, vtkDataSet *ds, ExportedTinyInfo *internalInfo) const
+/*!
+ * Loads the values of the time step at position \a timeStepId of the activated arrays of \a this. Arrays already loaded are skipped.
+ * The 1TS loaded by this call are appended to \a loaded to let the caller release them. The loop stops as soon as \a interrupt is set.
+ * Returns the heap memory size of the arrays loaded by this call.
+ */
+std::size_t MEDFileFieldRepresentationLeaves::prefetchTimeStep(int timeStepId, std::vector< MCAuto<MEDFileAnyTypeField1TS> >& loaded, const std::atomic<bool>& interrupt) const
+{
+  std::size_t ret(0);
+  for(std::vector<MEDFileFieldRepresentationLeavesArrays>::const_iterator it=_arrays.begin();it!=_arrays.end() && !interrupt;it++)
+    {
+      if(!(*it).getStatus() || timeStepId<0 || timeStepId>=(*it)->getNumberOfTS())
+        continue;
+      MCAuto<MEDFileAnyTypeField1TS> f1ts((*it)->getTimeStepAtPos(timeStepId));
+      MEDFileAnyTypeField1TS *f1tsPtr(f1ts);
+      MEDFileField1TS *f1tsPtrDbl(dynamic_cast<MEDFileField1TS *>(f1tsPtr));
+      MEDFileInt32Field1TS *f1tsPtrInt(dynamic_cast<MEDFileInt32Field1TS *>(f1tsPtr));
+      MEDFileInt64Field1TS *f1tsPtrInt64(dynamic_cast<MEDFileInt64Field1TS *>(f1tsPtr));
+      MEDFileFloatField1TS *f1tsPtrFloat(dynamic_cast<MEDFileFloatField1TS *>(f1tsPtr));
+      MEDCoupling::DataArray *crudeArr(0);
+      if(f1tsPtrDbl)
+        crudeArr=f1tsPtrDbl->getUndergroundDataArray();
+      else if(f1tsPtrInt)
+        crudeArr=f1tsPtrInt->getUndergroundDataArray();
+      else if(f1tsPtrInt64)
+        crudeArr=f1tsPtrInt64->getUndergroundDataArray();
+      else if(f1tsPtrFloat)
+        crudeArr=f1tsPtrFloat->getUndergroundDataArray();
+      else
+        continue;
+      if(!crudeArr || crudeArr->isAllocated())
+        continue;
+      {
+        std::lock_guard<std::mutex> ioLock(MEDUtilities::IOMutex());
+        f1ts->loadArraysIfNecessary();
+      }
+      ret+=crudeArr->getHeapMemorySize();
+      loaded.push_back(f1ts);
+    }
+  return ret;
+}
+
+/*!
+ * Adds to \a ds the activated arrays of \a this. If \a nbOfThreads is greater than 1, arrays are converted by \a nbOfThreads threads.
+ * If the memory used by \a tr is bounded, the modes are built one after the other for all the activated arrays and the limit is checked
+ * before each mode, in the order of the modes. So a mode is given for all the arrays or for none, whatever the number of threads.
+ */
+void MEDFileFieldRepresentationLeaves::appendFields(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshes *meshes, vtkDataSet *ds, int nbOfThreads, ExportedTinyInfo *internalInfo) const
 {
   if(_arrays.size()<1)
     throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationLeaves::appendFields : internal error !");
   MCAuto<MEDFileMeshStruct> mst(MEDFileMeshStruct::New(meshes->getMeshWithName(_arrays[0]->getMeshName().c_str())));
+  std::vector<const MEDFileFieldRepresentationLeavesArrays *> activated;
   for(std::vector<MEDFileFieldRepresentationLeavesArrays>::const_iterator it=_arrays.begin();it!=_arrays.end();it++)
     if((*it).getStatus())
+      activated.push_back(&(*it));
+  if(!tr->isMemoryBounded() && (nbOfThreads<=1 || activated.size()<=1))
+    {
+      for(std::vector<const MEDFileFieldRepresentationLeavesArrays *>::const_iterator it=activated.begin();it!=activated.end();it++)
+        {
+          (*it)->appendFields(tr,precision,globs,mml,mst,ds,internalInfo);
+          (*it)->appendELGAIfAny(ds);
+        }
+      return ;
+    }
+  // Assignment to ds is done once all the arrays are built, in the order of _arrays to have the same result than the serial path.
+  // Arrays already built for the same time step are simply added again.
+  std::vector<const MEDFileFieldRepresentationLeavesArrays *> toBeBuilt;
+  std::vector< std::vector<int> > tsPos;
+  for(std::vector<const MEDFileFieldRepresentationLeavesArrays *>::const_iterator it=activated.begin();it!=activated.end();it++)
+    {
+      std::vector<int> pos((*it)->getTimeStepsPositions(tr));
+      if((*it)->appendReusableArrayIfAny(tr,precision,pos,ds))
+        {
+          (*it)->appendELGAIfAny(ds);
+          continue;
+        }
+      toBeBuilt.push_back(*it);
+      tsPos.push_back(pos);
+    }
+  activated=toBeBuilt;
+  std::size_t nbOfArrs(activated.size());
+  std::vector< std::vector<MEDFileFieldRepresentationLeavesArraysTS> > arrs;
+  if(!tr->isMemoryBounded())
+    arrs=BuildDataArrays(activated,tsPos,globs,mml,mst,nbOfThreads);
+  else
+    {
+      arrs.resize(nbOfArrs);
+      std::size_t nbOfModes(0);
+      for(std::size_t i=0;i<nbOfArrs;i++)
+        {
+          arrs[i].resize(tsPos[i].size());
+          nbOfModes=std::max(nbOfModes,tsPos[i].size());
+        }
+      for(std::size_t k=0;k<nbOfModes;k++)
+        {
+          if(tr->isMemoryLimitReached())
+            {
+              tr->setTruncated();
+              break;
+            }
+          std::vector<const MEDFileFieldRepresentationLeavesArrays *> activatedOfMode;
+          std::vector< std::vector<int> > tsPosOfMode;
+          std::vector<std::size_t> ids;
+          for(std::size_t i=0;i<nbOfArrs;i++)
+            if(k<tsPos[i].size())
+              {
+                activatedOfMode.push_back(activated[i]);
+                tsPosOfMode.push_back(std::vector<int>(1,tsPos[i][k]));
+                ids.push_back(i);
+              }
+          std::vector< std::vector<MEDFileFieldRepresentationLeavesArraysTS> > arrsOfMode(BuildDataArrays(activatedOfMode,tsPosOfMode,globs,mml,mst,nbOfThreads));
+          for(std::size_t i=0;i<ids.size();i++)
+            {
+              arrs[ids[i]][k]=arrsOfMode[i][0];
+              tr->addMemoryUsed(arrsOfMode[i][0]._arr->getHeapMemorySize());
+            }
+        }
+    }
+  for(std::size_t i=0;i<nbOfArrs;i++)
+    {
+      activated[i]->assignDataArrays(tr,precision,globs,ds,internalInfo,arrs[i]);
+      activated[i]->keepReusableArray(tr,precision,tsPos[i],ds);
+      activated[i]->appendELGAIfAny(ds);
+    }
+}
+
+/*!
+ * Copies of the support \a mml and of the mesh structure \a mst used by one thread of BuildDataArrays. MEDCoupling objects are not
+ * thread-safe, reference counters included, so the copies, which share the parts of the mesh with \a mml and \a mst, are created
+ * and released under MEDUtilities::IOMutex. In between they are only used by their thread.
+ */
+class MEDFileFieldRepresentationWorkerSupport
+{
+public:
+  MEDFileFieldRepresentationWorkerSupport(const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshStruct *mst)
+  {
+    std::lock_guard<std::mutex> ioLock(MEDUtilities::IOMutex());
+    _mml=mml->prepare();
+    _mst=MEDFileMeshStruct::New(mst->getTheMesh());
+  }
+  ~MEDFileFieldRepresentationWorkerSupport()
+  {
+    std::lock_guard<std::mutex> ioLock(MEDUtilities::IOMutex());
+    _mml=0;
+    _mst=0;
+  }
+  const MEDCoupling::MEDMeshMultiLev *getMML() const { return _mml; }
+  const MEDCoupling::MEDFileMeshStruct *getMST() const { return _mst; }
+private:
+  MCAuto<MEDCoupling::MEDMeshMultiLev> _mml;
+  MCAuto<MEDCoupling::MEDFileMeshStruct> _mst;
+};
+
+/*!
+ * Builds the time steps at positions \a tsPos[i] of each array \a activated[i]. If \a nbOfThreads is greater than 1, arrays are built by \a nbOfThreads threads.
+ * Reads in the file are serialized by MEDUtilities::IOMutex inside buildDataArrays. Conversions to the VTK layout and selections of
+ * components run concurrently, each thread working on its own copy of \a mml and \a mst.
+ */
+std::vector< std::vector<MEDFileFieldRepresentationLeavesArraysTS> > MEDFileFieldRepresentationLeaves::BuildDataArrays(const std::vector<const MEDFileFieldRepresentationLeavesArrays *>& activated, const std::vector< std::vector<int> >& tsPos, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshStruct *mst, int nbOfThreads)
+{
+  std::size_t nbOfArrs(activated.size());
+  std::vector< std::vector<MEDFileFieldRepresentationLeavesArraysTS> > arrs(nbOfArrs);
+  if(nbOfThreads<=1 || nbOfArrs<=1)
+    {
+      for(std::size_t i=0;i<nbOfArrs;i++)
+        arrs[i]=activated[i]->buildDataArrays(tsPos[i],globs,mml,mst);
+      return arrs;
+    }
+  std::vector< std::future<void> > workers;
+  std::atomic<std::size_t> next(0);
+  for(int i=0;i<std::min(nbOfThreads,(int)nbOfArrs);i++)
+    workers.push_back(std::async(std::launch::async,[&]()
       {
-        (*it).appendFields(tr,globs,mml,mst,ds,internalInfo);
-        (*it).appendELGAIfAny(ds);
-      }
+        MEDFileFieldRepresentationWorkerSupport support(mml,mst);
+        for(std::size_t j=next++;j<nbOfArrs;j=next++)
+          arrs[j]=activated[j]->buildDataArrays(tsPos[j],globs,support.getMML(),support.getMST());
+      }));
+  std::exception_ptr firstExcept;
+  for(std::vector< std::future<void> >::iterator it=workers.begin();it!=workers.end();it++)
+    {
+      try
+        {
+          (*it).get();
+        }
+      catch(...)
+        {
+          if(!firstExcept)
+            firstExcept=std::current_exception();
+          next=nbOfArrs;
+        }
+    }
+  if(firstExcept)
+    std::rethrow_exception(firstExcept);
+  return arrs;
 }
 
 vtkUnstructuredGrid *MEDFileFieldRepresentationLeaves::buildVTKInstanceNoTimeInterpolationUnstructured(MEDUMeshMultiLev *mm) const
@@ -741,12 +1500,25 @@ vtkUnstructuredGrid *MEDFileFieldRepresentationLeaves::buildVTKInstanceNoTimeInt
   vtkUnstructuredGrid *ret(vtkUnstructuredGrid::New());
   vtkNew<vtkUnsignedCharArray> cellTypes;
   AssignDataPointerOther<vtkUnsignedCharArray,DataArrayByte>(cellTypes,typesSafe,nbOfCells);
-  vtkNew<vtkIdTypeArray> cellLocations;
-  AssignDataPointerOther<vtkIdTypeArray,DataArrayIdType>(cellLocations,cellLocationsSafe,nbOfCells);
+  // cellsSafe is in legacy format (number of points before the points of each cell). Convert it in place into connectivity
+  // and reuse cellLocationsSafe to store the offsets. Both are then given as is to vtkCellArray::SetData to avoid the conversion done by SetCells.
+  cellLocationsSafe->reAlloc(nbOfCells+1);
+  mcIdType *cPtr(cellsSafe->getPointer()),*oPtr(cellLocationsSafe->getPointer());
+  mcIdType pos(0),connPos(0);
+  for(vtkIdType i=0;i<nbOfCells;i++)
+    {
+      mcIdType nbPts(cPtr[pos]);
+      oPtr[i]=connPos;
+      std::copy(cPtr+pos+1,cPtr+pos+1+nbPts,cPtr+connPos);//connPos<=pos so forward copy is safe
+      connPos+=nbPts; pos+=nbPts+1;
+    }
+  oPtr[nbOfCells]=connPos;
+  vtkNew<vtkIdTypeArray> offsets;
+  AssignDataPointerOther<vtkIdTypeArray,DataArrayIdType>(offsets,cellLocationsSafe,nbOfCells+1);
+  vtkNew<vtkIdTypeArray> conn;
+  AssignDataPointerOther<vtkIdTypeArray,DataArrayIdType>(conn,cellsSafe,connPos);
   vtkNew<vtkCellArray> cells;
-  vtkNew<vtkIdTypeArray> cells2;
-  AssignDataPointerOther<vtkIdTypeArray,DataArrayIdType>(cells2,cellsSafe,cellsSafe->getNbOfElems());
-  cells->SetCells(nbOfCells,cells2);
+  cells->SetData(offsets,conn);
   if(faceLocationsOffsetSafe.isNotNull())
     {
       vtkNew<vtkIdTypeArray> faceLocationsOffset;
@@ -853,13 +1625,18 @@ vtkStructuredGrid *MEDFileFieldRepresentationLeaves::buildVTKInstanceNoTimeInter
   return ret;
 }
 
-vtkDataSet *MEDFileFieldRepresentationLeaves::buildVTKInstanceNoTimeInterpolation(const MEDTimeReq *tr, const MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDFileMeshes *meshes, bool debugArrays, ExportedTinyInfo *internalInfo) const
+vtkDataSet *MEDFileFieldRepresentationLeaves::buildVTKInstanceNoTimeInterpolation(const MEDTimeReq *tr, const MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDFileMeshes *meshes, bool debugArrays, const MEDFloatingPointPrecision& precision, int nbOfThreads, ExportedTinyInfo *internalInfo) const
 {
   vtkDataSet *ret(0);
   //_fsp->isDataSetSupportEqualToThePreviousOne(i,globs);
   MCAuto<MEDMeshMultiLev> mml(_fsp->buildFromScratchDataSetSupport(0,globs));//0=timestep Id. Make the hypothesis that support does not change 
   MCAuto<MEDMeshMultiLev> mml2(mml->prepare());
   MEDMeshMultiLev *ptMML2(mml2);
+  if(_cached_ds && _cached_ds_single_precision!=precision.isSinglePrecision())
+    {
+      _cached_ds->Delete();
+      _cached_ds=0;
+    }
   if(!_cached_ds)
     {
       MEDUMeshMultiLev *ptUMML2(dynamic_cast<MEDUMeshMultiLev *>(ptMML2));
@@ -880,6 +1657,9 @@ vtkDataSet *MEDFileFieldRepresentationLeaves::buildVTKInstanceNoTimeInterpolatio
         }
       else
         throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationLeaves::buildVTKInstanceNoTimeInterpolation : unrecognized mesh ! Supported for the moment unstructured, cartesian, curvelinear !");
+      if(precision.isSinglePrecision())
+        ConvertCoordinatesToSinglePrecision(ret);
+      _cached_ds_single_precision=precision.isSinglePrecision();
       _cached_ds=ret->NewInstance();
       _cached_ds->ShallowCopy(ret);
     }
@@ -889,7 +1669,7 @@ vtkDataSet *MEDFileFieldRepresentationLeaves::buildVTKInstanceNoTimeInterpolatio
       ret->ShallowCopy(_cached_ds);
     }
   //
-  appendFields(tr,globs,mml,meshes,ret,internalInfo);
+  appendFields(tr,precision,globs,mml,meshes,ret,nbOfThreads,internalInfo);
   // The arrays links to mesh
   MEDCoupling::DataArrayIdType *famCells(0),*numCells(0);
   bool noCpyFamCells(false),noCpyNumCells(false);
@@ -957,8 +1737,12 @@ vtkDataSet *MEDFileFieldRepresentationLeaves::buildVTKInstanceNoTimeInterpolatio
 
 //////////////////////
 
-MEDFileFieldRepresentationTree::MEDFileFieldRepresentationTree()
+MEDFileFieldRepresentationTree::MEDFileFieldRepresentationTree():_nb_of_threads(1),_structure_index_enabled(false),_mode_memory_limit_in_mb(0),_pack_modes(false),_modes_truncated(false),
+                                                                 _partitioning_strategy(MEDFileMeshesPartitioner::SLICES)
 {
+#ifdef MEDREADER_USE_MPI
+  _comm=MPI_COMM_WORLD;
+#endif
 }
 
 int MEDFileFieldRepresentationTree::getNumberOfLeavesArrays() const
@@ -1055,7 +1839,7 @@ void MEDFileFieldRepresentationTree::feedSIL(vtkMutableDirectedGraph* sil, vtkId
               std::string comSupStr(oss2.str());
               vtkIdType typeId2(sil->AddChild(typeId1,edge));
               names.push_back(comSupStr);
-              (*it2).feedSIL(_ms,meshName,sil,typeId2,edge,names);
+              (*it2).feedSIL(_ms,sil,typeId2,edge,names);
             } 
         }
     }
@@ -1073,42 +1857,42 @@ std::string MEDFileFieldRepresentationTree::feedSILForFamsAndGrps(vtkMutableDire
   int dummy0(0),dummy1(0),dummy2(0);
   const MEDFileFieldRepresentationLeaves& leaf(getTheSingleActivated(dummy0,dummy1,dummy2));
   std::string ret(leaf.getMeshName());
-  int i(0);
-  MEDFileMesh *m(0);
-  for(;i<_ms->getNumberOfMeshes();i++)
+  // families and groups are read from the index if the tree has been loaded from it, the mesh may be not loaded yet
+  MEDFileStructureIndexMesh desc;
+  const MEDFileStructureIndexMesh *m(_index.getMeshWithName(ret));
+  if(!m)
     {
-      m=_ms->getMeshAtPos(i);
-      if(m->getName()==ret)
-        break;
+      int i(0);
+      for(;i<_ms->getNumberOfMeshes();i++)
+        if(_ms->getMeshAtPos(i)->getName()==ret)
+          break;
+      if(i==_ms->getNumberOfMeshes())
+        throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationTree::feedSILForFamsAndGrps : internal error #0 !");
+      desc=MEDFileStructureIndexMesh(_ms->getMeshAtPos(i));
+      m=&desc;
     }
-  if(i==_ms->getNumberOfMeshes())
-    throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationTree::feedSILForFamsAndGrps : internal error #0 !");
   vtkIdType typeId0(sil->AddChild(root,edge));
-  names.push_back(m->getName());
+  names.push_back(m->_name);
   //
   vtkIdType typeId1(sil->AddChild(typeId0,edge));
   names.push_back(std::string(ROOT_OF_GRPS_IN_TREE));
-  std::vector<std::string> grps(m->getGroupsNames());
-  for(std::vector<std::string>::const_iterator it0=grps.begin();it0!=grps.end();it0++)
+  for(std::vector< std::pair< std::string, std::vector<std::string> > >::const_iterator it0=m->_groups.begin();it0!=m->_groups.end();it0++)
     {
       vtkIdType typeId2(sil->AddChild(typeId1,edge));
-      names.push_back(*it0);
-      std::vector<std::string> famsOnGrp(m->getFamiliesOnGroup((*it0).c_str()));
-      for(std::vector<std::string>::const_iterator it1=famsOnGrp.begin();it1!=famsOnGrp.end();it1++)
+      names.push_back((*it0).first);
+      for(std::vector<std::string>::const_iterator it1=(*it0).second.begin();it1!=(*it0).second.end();it1++)
         {
           sil->AddChild(typeId2,edge);
-          names.push_back((*it1).c_str());
+          names.push_back(*it1);
         }
     }
   //
   vtkIdType typeId11(sil->AddChild(typeId0,edge));
   names.push_back(std::string(ROOT_OF_FAM_IDS_IN_TREE));
-  std::vector<std::string> fams(m->getFamiliesNames());
-  for(std::vector<std::string>::const_iterator it00=fams.begin();it00!=fams.end();it00++)
+  for(std::vector< std::pair<std::string,mcIdType> >::const_iterator it00=m->_families.begin();it00!=m->_families.end();it00++)
     {
       sil->AddChild(typeId11,edge);
-      int famId(m->getFamilyId((*it00).c_str()));
-      std::ostringstream oss; oss << (*it00) << MEDFileFieldRepresentationLeavesArrays::ZE_SEP << famId;
+      std::ostringstream oss; oss << (*it00).first << MEDFileFieldRepresentationLeavesArrays::ZE_SEP << (*it00).second;
       names.push_back(oss.str());
     }
   return ret;
@@ -1116,12 +1900,9 @@ std::string MEDFileFieldRepresentationTree::feedSILForFamsAndGrps(vtkMutableDire
 
 const MEDFileFieldRepresentationLeavesArrays& MEDFileFieldRepresentationTree::getLeafArr(int id) const
 {
-  for(std::vector< std::vector< std::vector< MEDFileFieldRepresentationLeaves > > >::const_iterator it0=_data_structure.begin();it0!=_data_structure.end();it0++)
-    for(std::vector< std::vector< MEDFileFieldRepresentationLeaves > >::const_iterator it1=(*it0).begin();it1!=(*it0).end();it1++)
-      for(std::vector< MEDFileFieldRepresentationLeaves >::const_iterator it2=(*it1).begin();it2!=(*it1).end();it2++)
-        if((*it2).containId(id))
-          return (*it2).getLeafArr(id);
-  throw INTERP_KERNEL::Exception("Internal error in MEDFileFieldRepresentationTree::getLeafArr !");
+  if(id<0 || id>=(int)_leaves_arrays_of_ids.size() || !_leaves_arrays_of_ids[id])
+    throw INTERP_KERNEL::Exception("Internal error in MEDFileFieldRepresentationTree::getLeafArr !");
+  return *_leaves_arrays_of_ids[id];
 }
 
 std::string MEDFileFieldRepresentationTree::getNameOf(int id) const
@@ -1144,12 +1925,9 @@ bool MEDFileFieldRepresentationTree::getStatusOf(int id) const
 
 int MEDFileFieldRepresentationTree::getIdHavingZeName(const char *name) const
 {
-  int ret(-1);
-  for(std::vector< std::vector< std::vector< MEDFileFieldRepresentationLeaves > > >::const_iterator it0=_data_structure.begin();it0!=_data_structure.end();it0++)
-    for(std::vector< std::vector< MEDFileFieldRepresentationLeaves > >::const_iterator it1=(*it0).begin();it1!=(*it0).end();it1++)
-      for(std::vector< MEDFileFieldRepresentationLeaves >::const_iterator it2=(*it1).begin();it2!=(*it1).end();it2++)
-        if((*it2).containZeName(name,ret))
-          return ret;
+  std::unordered_map<std::string,int>::const_iterator it(_id_of_names.find(name));
+  if(it!=_id_of_names.end())
+    return (*it).second;
   std::ostringstream msg; msg << "MEDFileFieldRepresentationTree::getIdHavingZeName : No such a name \"" << name << "\" !";
   throw INTERP_KERNEL::Exception(msg.str().c_str());
 }
@@ -1158,9 +1936,26 @@ bool MEDFileFieldRepresentationTree::changeStatusOfAndUpdateToHaveCoherentVTKDat
 {
   const MEDFileFieldRepresentationLeavesArrays& elt(getLeafArr(id));
   bool ret(elt.setStatus(status));//to be implemented
+  if(status)
+    computePartsOfMeshIfNeeded(elt.getMeshName());
   return ret;
 }
 
+/*!
+ * Computes the parts of the unstructured mesh \a meshName the first time a leaf lying on it is activated.
+ * Parts of meshes never shown are never computed. Meshes of a tree loaded from an index are not concerned until they are loaded (see bindLeafIfNeeded).
+ */
+void MEDFileFieldRepresentationTree::computePartsOfMeshIfNeeded(const std::string& meshName) const
+{
+  std::set<std::string>::iterator it(_meshes_without_parts.find(meshName));
+  if(it==_meshes_without_parts.end())
+    return ;
+  MEDCoupling::MEDFileUMesh *mesh(dynamic_cast<MEDCoupling::MEDFileUMesh *>(_ms->getMeshWithName(meshName)));
+  if(mesh)
+    mesh->forceComputationOfParts();
+  _meshes_without_parts.erase(it);
+}
+
 int MEDFileFieldRepresentationTree::getMaxNumberOfTimeSteps() const
 {
   int ret(0);
@@ -1199,17 +1994,24 @@ void MEDFileFieldRepresentationTree::loadInMemory(MEDCoupling::MEDFileFields *fi
       fields_per_mesh[i]=_fields->partOfThisLyingOnSpecifiedMeshName(meshNames[i].c_str());
     }
   std::vector< MCAuto<MEDFileAnyTypeFieldMultiTS > > allFMTSLeavesToDisplaySafe;
+  // field of the MED file each field of allFMTSLeavesToDisplaySafe comes from, for the index
+  std::vector<MEDFileStructureIndexArray> sources;
   for(std::vector< MCAuto<MEDFileFields> >::const_iterator fields=fields_per_mesh.begin();fields!=fields_per_mesh.end();fields++)
     {
       for(int j=0;j<(*fields)->getNumberOfFields();j++)
         {
           MCAuto<MEDFileAnyTypeFieldMultiTS> fmts((*fields)->getFieldAtPos((int)j));
+          std::string sourceName(IsFieldMeshRegardingInfo(fmts->getInfo())?std::string():fmts->getName());
           std::vector< MCAuto< MEDFileAnyTypeFieldMultiTS > > tmp(fmts->splitDiscretizations());
+          int posOfDiscr(0);
           // EDF 8655
-          for(std::vector< MCAuto< MEDFileAnyTypeFieldMultiTS > >::const_iterator it=tmp.begin();it!=tmp.end();it++)
+          for(std::vector< MCAuto< MEDFileAnyTypeFieldMultiTS > >::const_iterator it=tmp.begin();it!=tmp.end();it++,posOfDiscr++)
             {
               if(!(*it)->presenceOfMultiDiscPerGeoType())
-                allFMTSLeavesToDisplaySafe.push_back(*it);
+                {
+                  allFMTSLeavesToDisplaySafe.push_back(*it);
+                  sources.push_back(MEDFileStructureIndexArray(sourceName,posOfDiscr,-1));
+                }
               else
                 {// The case of some parts of field have more than one discretization per geo type.
                   std::vector< MCAuto< MEDFileAnyTypeFieldMultiTS > > subTmp((*it)->splitMultiDiscrPerGeoTypes());
@@ -1219,6 +2021,7 @@ void MEDFileFieldRepresentationTree::loadInMemory(MEDCoupling::MEDFileFields *fi
                       std::ostringstream oss; oss << (*it0)->getName() << "_" << std::setfill('M') << std::setw(3) << it0Cnt;
                       (*it0)->setName(oss.str());
                       allFMTSLeavesToDisplaySafe.push_back(*it0);
+                      sources.push_back(MEDFileStructureIndexArray(sourceName,posOfDiscr,(int)it0Cnt));
                     }
                 }
             }
@@ -1286,47 +2089,273 @@ void MEDFileFieldRepresentationTree::loadInMemory(MEDCoupling::MEDFileFields *fi
             this->_data_structure[i][j][k]=MEDFileFieldRepresentationLeaves(commonSupSplitSafe[k],fsp[k]);
         }
     }
+  if(!_index_file_name.empty())
+    {
+      saveIndex(allFMTSLeavesToDisplay,sources);
+      _index_file_name.clear();
+    }
+  this->removeEmptyLeaves();
+  this->assignIds();
+  this->computeFullNameInLeaves();
+  this->buildIndexOfLeavesArrays();
+}
+
+/*!
+ * Restricts the components given to VTK of the fields in \a compos (key is the name of the field in the MED file).
+ * All the components of the other fields are given to VTK.
+ */
+void MEDFileFieldRepresentationTree::setSelectedComponents(const std::map<std::string, std::vector<std::string> >& compos) const
+{
+  static const std::vector<std::string> ALL_COMPOS;
+  for(std::vector<const MEDFileFieldRepresentationLeavesArrays *>::const_iterator it=_leaves_arrays_of_ids.begin();it!=_leaves_arrays_of_ids.end();it++)
+    {
+      std::map<std::string, std::vector<std::string> >::const_iterator it2(compos.find((*it)->getFieldName()));
+      (*it)->setSelectedComponents(it2!=compos.end()?(*it2).second:ALL_COMPOS);
+    }
+}
+
+/*!
+ * Fills the index giving in constant time the leaf array having a given id or a given name. To be called once the tree is no more modified.
+ */
+void MEDFileFieldRepresentationTree::buildIndexOfLeavesArrays()
+{
+  _id_of_names.clear();
+  _leaves_arrays_of_ids.clear();
+  _leaves_arrays_of_ids.reserve(getNumberOfLeavesArrays());
+  for(std::vector< std::vector< std::vector< MEDFileFieldRepresentationLeaves > > >::const_iterator it0=_data_structure.begin();it0!=_data_structure.end();it0++)
+    for(std::vector< std::vector< MEDFileFieldRepresentationLeaves > >::const_iterator it1=(*it0).begin();it1!=(*it0).end();it1++)
+      for(std::vector< MEDFileFieldRepresentationLeaves >::const_iterator it2=(*it1).begin();it2!=(*it1).end();it2++)
+        (*it2).feedIndexOfArrays(_id_of_names,_leaves_arrays_of_ids);
+}
+
+/*!
+ * Stores \a this in the index of _index_file_name to let the next opening build the tree without reading the meshes and the fields (see loadFromIndex).
+ * \a sources gives the field of the MED file each field of \a fields comes from.
+ */
+void MEDFileFieldRepresentationTree::saveIndex(const std::vector<MEDCoupling::MEDFileAnyTypeFieldMultiTS *>& fields, const std::vector<MEDFileStructureIndexArray>& sources) const
+{
+  std::map<const MEDFileAnyTypeFieldMultiTS *,std::size_t> posOfFields;
+  for(std::size_t i=0;i<fields.size();i++)
+    posOfFields[fields[i]]=i;
+  MEDFileStructureIndex index;
+  std::vector< std::vector< std::vector<MEDFileStructureIndexLeaf> > >& leaves(index.getLeaves());
+  leaves.resize(_data_structure.size());
+  for(std::size_t i=0;i<_data_structure.size();i++)
+    {
+      leaves[i].resize(_data_structure[i].size());
+      for(std::size_t j=0;j<_data_structure[i].size();j++)
+        for(std::vector< MEDFileFieldRepresentationLeaves >::const_iterator it=_data_structure[i][j].begin();it!=_data_structure[i][j].end();it++)
+          {
+            MEDFileStructureIndexLeaf desc((*it).buildIndexLeaf(_ms));
+            for(int l=0;l<(*it).getNumberOfArrays();l++)
+              {
+                std::map<const MEDFileAnyTypeFieldMultiTS *,std::size_t>::const_iterator it2(posOfFields.find((*it).getFieldAtPos(l)));
+                if(it2==posOfFields.end())
+                  return ;//not expected. No index, the file is simply read again next time
+                const MEDFileStructureIndexArray& source(sources[(*it2).second]);
+                desc._arrays[l]._source_name=source._source_name;
+                desc._arrays[l]._pos_of_discr=source._pos_of_discr;
+                desc._arrays[l]._pos_of_multi_discr=source._pos_of_multi_discr;
+              }
+            leaves[i][j].push_back(desc);
+          }
+    }
+  for(int i=0;i<_ms->getNumberOfMeshes();i++)
+    index.getMeshes().push_back(MEDFileStructureIndexMesh(_ms->getMeshAtPos(i)));
+  index.save(_index_file_name,_structure_index_directory);//if the index can't be written, it is simply computed again next time
+}
+
+/*!
+ * Builds the tree from _index without reading the MED file. The leaves are bound to their meshes and fields when they are used (see bindLeafIfNeeded).
+ */
+void MEDFileFieldRepresentationTree::loadFromIndex()
+{
+  _ms=MEDFileMeshes::New();
+  _fields=MEDFileFields::New();
+  const std::vector< std::vector< std::vector<MEDFileStructureIndexLeaf> > >& leaves(_index.getLeaves());
+  _data_structure.resize(leaves.size());
+  for(std::size_t i=0;i<leaves.size();i++)
+    {
+      _data_structure[i].resize(leaves[i].size());
+      for(std::size_t j=0;j<leaves[i].size();j++)
+        for(std::vector<MEDFileStructureIndexLeaf>::const_iterator it=leaves[i][j].begin();it!=leaves[i][j].end();it++)
+          _data_structure[i][j].push_back(MEDFileFieldRepresentationLeaves(*it));
+    }
   this->removeEmptyLeaves();
   this->assignIds();
   this->computeFullNameInLeaves();
+  this->buildIndexOfLeavesArrays();
+}
+
+/*!
+ * If the tree has been loaded from an index, reads the mesh and the fields of \a leaf the first time it is used. The other meshes and fields are not read.
+ * If the MED file does not match the index, the index is removed to be computed again at the next opening and an exception is thrown.
+ */
+void MEDFileFieldRepresentationTree::bindLeafIfNeeded(const MEDFileFieldRepresentationLeaves& leaf) const
+{
+  if(leaf.isBound())
+    return ;
+  for(std::size_t i=0;i<_data_structure.size();i++)
+    for(std::size_t j=0;j<_data_structure[i].size();j++)
+      for(std::size_t k=0;k<_data_structure[i][j].size();k++)
+        {
+          if(&_data_structure[i][j][k]!=&leaf)
+            continue;
+          const MEDFileStructureIndexLeaf& desc(_index.getLeaves()[i][j][k]);
+          std::lock_guard<std::mutex> ioLock(MEDUtilities::IOMutex());
+          try
+            {
+              MEDFileMesh *mesh(loadMeshIfNeeded(desc._mesh_name));
+              std::vector< MCAuto<MEDFileAnyTypeFieldMultiTS> > arrs;
+              for(std::vector<MEDFileStructureIndexArray>::const_iterator it=desc._arrays.begin();it!=desc._arrays.end();it++)
+                {
+                  MCAuto<MEDFileAnyTypeFieldMultiTS> fmts;
+                  if((*it)._source_name.empty())
+                    {// field built from the mesh as loadInMemory does
+                      MCAuto<MEDFileMeshes> ms(MEDFileMeshes::New());
+                      ms->pushMesh(mesh);
+                      MCAuto<MEDFileFields> fields(BuildFieldFromMeshes(ms));
+                      fmts=fields->getFieldAtPos(0);
+                    }
+                  else
+                    fmts=loadFieldIfNeeded((*it)._source_name);
+                  std::vector< MCAuto<MEDFileAnyTypeFieldMultiTS> > tmp(fmts->splitDiscretizations());
+                  if((*it)._pos_of_discr<0 || (*it)._pos_of_discr>=(int)tmp.size())
+                    throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationTree::bindLeafIfNeeded : discretization of the index not in the MED file !");
+                  fmts=tmp[(*it)._pos_of_discr];
+                  if((*it)._pos_of_multi_discr>=0)
+                    {
+                      std::vector< MCAuto<MEDFileAnyTypeFieldMultiTS> > subTmp(fmts->splitMultiDiscrPerGeoTypes());
+                      if((*it)._pos_of_multi_discr>=(int)subTmp.size())
+                        throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationTree::bindLeafIfNeeded : discretization per geometric type of the index not in the MED file !");
+                      fmts=subTmp[(*it)._pos_of_multi_discr];
+                    }
+                  if((*it)._source_name.empty() || (*it)._pos_of_multi_discr>=0)
+                    fmts->setName((*it)._field_name);
+                  arrs.push_back(fmts);
+                }
+              MCAuto<MEDFileMeshStruct> mst(MEDFileMeshStruct::New(mesh));
+              //SplitPerCommonSupport takes the first field of each group as reference
+              MCAuto<MEDFileFastCellSupportComparator> fsp(MEDFileFastCellSupportComparator::New(mst,arrs[0]));
+              _data_structure[i][j][k].bind(arrs,fsp);
+            }
+          catch(INTERP_KERNEL::Exception&)
+            {
+              MEDFileStructureIndex::Remove(_file_name,_structure_index_directory);
+              throw ;
+            }
+          return ;
+        }
+  throw INTERP_KERNEL::Exception("MEDFileFieldRepresentationTree::bindLeafIfNeeded : leaf not in the tree !");
+}
+
+/*!
+ * Returns the mesh \a meshName of _ms. If the tree has been loaded from an index, the mesh is read the first time it is requested.
+ */
+MEDCoupling::MEDFileMesh *MEDFileFieldRepresentationTree::loadMeshIfNeeded(const std::string& meshName) const
+{
+  std::vector<std::string> meshNames(_ms->getMeshesNames());
+  if(std::find(meshNames.begin(),meshNames.end(),meshName)==meshNames.end())
+    {
+      MCAuto<MEDFileMesh> mesh(MEDFileMesh::New(_file_name,meshName));
+      _ms->pushMesh(mesh);
+      _ms->cartesianizeMe();
+      if(dynamic_cast<MEDCoupling::MEDFileUMesh *>(_ms->getMeshWithName(meshName)))
+        _meshes_without_parts.insert(meshName);
+    }
+  return _ms->getMeshWithName(meshName);
+}
+
+/*!
+ * Returns the field \a fieldName of _fields (to be released by the caller). If the tree has been loaded from an index, the field is read
+ * (without its values) the first time it is requested. Its profiles and localizations are added to the ones of _fields.
+ */
+MEDCoupling::MEDFileAnyTypeFieldMultiTS *MEDFileFieldRepresentationTree::loadFieldIfNeeded(const std::string& fieldName) const
+{
+  std::vector<std::string> fieldNames(_fields->getFieldsNames());
+  if(std::find(fieldNames.begin(),fieldNames.end(),fieldName)==fieldNames.end())
+    {
+      MCAuto<MEDFileAnyTypeFieldMultiTS> fmts(MEDFileAnyTypeFieldMultiTS::New(_file_name,fieldName,false));//false is important to not read the values
+      _fields->pushField(fmts);
+    }
+  return _fields->getFieldWithName(fieldName);
 }
 
 void MEDFileFieldRepresentationTree::loadMainStructureOfFile(const char *fileName, int iPart, int nbOfParts)
 {
+  bool isSerial((iPart==-1 && nbOfParts==-1) || (iPart==0 && nbOfParts==1));
+  // the grouping of a partition or of a part of the meshes may differ from the one of the whole file
+  bool useIndex(isSerial && _structure_index_enabled && _groups_to_load.empty());
+  if(useIndex && _index.load(fileName,_structure_index_directory))
+    {
+      _file_name=fileName;
+      loadFromIndex();
+      return ;
+    }
   MCAuto<MEDFileMeshes> ms;
   MCAuto<MEDFileFields> fields;
     {
-      if((iPart==-1 && nbOfParts==-1) || (iPart==0 && nbOfParts==1))
+      std::lock_guard<std::mutex> ioLock(MEDUtilities::IOMutex());
+      if(isSerial)
         {
           MCAuto<MEDFileMeshSupports> msups(MEDFileMeshSupports::New(fileName));
           MCAuto<MEDFileStructureElements> mse(MEDFileStructureElements::New(fileName,msups));
           ms=MEDFileMeshes::New(fileName);
-          fields=MEDFileFields::NewWithDynGT(fileName,mse,false);//false is important to not read the values
+          bool isPartial(false);
+          if(!_groups_to_load.empty() && !ms->presenceOfStructureElements() && LoadPartOfMeshesLyingOn(fileName,ms,_groups_to_load))
+            {// only the cells lying on the selected groups and families, and the field values on them, are read
+              try
+                {
+                  fields=MEDFileFields::LoadPartOf(fileName,false,ms);//false is important to not read the values
+                  isPartial=true;
+                }
+              catch(INTERP_KERNEL::Exception& e)
+                {// for example a field lying on a geometric type without any cell selected
+                  std::cerr << "MEDFileFieldRepresentationTree::loadMainStructureOfFile : partial load impossible (" << e.what() << ") ! Meshes are loaded entirely." << std::endl;
+                  ms=MEDFileMeshes::New(fileName);
+                }
+            }
+          if(!isPartial)
+            fields=MEDFileFields::NewWithDynGT(fileName,mse,false);//false is important to not read the values
+          // fields lying on structure elements can't be read alone (see bindLeafIfNeeded), no index for them
+          if(useIndex && !ms->presenceOfStructureElements())
+            _index_file_name=fileName;
           if(ms->presenceOfStructureElements())
-            {// pre traitement
-              fields->loadArrays();
+            {// pre traitement. Only values of fields lying on structure elements are needed to blow them up.
+              int nbFields(fields->getNumberOfFields());
+              for(int i=0;i<nbFields;i++)
+                {
+                  MCAuto<MEDFileAnyTypeFieldMultiTS> fmts(fields->getFieldAtPos(i));
+                  if(fmts.isNotNull() && fmts->presenceOfStructureElements())
+                    fmts->loadArrays();
+                }
               fields->blowUpSE(ms,mse);
             }
+          // Parts of unstructured meshes are computed only when a leaf lying on them is activated (see computePartsOfMeshIfNeeded)
           int nbMeshes(ms->getNumberOfMeshes());
           for(int i=0;i<nbMeshes;i++)
             {
               MEDCoupling::MEDFileMesh *tmp(ms->getMeshAtPos(i));
-              MEDCoupling::MEDFileUMesh *tmp2(dynamic_cast<MEDCoupling::MEDFileUMesh *>(tmp));
-              if(tmp2)
-                tmp2->forceComputationOfParts();
+              if(dynamic_cast<MEDCoupling::MEDFileUMesh *>(tmp))
+                _meshes_without_parts.insert(tmp->getName());
             }
         }
       else
         {
 #ifdef MEDREADER_USE_MPI
-          ms=ParaMEDFileMeshes::New(iPart,nbOfParts,fileName);
-          int nbMeshes(ms->getNumberOfMeshes());
-          for(int i=0;i<nbMeshes;i++)
+          if(_partitioning_strategy==MEDFileMeshesPartitioner::SPACE_FILLING_CURVE)
+            ms=MEDFileMeshesPartitioner::LoadAlongSpaceFillingCurve(fileName,_comm);
+          else
             {
-              MEDCoupling::MEDFileMesh *tmp(ms->getMeshAtPos(i));
-              MEDCoupling::MEDFileUMesh *tmp2(dynamic_cast<MEDCoupling::MEDFileUMesh *>(tmp));
-              if(tmp2)
-                MCAuto<MEDCoupling::DataArrayIdType> tmp3(tmp2->zipCoords());
+              ms=ParaMEDFileMeshes::New(iPart,nbOfParts,fileName);
+              int nbMeshes(ms->getNumberOfMeshes());
+              for(int i=0;i<nbMeshes;i++)
+                {
+                  MEDCoupling::MEDFileMesh *tmp(ms->getMeshAtPos(i));
+                  MEDCoupling::MEDFileUMesh *tmp2(dynamic_cast<MEDCoupling::MEDFileUMesh *>(tmp));
+                  if(tmp2)
+                    MCAuto<MEDCoupling::DataArrayIdType> tmp3(tmp2->zipCoords());
+                }
             }
           fields=MEDFileFields::LoadPartOf(fileName,false,ms);//false is important to not read the values
 #else
@@ -1338,6 +2367,94 @@ void MEDFileFieldRepresentationTree::loadMainStructureOfFile(const char *fileNam
   loadInMemory(fields,ms);
 }
 
+/*!
+ * Replaces the unstructured meshes of \a ms having cells on the groups and families \a entries by their parts lying on them.
+ * Only these cells and the nodes they use are read from \a fileName. Families and groups of the meshes are kept.
+ * Returns true if at least one mesh has been replaced. In this case the fields are expected to be loaded with MEDFileFields::LoadPartOf.
+ */
+bool MEDFileFieldRepresentationTree::LoadPartOfMeshesLyingOn(const char *fileName, MEDFileMeshes *ms, const std::set<std::string>& entries)
+{
+  bool ret(false);
+  int nbMeshes(ms->getNumberOfMeshes());
+  for(int i=0;i<nbMeshes;i++)
+    {
+      const MEDFileUMesh *mm(dynamic_cast<const MEDFileUMesh *>(ms->getMeshAtPos(i)));
+      std::map<INTERP_KERNEL::NormalizedCellType,std::vector<mcIdType> > distrib;
+      if(!mm || !ComputeCellsLyingOn(mm,entries,distrib))
+        continue;
+      MCAuto<MEDFileUMesh> part(MEDFileUMesh::LoadPartOfFromUserDistrib(fileName,mm->getName(),distrib,mm->getIteration(),mm->getOrder()));
+      ms->setMeshAtPos(i,part);
+      ret=true;
+    }
+  return ret;
+}
+
+/*!
+ * Fills \a distrib with the ids (relative to their geometric type) of the cells of \a mm lying on the groups and families \a entries.
+ * \a entries are keys of ExtractGroupInternal (see ExtractGroupGrp::START and ExtractGroupFam::START). Entries not on \a mm are ignored.
+ * Returns false if \a mm is to be loaded entirely : no entry is on \a mm, no cell is selected or a family of nodes is selected.
+ */
+bool MEDFileFieldRepresentationTree::ComputeCellsLyingOn(const MEDFileUMesh *mm, const std::set<std::string>& entries, std::map<INTERP_KERNEL::NormalizedCellType,std::vector<mcIdType> >& distrib)
+{
+  std::size_t szGrp(strlen(ExtractGroupGrp::START)),szFam(strlen(ExtractGroupFam::START));
+  std::set<mcIdType> famIds;
+  for(std::set<std::string>::const_iterator it=entries.begin();it!=entries.end();it++)
+    {
+      if((*it).compare(0,szGrp,ExtractGroupGrp::START)==0)
+        {
+          std::string grpName((*it).substr(szGrp));
+          if(mm->existsGroup(grpName))
+            {
+              std::vector<mcIdType> ids(mm->getFamiliesIdsOnGroup(grpName));
+              famIds.insert(ids.begin(),ids.end());
+            }
+        }
+      else if((*it).compare(0,szFam,ExtractGroupFam::START)==0)
+        {
+          std::string famName((*it).substr(szFam));
+          famName=famName.substr(0,famName.find(MEDFileFieldRepresentationLeavesArrays::ZE_SEP));
+          if(mm->existsFamily(famName))
+            famIds.insert(mm->getFamilyId(famName));
+        }
+    }
+  if(famIds.empty())
+    return false;
+  if(*famIds.rbegin()>0)
+    {
+      std::cerr << "MEDFileFieldRepresentationTree::ComputeCellsLyingOn : families of nodes selected on mesh \"" << mm->getName() << "\" ! It is loaded entirely." << std::endl;
+      return false;
+    }
+  std::vector<mcIdType> famIdsV(famIds.begin(),famIds.end());
+  std::vector<int> levs(mm->getNonEmptyLevels());
+  for(std::vector<int>::const_iterator lev=levs.begin();lev!=levs.end();lev++)
+    {
+      const DataArrayIdType *famArr(mm->getFamilyFieldAtLevel(*lev));
+      std::vector<mcIdType> distribOfTypes(mm->getDistributionOfTypes(*lev));
+      mcIdType start(0);
+      for(std::size_t i=0;i<distribOfTypes.size()/3;i++)
+        {
+          INTERP_KERNEL::NormalizedCellType gt((INTERP_KERNEL::NormalizedCellType)distribOfTypes[3*i]);
+          mcIdType nbCells(distribOfTypes[3*i+1]);
+          std::vector<mcIdType> ids;
+          if(famArr)
+            {
+              MCAuto<DataArrayIdType> famsOfType(famArr->selectByTupleIdSafeSlice(start,start+nbCells,1));
+              MCAuto<DataArrayIdType> idsOfType(famsOfType->findIdsEqualList(famIdsV.data(),famIdsV.data()+famIdsV.size()));
+              ids.assign(idsOfType->begin(),idsOfType->end());
+            }
+          else if(famIds.find(0)!=famIds.end())
+            {// no family field means that all cells are on family 0
+              ids.resize(nbCells);
+              std::iota(ids.begin(),ids.end(),0);
+            }
+          if(!ids.empty())
+            distrib[gt]=ids;
+          start+=nbCells;
+        }
+    }
+  return !distrib.empty();
+}
+
 void MEDFileFieldRepresentationTree::removeEmptyLeaves()
 {
   std::vector< std::vector< std::vector< MEDFileFieldRepresentationLeaves > > > newSD;
@@ -1377,67 +2494,79 @@ std::vector<double> MEDFileFieldRepresentationTree::getTimeSteps(int& lev0, cons
   return leaf.getTimeSteps(tk);
 }
 
+/*!
+ * Returns a key identifying the dataset that buildVTKInstance would return if called with the same arguments.
+ * The key depends on the activated leaf, on the activated arrays in it and on the time step (std) or the time flags (mode) requested.
+ */
+std::string MEDFileFieldRepresentationTree::getKeyOfVTKInstance(bool isStdOrMode, double timeReq, const TimeKeeper& tk, bool debugArrays) const
+{
+  int lev0,lev1,lev2;
+  const MEDFileFieldRepresentationLeaves& leaf(getTheSingleActivated(lev0,lev1,lev2));
+  std::ostringstream oss; oss << lev0 << "/" << lev1 << "/" << lev2 << "/" << leaf.getKeyOfActivatedArrays() << "/" << debugArrays << "/" << _precision.getKey() << "/";
+  if(!isStdOrMode)
+    oss << "STD" << leaf.getTimeStepsIndex(tk).locate(timeReq,false);
+  else
+    {
+      std::vector<bool> v(tk.getTheVectOfBool());
+      oss << "MODE";
+      for(std::vector<bool>::const_iterator it=v.begin();it!=v.end();it++)
+        oss << ((*it)?"1":"0");
+      oss << "/" << _mode_memory_limit_in_mb << "/" << _pack_modes;
+    }
+  return oss.str();
+}
+
 vtkDataSet *MEDFileFieldRepresentationTree::buildVTKInstance(bool isStdOrMode, double timeReq, std::string& meshName, const TimeKeeper& tk, bool debugArrays, ExportedTinyInfo *internalInfo) const
 {
   int lev0,lev1,lev2;
   const MEDFileFieldRepresentationLeaves& leaf(getTheSingleActivated(lev0,lev1,lev2));
   meshName=leaf.getMeshName();
-  std::vector<double> ts(leaf.getTimeSteps(tk));
-  std::size_t zeTimeId(0);
-  if(ts.size()!=1)
-    {
-      std::vector<double> ts2(ts.size());
-      std::transform(ts.begin(),ts.end(),ts2.begin(),std::bind(std::plus<double>(),std::placeholders::_1,-timeReq));
-      std::transform(ts2.begin(),ts2.end(),ts2.begin(),[](double c) {return fabs(c);});
-      zeTimeId=std::distance(ts2.begin(),std::find_if(ts2.begin(),ts2.end(),std::bind(std::less<double>(),std::placeholders::_1,1e-14)));
-    }
-  //2nd chance
-  if(zeTimeId==ts.size())
-    zeTimeId=std::distance(ts.begin(),std::find(ts.begin(),ts.end(),timeReq));
-  if(zeTimeId==ts.size())
-    {//OK the time requested does not fit time series given to ParaView. It is typically the case if more than one MEDReader instance are created or TimeInspector in real time mode.
-      //In this case the default behaviour is taken. Keep the highest time step in this lower than timeReq.
-      int pos(-1);
-      double valAttachedToPos(-std::numeric_limits<double>::max());
-      for(std::size_t i=0;i<ts.size();i++)
-        {
-          if(ts[i]<timeReq)
-            {
-              if(ts[i]>valAttachedToPos)
-                {
-                  pos=(int)i;
-                  valAttachedToPos=ts[i];
-                }
-            }
-        }
-      if(pos==-1)
-        {// timeReq is lower than all time steps (ts). So let's keep the lowest time step greater than timeReq.
-          valAttachedToPos=std::numeric_limits<double>::max();
-          for(std::size_t i=0;i<ts.size();i++)
-            {
-              if(ts[i]<valAttachedToPos)
-                {
-                  pos=(int)i;
-                  valAttachedToPos=ts[i];
-                }
-            }
-        }
-      zeTimeId=pos;
-      std::ostringstream oss; oss.precision(15); oss << "request for time " << timeReq << " but not in ";
-      std::copy(ts.begin(),ts.end(),std::ostream_iterator<double>(oss,","));
-      oss << " ! Keep time " << valAttachedToPos << " at pos #" << zeTimeId;
-      std::cerr << oss.str() << std::endl;
-    }
+  bindLeafIfNeeded(leaf);
+  computePartsOfMeshIfNeeded(meshName);
+  const MEDTimeStepsIndex& ts(leaf.getTimeStepsIndex(tk));
+  std::size_t zeTimeId(ts.locate(timeReq,true));
   MEDTimeReq *tr(0);
   if(!isStdOrMode)
     tr=new MEDStdTimeReq((int)zeTimeId);
   else
-    tr=new MEDModeTimeReq(tk.getTheVectOfBool(),tk.getPostProcessedTime());
-  vtkDataSet *ret(leaf.buildVTKInstanceNoTimeInterpolation(tr,_fields,_ms,debugArrays,internalInfo));
+    tr=new MEDModeTimeReq(tk.getTheVectOfBool(),ts.getTimeSteps(),((std::size_t)_mode_memory_limit_in_mb)*1024*1024,_pack_modes);
+  vtkDataSet *ret(leaf.buildVTKInstanceNoTimeInterpolation(tr,_fields,_ms,debugArrays,_precision,_nb_of_threads,internalInfo));
+  _modes_truncated=tr->isTruncated();
   delete tr;
   return ret;
 }
 
+/*!
+ * Gives to \a prefetcher the activated leaf and the position of the time step requested to let it load the next ones.
+ * Nothing is prefetched in mode (\a isStdOrMode true) since all the time steps are already loaded by buildVTKInstance.
+ * When the prefetch is stopped, the arrays prefetched for the time steps of the current request (the selected modes or the requested
+ * time step) are kept since the dataset just built shares them.
+ * \a prefetcher is expected to be suspended.
+ */
+void MEDFileFieldRepresentationTree::schedulePrefetch(MEDTimeStepsPrefetcher& prefetcher, bool isStdOrMode, double timeReq, const TimeKeeper& tk) const
+{
+  int lev0,lev1,lev2;
+  const MEDFileFieldRepresentationLeaves& leaf(getTheSingleActivated(lev0,lev1,lev2));
+  std::size_t zeTimeId(leaf.getTimeStepsIndex(tk).locate(timeReq,false));
+  if(isStdOrMode || prefetcher.getDepth()<=0)
+    {
+      std::vector<int> used;
+      if(isStdOrMode)
+        {
+          std::vector<bool> v(tk.getTheVectOfBool());
+          for(std::size_t i=0;i<v.size();i++)
+            if(v[i])
+              used.push_back((int)i);
+        }
+      else
+        used.push_back((int)zeTimeId);
+      prefetcher.cancel(used);
+      return ;
+    }
+  bindLeafIfNeeded(leaf);
+  prefetcher.resume(&leaf,(int)zeTimeId);
+}
+
 const MEDFileFieldRepresentationLeaves& MEDFileFieldRepresentationTree::getTheSingleActivated(int& lev0, int& lev1, int& lev2) const
 {
   int nbOfActivated(0);
@@ -1690,7 +2819,7 @@ std::vector<double> TimeKeeper::getTimeStepsRegardingPolicy0(const std::vector<
     return processedUsingPairOfIds(tsPairs);
   if(s.size()!=sz)
     return processedUsingPairOfIds(tsPairs);
-  _postprocessed_time=ts;
+  _postprocessed_time.assign(ts);
   return getPostProcessedTime();
 }
 
@@ -1713,8 +2842,7 @@ std::vector<double> TimeKeeper::getTimeStepsRegardingPolicy1(const std::vector<
 
 int TimeKeeper::getTimeStepIdFrom(double timeReq) const
 {
-  std::size_t pos(std::distance(_postprocessed_time.begin(),std::find(_postprocessed_time.begin(),_postprocessed_time.end(),timeReq)));
-  return (int)pos;
+  return (int)_postprocessed_time.find(timeReq);
 }
 
 void TimeKeeper::printSelf(std::ostream& oss) const
@@ -1743,24 +2871,25 @@ std::vector<double> TimeKeeper::processedUsingPairOfIds(const std::vector< std::
   std::set<int> s0,s1;
   for(std::size_t i=0;i<sz;i++)
     { s0.insert(tsPairs[i].first); s1.insert(tsPairs[i].second); }
+  std::vector<double> ts(sz);
   if(s0.size()==sz)
     {
-      _postprocessed_time.resize(sz);
       for(std::size_t i=0;i<sz;i++)
-        _postprocessed_time[i]=(double)tsPairs[i].first;
+        ts[i]=(double)tsPairs[i].first;
+      _postprocessed_time.assign(ts);
       return getPostProcessedTime();
     }
   if(s1.size()==sz)
     {
-      _postprocessed_time.resize(sz);
       for(std::size_t i=0;i<sz;i++)
-        _postprocessed_time[i]=(double)tsPairs[i].second;
+        ts[i]=(double)tsPairs[i].second;
+      _postprocessed_time.assign(ts);
       return getPostProcessedTime();
     }
   //TimeKeeper::processedUsingPairOfIds : you are not a lucky guy ! All your time steps info in MEDFile are not discriminant taken one by one !
-  _postprocessed_time.resize(sz);
   for(std::size_t i=0;i<sz;i++)
-    _postprocessed_time[i]=(double)i;
+    ts[i]=(double)i;
+  _postprocessed_time.assign(ts);
   return getPostProcessedTime();
 }
 
@@ -23,12 +23,21 @@
 
 #include "MEDFileMesh.hxx"
 #include "MEDFileField.hxx"
+#include "MEDFileStructureIndex.hxx"
 #include "MEDLoaderForPV.h"
 
 #include "vtkType.h"
+#include "vtkSmartPointer.h"
 
+#ifdef MEDREADER_USE_MPI
+  #include <mpi.h>
+#endif
+
+#include <atomic>
 #include <vector>
 #include <map>
+#include <set>
+#include <unordered_map>
 
 class vtkQuadratureSchemeDefinition;
 class vtkMutableDirectedGraph;
@@ -43,6 +52,7 @@ class vtkDataSet;
 
 class TimeKeeper;
 class MEDTimeReq;
+class MEDTimeStepsPrefetcher;
 class ExportedTinyInfo;
 
 class ELGACmp
@@ -65,22 +75,90 @@ private:
   mutable std::vector< std::vector< std::pair< vtkQuadratureSchemeDefinition *, unsigned char > > > _defs;
 };
 
+/*!
+ * Precision of the floating point arrays (coordinates and FLOAT64 fields) given to VTK.
+ * In single precision, the FLOAT64 fields whose names are in the opt-out list are kept in double precision.
+ */
+class MEDLOADERFORPV_EXPORT MEDFloatingPointPrecision
+{
+public:
+  MEDFloatingPointPrecision():_single(false) { }
+  void setSinglePrecision(bool single) { _single=single; }
+  bool isSinglePrecision() const { return _single; }
+  void setDoublePrecisionArrays(const std::set<std::string>& names) { _double_arrays=names; }
+  bool isKeptInDoublePrecision(const std::string& fieldName) const { return !_single || _double_arrays.find(fieldName)!=_double_arrays.end(); }
+  std::string getKey() const;
+private:
+  bool _single;
+  std::set<std::string> _double_arrays;
+};
+
+/*!
+ * Time steps of a time series sorted once to locate a requested time by binary search. Time steps are not expected to be sorted.
+ */
+class MEDLOADERFORPV_EXPORT MEDTimeStepsIndex
+{
+public:
+  void assign(const std::vector<double>& ts);
+  const std::vector<double>& getTimeSteps() const { return _ts; }
+  std::size_t locate(double timeReq, bool verbose) const;
+  std::size_t find(double timeReq) const;
+private:
+  std::vector<double> _ts;
+  //! positions in _ts sorted by increasing time. Positions of equal times are kept in increasing order.
+  std::vector<std::size_t> _sorted_ids;
+};
+
+/*!
+ * One time step of a MEDFileFieldRepresentationLeavesArrays read and converted to the VTK layout, waiting to be added to a dataset.
+ */
+class MEDFileFieldRepresentationLeavesArraysTS
+{
+public:
+  MEDFileFieldRepresentationLeavesArraysTS():_crude_arr(0),_loaded_here(false) { }
+public:
+  //! null if the time step has been skipped (memory limit reached).
+  MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeField1TS> _f1ts;
+  //! array in _f1ts. If equal to _arr, VTK has not the ownership of the values.
+  MEDCoupling::DataArray *_crude_arr;
+  MEDCoupling::MCAuto<MEDCoupling::DataArray> _arr;
+  //! true if values of _f1ts have been read by buildDataArrays. Nobody else refers to them.
+  bool _loaded_here;
+};
+
 class MEDLOADERFORPV_EXPORT MEDFileFieldRepresentationLeavesArrays : public MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS>
 {
 public:
   MEDFileFieldRepresentationLeavesArrays();
   MEDFileFieldRepresentationLeavesArrays(const MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS>& arr);
+  MEDFileFieldRepresentationLeavesArrays(const MEDFileStructureIndexArray& desc, const std::string& meshName);
   MEDFileFieldRepresentationLeavesArrays& operator=(const MEDFileFieldRepresentationLeavesArrays& other);
+  void bind(const MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS>& arr, int nbOfTS);
+  void fillIndexArray(MEDFileStructureIndexArray& desc) const;
   int getId() const;
   void setId(int& id) const;
   void feedSIL(vtkMutableDirectedGraph* sil, vtkIdType root, vtkVariantArray *edge, std::vector<std::string>& names) const;
   void computeFullNameInLeaves(const std::string& tsName, const std::string& meshName, const std::string& comSupStr) const;
   bool getStatus() const;
   bool setStatus(bool status) const;
+  void setSelectedComponents(const std::vector<std::string>& compos) const;
+  const std::vector<std::string>& getSelectedComponents() const { return _selected_components; }
   std::string getZeName() const;
   const char *getZeNameC() const;
-  void appendFields(const MEDTimeReq *tr, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshStruct *mst, vtkDataSet *ds, ExportedTinyInfo *internalInfo) const;
+  const std::string& getFieldName() const { return _field_name; }
+  const std::string& getMeshName() const { return _mesh_name; }
+  void appendFields(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshStruct *mst, vtkDataSet *ds, ExportedTinyInfo *internalInfo) const;
+  std::vector<int> getTimeStepsPositions(const MEDTimeReq *tr) const;
+  std::vector<MEDFileFieldRepresentationLeavesArraysTS> buildDataArrays(const std::vector<int>& tsPos, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshStruct *mst) const;
+  void assignDataArrays(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const MEDCoupling::MEDFileFieldGlobsReal *globs, vtkDataSet *ds, ExportedTinyInfo *internalInfo, const std::vector<MEDFileFieldRepresentationLeavesArraysTS>& arrs) const;
   void appendELGAIfAny(vtkDataSet *ds) const;
+  bool appendReusableArrayIfAny(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const std::vector<int>& tsPos, vtkDataSet *ds) const;
+  void keepReusableArray(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const std::vector<int>& tsPos, vtkDataSet *ds) const;
+private:
+  std::string buildKeyOfReusableArray(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const std::vector<int>& tsPos, std::string& arrName, bool& onCells) const;
+  bool assignPackedDataArrays(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, vtkDataSet *ds, const std::vector<MEDFileFieldRepresentationLeavesArraysTS>& arrs) const;
+  std::vector<std::size_t> getIdsOfSelectedComponents(const MEDCoupling::DataArray *arr) const;
+  static std::string BuildZeName(const MEDCoupling::MEDFileAnyTypeFieldMultiTS *arr);
 public:
   static const char ZE_SEP[];
   static const char TS_STR[];
@@ -95,7 +173,19 @@ private:
   mutable int _id;
   mutable std::string _ze_name;
   mutable std::string _ze_full_name;
+  //! name of the field and of its mesh. Known before the field is bound if the tree is built from a MEDFileStructureIndex.
+  std::string _field_name;
+  std::string _mesh_name;
+  //! true if the field is the one built from the mesh (see MEDFileFieldRepresentationTree::IsFieldMeshRegardingInfo).
+  bool _mesh_info;
   ELGACmp _elga_cmp;
+  //! last array built for a single time step on cells or on nodes. Added as is to the next datasets as long as its key does not change.
+  mutable vtkSmartPointer<vtkDataArray> _reusable_arr;
+  //! key (see buildKeyOfReusableArray) of _reusable_arr.
+  mutable std::string _reusable_key;
+  mutable bool _reusable_on_cells;
+  //! names (or positions) of the components given to VTK. Empty means all the components.
+  mutable std::vector<std::string> _selected_components;
 };
 
 class MEDLOADERFORPV_EXPORT MEDFileFieldRepresentationLeaves
@@ -104,34 +194,58 @@ public:
   MEDFileFieldRepresentationLeaves();
   MEDFileFieldRepresentationLeaves(const std::vector< MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS> >& arr,
                                    const MEDCoupling::MCAuto<MEDCoupling::MEDFileFastCellSupportComparator>& fsp);
+  MEDFileFieldRepresentationLeaves(const MEDFileStructureIndexLeaf& desc);
   ~MEDFileFieldRepresentationLeaves();
   bool empty() const;
+  bool isBound() const;
+  void bind(const std::vector< MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeFieldMultiTS> >& arr,
+            const MEDCoupling::MCAuto<MEDCoupling::MEDFileFastCellSupportComparator>& fsp);
+  MEDFileStructureIndexLeaf buildIndexLeaf(const MEDCoupling::MEDFileMeshes *ms) const;
   void setId(int& id) const;
   std::string getMeshName() const;
   int getNumberOfArrays() const;
   int getNumberOfTS() const;
-  void feedSIL(const MEDCoupling::MEDFileMeshes *ms, const std::string& meshName, vtkMutableDirectedGraph* sil, vtkIdType root, vtkVariantArray *edge, std::vector<std::string>& names) const;
+  void feedSIL(const MEDCoupling::MEDFileMeshes *ms, vtkMutableDirectedGraph* sil, vtkIdType root, vtkVariantArray *edge, std::vector<std::string>& names) const;
+  std::vector<INTERP_KERNEL::NormalizedCellType> getGeoTypes(const MEDCoupling::MEDFileMeshes *ms) const;
   void computeFullNameInLeaves(const std::string& tsName, const std::string& meshName, const std::string& comSupStr) const;
   bool containId(int id) const;
   bool containZeName(const char *name, int& id) const;
+  void feedIndexOfArrays(std::unordered_map<std::string,int>& idOfNames, std::vector<const MEDFileFieldRepresentationLeavesArrays *>& arrOfIds) const;
   void dumpState(std::map<std::string,bool>& status) const;
   bool isActivated() const;
+  std::string getKeyOfActivatedArrays() const;
   void printMySelf(std::ostream& os) const;
   void activateAllArrays() const;
   const MEDFileFieldRepresentationLeavesArrays& getLeafArr(int id) const;
+  const MEDCoupling::MEDFileAnyTypeFieldMultiTS *getFieldAtPos(int pos) const;
   std::vector<double> getTimeSteps(const TimeKeeper& tk) const;
+  const MEDTimeStepsIndex& getTimeStepsIndex(const TimeKeeper& tk) const;
   std::vector< std::pair<int,int> > getTimeStepsInCoarseMEDFileFormat(std::vector<double>& ts) const;
   std::string getHumanReadableOverviewOfTS() const;
-  vtkDataSet *buildVTKInstanceNoTimeInterpolation(const MEDTimeReq *tr, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDFileMeshes *meshes, bool debugArrays, ExportedTinyInfo *internalInfo=0) const;
+  std::size_t prefetchTimeStep(int timeStepId, std::vector< MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeField1TS> >& loaded, const std::atomic<bool>& interrupt) const;
+  vtkDataSet *buildVTKInstanceNoTimeInterpolation(const MEDTimeReq *tr, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDFileMeshes *meshes, bool debugArrays, const MEDFloatingPointPrecision& precision, int nbOfThreads=1, ExportedTinyInfo *internalInfo=0) const;
 private:
   vtkUnstructuredGrid *buildVTKInstanceNoTimeInterpolationUnstructured(MEDCoupling::MEDUMeshMultiLev *mm) const;
   vtkRectilinearGrid *buildVTKInstanceNoTimeInterpolationCartesian(MEDCoupling::MEDCMeshMultiLev *mm) const;
   vtkStructuredGrid *buildVTKInstanceNoTimeInterpolationCurveLinear(MEDCoupling::MEDCurveLinearMeshMultiLev *mm) const;
-  void appendFields(const MEDTimeReq *tr, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshes *meshes, vtkDataSet *ds, ExportedTinyInfo *internalInfo=0) const;
+  void appendFields(const MEDTimeReq *tr, const MEDFloatingPointPrecision& precision, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshes *meshes, vtkDataSet *ds, int nbOfThreads, ExportedTinyInfo *internalInfo=0) const;
+  static std::vector< std::vector<MEDFileFieldRepresentationLeavesArraysTS> > BuildDataArrays(const std::vector<const MEDFileFieldRepresentationLeavesArrays *>& activated, const std::vector< std::vector<int> >& tsPos, const MEDCoupling::MEDFileFieldGlobsReal *globs, const MEDCoupling::MEDMeshMultiLev *mml, const MEDCoupling::MEDFileMeshStruct *mst, int nbOfThreads);
 private:
   std::vector<MEDFileFieldRepresentationLeavesArrays> _arrays;
   MEDCoupling::MCAuto<MEDCoupling::MEDFileFastCellSupportComparator> _fsp;
+  //! mesh and time steps of the fields of this. Read from the first field or from a MEDFileStructureIndex.
+  std::string _mesh_name;
+  std::string _dt_unit;
+  std::vector< std::pair<int,int> > _dtits;
+  std::vector<double> _times;
+  //! geometric types of the support read from a MEDFileStructureIndex. Used as long as _fsp is null.
+  std::vector<INTERP_KERNEL::NormalizedCellType> _geo_types;
   mutable vtkDataSet *_cached_ds;
+  //! true if the coordinates of _cached_ds are in single precision.
+  mutable bool _cached_ds_single_precision;
+  //! policy of the TimeKeeper used to compute _ts_index. -1 if not computed yet.
+  mutable int _ts_policy;
+  mutable MEDTimeStepsIndex _ts_index;
 };
 
 class MEDLOADERFORPV_EXPORT MEDFileFieldRepresentationTree
@@ -151,10 +265,33 @@ public:
   int getIdHavingZeName(const char *name) const;
   bool changeStatusOfAndUpdateToHaveCoherentVTKDataSet(int id, bool status) const;
   int getMaxNumberOfTimeSteps() const;
+  void setNumberOfThreads(int nbOfThreads) { _nb_of_threads=nbOfThreads>1?nbOfThreads:1; }
+  int getNumberOfThreads() const { return _nb_of_threads; }
+  void setStructureIndexEnabled(bool enabled) { _structure_index_enabled=enabled; }
+  bool isStructureIndexEnabled() const { return _structure_index_enabled; }
+  void setStructureIndexDirectory(const std::string& directory) { _structure_index_directory=directory; }
+  const std::string& getStructureIndexDirectory() const { return _structure_index_directory; }
+  void setModeMemoryLimitInMB(int limitInMB) { _mode_memory_limit_in_mb=limitInMB>0?limitInMB:0; }
+  int getModeMemoryLimitInMB() const { return _mode_memory_limit_in_mb; }
+  void setPackModes(bool pack) { _pack_modes=pack; }
+  bool areModesTruncated() const { return _modes_truncated; }
+  bool getPackModes() const { return _pack_modes; }
+  void setSinglePrecision(bool single) { _precision.setSinglePrecision(single); }
+  void setDoublePrecisionArrays(const std::set<std::string>& fieldNames) { _precision.setDoublePrecisionArrays(fieldNames); }
+  void setSelectedComponents(const std::map<std::string, std::vector<std::string> >& compos) const;
+  void setPartitioningStrategy(int strategy) { _partitioning_strategy=strategy; }
+  int getPartitioningStrategy() const { return _partitioning_strategy; }
+#ifdef MEDREADER_USE_MPI
+  void setCommunicator(MPI_Comm comm) { _comm=comm; }
+#endif
+  void setGroupsToLoad(const std::set<std::string>& entries) { _groups_to_load=entries; }
+  const std::set<std::string>& getGroupsToLoad() const { return _groups_to_load; }
   //
   std::string getDftMeshName() const;
   std::vector<double> getTimeSteps(int& lev0, const TimeKeeper& tk) const;
+  std::string getKeyOfVTKInstance(bool isStdOrMode, double timeReq, const TimeKeeper& tk, bool debugArrays) const;
   vtkDataSet *buildVTKInstance(bool isStdOrMode, double timeReq, std::string& meshName, const TimeKeeper& tk, bool debugArrays, ExportedTinyInfo *internalInfo=0) const;
+  void schedulePrefetch(MEDTimeStepsPrefetcher& prefetcher, bool isStdOrMode, double timeReq, const TimeKeeper& tk) const;
   void printMySelf(std::ostream& os) const;
   std::map<std::string,bool> dumpState() const;
   //non const methods
@@ -171,15 +308,58 @@ public:
 private:
   const MEDFileFieldRepresentationLeavesArrays& getLeafArr(int id) const;
   const MEDFileFieldRepresentationLeaves& getTheSingleActivated(int& lev0, int& lev1, int& lev2) const;
+  void computePartsOfMeshIfNeeded(const std::string& meshName) const;
+  void buildIndexOfLeavesArrays();
+  void loadFromIndex();
+  void saveIndex(const std::vector<MEDCoupling::MEDFileAnyTypeFieldMultiTS *>& fields, const std::vector<MEDFileStructureIndexArray>& sources) const;
+  void bindLeafIfNeeded(const MEDFileFieldRepresentationLeaves& leaf) const;
+  MEDCoupling::MEDFileMesh *loadMeshIfNeeded(const std::string& meshName) const;
+  MEDCoupling::MEDFileAnyTypeFieldMultiTS *loadFieldIfNeeded(const std::string& fieldName) const;
+  static bool LoadPartOfMeshesLyingOn(const char *fileName, MEDCoupling::MEDFileMeshes *ms, const std::set<std::string>& entries);
+  static bool ComputeCellsLyingOn(const MEDCoupling::MEDFileUMesh *mm, const std::set<std::string>& entries, std::map<INTERP_KERNEL::NormalizedCellType,std::vector<mcIdType> >& distrib);
   static MEDCoupling::MEDFileFields *BuildFieldFromMeshes(const MEDCoupling::MEDFileMeshes *ms);
   static void AppendFieldFromMeshes(const MEDCoupling::MEDFileMeshes *ms, MEDCoupling::MEDFileFields *ret);
   static std::string BuildAUniqueArrayNameForMesh(const std::string& meshName, const MEDCoupling::MEDFileFields *ret);
   static std::vector<std::string> SplitFieldNameIntoParts(const std::string& fullFieldName, char sep);
 private:
-  // 1st : timesteps, 2nd : meshName, 3rd : common support
-  std::vector< std::vector< std::vector< MEDFileFieldRepresentationLeaves > > > _data_structure;
-  MEDCoupling::MCAuto<MEDCoupling::MEDFileMeshes> _ms;
-  MEDCoupling::MCAuto<MEDCoupling::MEDFileFields> _fields;
+  // 1st : timesteps, 2nd : meshName, 3rd : common support. Mutable since the leaves of a tree loaded from an index are bound on first use.
+  mutable std::vector< std::vector< std::vector< MEDFileFieldRepresentationLeaves > > > _data_structure;
+  //! meshes and fields of the leaves. If the tree is loaded from an index, only the ones of the leaves already bound.
+  mutable MEDCoupling::MCAuto<MEDCoupling::MEDFileMeshes> _ms;
+  mutable MEDCoupling::MCAuto<MEDCoupling::MEDFileFields> _fields;
+  //! number of threads used to convert the activated arrays. 1 means serial.
+  int _nb_of_threads;
+  //! if true the grouping of fields is stored in and retrieved from an index file of the MED file (see MEDFileStructureIndex).
+  bool _structure_index_enabled;
+  //! directory of the index files. Empty means MEDFileStructureIndex::GetDefaultDirectory.
+  std::string _structure_index_directory;
+  //! in mode, time steps are no more loaded once this amount of memory has been used. 0 means unlimited.
+  int _mode_memory_limit_in_mb;
+  //! in mode, if true the time steps of a cell or node field are gathered into a single multi-component array.
+  bool _pack_modes;
+  //! true if the memory limit has prevented the last call to buildVTKInstance from loading all the selected modes.
+  mutable bool _modes_truncated;
+  //! precision of the coordinates and of the FLOAT64 fields given to VTK.
+  MEDFloatingPointPrecision _precision;
+  //! distribution of the cells over the MPI processes used by loadMainStructureOfFile (see MEDFileMeshesPartitioner::Strategy).
+  int _partitioning_strategy;
+#ifdef MEDREADER_USE_MPI
+  //! communicator of the processes reading the file in distributed mode (the one of the vtkMultiProcessController of the reader).
+  MPI_Comm _comm;
+#endif
+  //! groups and families (keys of ExtractGroupInternal) on which the meshes are loaded by loadMainStructureOfFile. Empty means whole meshes.
+  std::set<std::string> _groups_to_load;
+  //! MED file whose index is to be written by the next call to loadInMemory. Empty if none.
+  std::string _index_file_name;
+  //! MED file of the tree and its index if the tree has been loaded from it (see loadFromIndex). _index is empty otherwise.
+  std::string _file_name;
+  MEDFileStructureIndex _index;
+  //! id of each leaf array regarding its full name. Filled by loadInMemory.
+  std::unordered_map<std::string,int> _id_of_names;
+  //! leaf array of each id. Filled by loadInMemory.
+  std::vector<const MEDFileFieldRepresentationLeavesArrays *> _leaves_arrays_of_ids;
+  //! names of the unstructured meshes whose parts have not been computed yet.
+  mutable std::set<std::string> _meshes_without_parts;
 };
 
 class MEDLOADERFORPV_EXPORT TimeKeeper
@@ -190,7 +370,7 @@ public:
   void setPolicy(int policy) { _policy=policy; }
   std::vector<double> getTimeStepsRegardingPolicy(const std::vector< std::pair<int,int> >& tsPairs, const std::vector<double>& ts) const;
   int getTimeStepIdFrom(double timeReq) const;
-  std::vector<double> getPostProcessedTime() const { return _postprocessed_time; }
+  std::vector<double> getPostProcessedTime() const { return _postprocessed_time.getTimeSteps(); }
   void printSelf(std::ostream& oss) const;
   std::vector<bool> getTheVectOfBool() const;
   std::vector< std::pair<bool,std::string> >& getTimesFlagArray() { return _activated_ts; }
@@ -201,7 +381,7 @@ private:
   std::vector<double> processedUsingPairOfIds(const std::vector< std::pair<int,int> >& tsPairs) const;
 private:
   int _policy;
-  mutable std::vector<double> _postprocessed_time;
+  mutable MEDTimeStepsIndex _postprocessed_time;
   std::vector< std::pair<bool,std::string> > _activated_ts;
 };
 
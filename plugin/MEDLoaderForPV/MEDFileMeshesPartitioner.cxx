@@ -0,0 +1,276 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#include "MEDFileMeshesPartitioner.hxx"
+#include "MEDCouplingPartDefinition.hxx"
+#include "MEDCouplingUMesh.hxx"
+
+#ifdef MEDREADER_USE_MPI
+  #include "ParaMEDFileMesh.hxx"
+  #include <mpi.h>
+#endif
+
+#include <algorithm>
+#include <limits>
+#include <sstream>
+
+using namespace MEDCoupling;
+
+const int MEDFileMeshesPartitioner::NB_OF_BITS_OF_HISTOGRAM=16;
+
+const int MEDFileMeshesPartitioner::NB_OF_BITS_OF_REFINEMENT=8;
+
+static const int NB_OF_BITS_PER_DIM=21;
+
+static const int NB_OF_BITS_OF_CODES=3*NB_OF_BITS_PER_DIM;
+
+/*!
+ * Inserts two zero bits between each of the NB_OF_BITS_PER_DIM lowest bits of \a v.
+ */
+static std::uint64_t SpreadBits(std::uint64_t v)
+{
+  v&=0x1fffffULL;
+  v=(v | (v<<32)) & 0x1f00000000ffffULL;
+  v=(v | (v<<16)) & 0x1f0000ff0000ffULL;
+  v=(v | (v<<8))  & 0x100f00f00f00f00fULL;
+  v=(v | (v<<4))  & 0x10c30c30c30c30c3ULL;
+  v=(v | (v<<2))  & 0x1249249249249249ULL;
+  return v;
+}
+
+/*!
+ * Returns the Morton code (3*NB_OF_BITS_PER_DIM bits) of \a pt in the box \a bbox (xmin,xmax,ymin,ymax,zmin,zmax). Missing dimensions are set to 0.
+ */
+std::uint64_t MEDFileMeshesPartitioner::ComputeMortonCode(const double *pt, const double *bbox, int spaceDim)
+{
+  const std::uint64_t maxVal((1ULL<<NB_OF_BITS_PER_DIM)-1);
+  std::uint64_t ret(0);
+  for(int i=0;i<spaceDim && i<3;i++)
+    {
+      double delta(bbox[2*i+1]-bbox[2*i]),x(delta>0.?(pt[i]-bbox[2*i])/delta:0.);
+      x=std::min(std::max(x,0.),1.);
+      ret|=SpreadBits((std::uint64_t)(x*(double)maxVal))<<i;
+    }
+  return ret;
+}
+
+#ifdef MEDREADER_USE_MPI
+
+/*!
+ * Collective over \a comm. \a codes are the Morton codes of the cells of the current process. Returns for each of them the part (in [0,\a nbOfParts)) it belongs to.
+ * Parts are consecutive ranges of the curve : cut k is the code of the cell of global rank (k+1)*n/\a nbOfParts in the sorted codes of the n cells of all processes.
+ * A first histogram on the NB_OF_BITS_OF_HISTOGRAM most significant bits locates the bin of each cut. The bins containing a cut are then refined
+ * NB_OF_BITS_OF_REFINEMENT bits at a time until the cut falls at the start of a bin or until the exact code is known. In the latter case the cells
+ * having this code are split in the order of the ranks of the processes. So the numbers of cells of the parts differ by one at most.
+ */
+std::vector<int> MEDFileMeshesPartitioner::ComputePartsOfCells(const std::vector<std::uint64_t>& codes, int nbOfParts, MPI_Comm comm)
+{
+  std::vector<int> ret(codes.size(),0);
+  long long total((long long)codes.size());
+  MPI_Allreduce(MPI_IN_PLACE,&total,1,MPI_LONG_LONG,MPI_SUM,comm);
+  if(total==0 || nbOfParts<=1)
+    return ret;
+  std::size_t nbOfCuts(nbOfParts-1);
+  // for each cut : global rank of the first cell after it, start of the range of codes containing it and number of cells before this range
+  std::vector<long long> targets(nbOfCuts),below(nbOfCuts,0);
+  std::vector<std::uint64_t> cuts(nbOfCuts,0);
+  std::vector<bool> resolved(nbOfCuts,false);
+  for(std::size_t k=0;k<nbOfCuts;k++)
+    targets[k]=((long long)(k+1)*total)/nbOfParts;
+  int nbOfKnownBits(0);
+  while(true)
+    {
+      // ranges of the cuts not resolved yet. All have nbOfKnownBits known bits so they are either the same or disjoint.
+      std::vector<std::uint64_t> ranges;
+      for(std::size_t k=0;k<nbOfCuts;k++)
+        if(!resolved[k])
+          ranges.push_back(cuts[k]);
+      if(ranges.empty())
+        break;
+      std::sort(ranges.begin(),ranges.end());
+      ranges.erase(std::unique(ranges.begin(),ranges.end()),ranges.end());
+      int nbOfBitsOfPass(std::min(nbOfKnownBits==0?NB_OF_BITS_OF_HISTOGRAM:NB_OF_BITS_OF_REFINEMENT,NB_OF_BITS_OF_CODES-nbOfKnownBits));
+      int shift(NB_OF_BITS_OF_CODES-nbOfKnownBits-nbOfBitsOfPass);
+      std::size_t nbOfBins(std::size_t(1)<<nbOfBitsOfPass);
+      std::vector<long long> histogram(ranges.size()*nbOfBins,0);
+      for(std::vector<std::uint64_t>::const_iterator it=codes.begin();it!=codes.end();it++)
+        {
+          std::vector<std::uint64_t>::const_iterator range(std::upper_bound(ranges.begin(),ranges.end(),*it));
+          if(range==ranges.begin())
+            continue;
+          range--;
+          if(nbOfKnownBits>0 && ((*it)>>(NB_OF_BITS_OF_CODES-nbOfKnownBits))!=((*range)>>(NB_OF_BITS_OF_CODES-nbOfKnownBits)))
+            continue;
+          histogram[(std::size_t)(range-ranges.begin())*nbOfBins+(std::size_t)(((*it)>>shift)&(nbOfBins-1))]++;
+        }
+      MPI_Allreduce(MPI_IN_PLACE,histogram.data(),(int)histogram.size(),MPI_LONG_LONG,MPI_SUM,comm);
+      for(std::size_t k=0;k<nbOfCuts;k++)
+        {
+          if(resolved[k])
+            continue;
+          const long long *hist(histogram.data()+(std::size_t)(std::lower_bound(ranges.begin(),ranges.end(),cuts[k])-ranges.begin())*nbOfBins);
+          std::size_t bin(0);
+          for(;bin+1<nbOfBins && below[k]+hist[bin]<=targets[k];bin++)
+            below[k]+=hist[bin];
+          cuts[k]|=((std::uint64_t)bin)<<shift;
+          resolved[k]=below[k]==targets[k] || shift==0;
+        }
+      nbOfKnownBits+=nbOfBitsOfPass;
+    }
+  // cells having the code of a cut : the first targets[k]-below[k] ones in the order of the ranks are before the cut
+  std::vector<long long> nbOfCellsOnCuts(nbOfCuts,0),offsets(nbOfCuts,0);
+  std::vector<std::uint64_t> sortedCodes(codes);
+  std::sort(sortedCodes.begin(),sortedCodes.end());
+  for(std::size_t k=0;k<nbOfCuts;k++)
+    {
+      std::pair<std::vector<std::uint64_t>::const_iterator,std::vector<std::uint64_t>::const_iterator> eq(std::equal_range(sortedCodes.begin(),sortedCodes.end(),cuts[k]));
+      nbOfCellsOnCuts[k]=(long long)(eq.second-eq.first);
+    }
+  MPI_Exscan(nbOfCellsOnCuts.data(),offsets.data(),(int)nbOfCuts,MPI_LONG_LONG,MPI_SUM,comm);
+  int rank(0);
+  MPI_Comm_rank(comm,&rank);
+  if(rank==0)
+    std::fill(offsets.begin(),offsets.end(),0);
+  std::map<std::uint64_t,long long> seenOnCuts;
+  for(std::size_t i=0;i<codes.size();i++)
+    {
+      std::size_t part(std::lower_bound(cuts.begin(),cuts.end(),codes[i])-cuts.begin());
+      if(part<nbOfCuts && cuts[part]==codes[i])
+        {
+          long long rankOnCut(offsets[part]+seenOnCuts[codes[i]]++);
+          while(part<nbOfCuts && cuts[part]==codes[i] && rankOnCut>=targets[part]-below[part])
+            part++;
+        }
+      ret[i]=(int)part;
+    }
+  return ret;
+}
+
+/*!
+ * Collective over \a comm. \a mm is the slice of a mesh loaded by the current process. Returns for each geometric type the ids (relative to the type)
+ * of the cells of the part of the current process along the space filling curve.
+ */
+std::map<INTERP_KERNEL::NormalizedCellType,std::vector<mcIdType> > MEDFileMeshesPartitioner::ComputeDistribution(const MEDFileUMesh *mm, MPI_Comm comm)
+{
+  int nbOfParts(1);
+  MPI_Comm_size(comm,&nbOfParts);
+  // bounding box of the whole mesh
+  const DataArrayDouble *coords(mm->getCoords());
+  int spaceDim(coords?(int)coords->getNumberOfComponents():0);
+  double locMin[3]={0.,0.,0.},locMax[3]={0.,0.,0.},glbMin[3],glbMax[3],bbox[6];
+  for(int j=0;j<3;j++)
+    {
+      locMin[j]=std::numeric_limits<double>::max();
+      locMax[j]=-std::numeric_limits<double>::max();
+    }
+  if(coords)
+    {
+      const double *pt(coords->begin());
+      for(mcIdType i=0;i<coords->getNumberOfTuples();i++,pt+=spaceDim)
+        for(int j=0;j<spaceDim && j<3;j++)
+          {
+            locMin[j]=std::min(locMin[j],pt[j]);
+            locMax[j]=std::max(locMax[j],pt[j]);
+          }
+    }
+  MPI_Allreduce(locMin,glbMin,3,MPI_DOUBLE,MPI_MIN,comm);
+  MPI_Allreduce(locMax,glbMax,3,MPI_DOUBLE,MPI_MAX,comm);
+  for(int j=0;j<3;j++)
+    { bbox[2*j]=glbMin[j]; bbox[2*j+1]=glbMax[j]; }
+  // Morton code of each cell of the slice, whatever its level
+  std::vector<INTERP_KERNEL::NormalizedCellType> types;
+  std::vector<mcIdType> globalIds;
+  std::vector<std::uint64_t> codes;
+  std::vector<int> levs(mm->getNonEmptyLevels());
+  for(std::vector<int>::const_iterator lev=levs.begin();lev!=levs.end();lev++)
+    {
+      MCAuto<MEDCouplingUMesh> m(mm->getMeshAtLevel(*lev));
+      MCAuto<DataArrayDouble> centers(m->computeCellCenterOfMass());
+      const double *center(centers->begin());
+      std::vector<INTERP_KERNEL::NormalizedCellType> gts(mm->getGeoTypesAtLevel(*lev));
+      for(std::vector<INTERP_KERNEL::NormalizedCellType>::const_iterator gt=gts.begin();gt!=gts.end();gt++)
+        {
+          const PartDefinition *pd(mm->getPartDefAtLevel(*lev,*gt));
+          if(!pd)
+            throw INTERP_KERNEL::Exception("MEDFileMeshesPartitioner::ComputeDistribution : mesh not loaded by slices !");
+          MCAuto<DataArrayIdType> ids(pd->toDAI());
+          for(const mcIdType *id=ids->begin();id!=ids->end();id++,center+=spaceDim)
+            {
+              types.push_back(*gt);
+              globalIds.push_back(*id);
+              codes.push_back(ComputeMortonCode(center,bbox,spaceDim));
+            }
+        }
+    }
+  std::vector<int> parts(ComputePartsOfCells(codes,nbOfParts,comm));
+  // each cell (type, id) is sent to the process owning its part
+  std::vector< std::vector<long long> > toSend(nbOfParts);
+  for(std::size_t i=0;i<codes.size();i++)
+    {
+      std::vector<long long>& buf(toSend[parts[i]]);
+      buf.push_back((long long)types[i]);
+      buf.push_back((long long)globalIds[i]);
+    }
+  std::vector<int> sendCounts(nbOfParts),recvCounts(nbOfParts),sendDispls(nbOfParts,0),recvDispls(nbOfParts,0);
+  for(int i=0;i<nbOfParts;i++)
+    sendCounts[i]=(int)toSend[i].size();
+  MPI_Alltoall(sendCounts.data(),1,MPI_INT,recvCounts.data(),1,MPI_INT,comm);
+  for(int i=1;i<nbOfParts;i++)
+    {
+      sendDispls[i]=sendDispls[i-1]+sendCounts[i-1];
+      recvDispls[i]=recvDispls[i-1]+recvCounts[i-1];
+    }
+  std::vector<long long> sendBuf,recvBuf(recvDispls[nbOfParts-1]+recvCounts[nbOfParts-1]);
+  sendBuf.reserve(sendDispls[nbOfParts-1]+sendCounts[nbOfParts-1]);
+  for(int i=0;i<nbOfParts;i++)
+    sendBuf.insert(sendBuf.end(),toSend[i].begin(),toSend[i].end());
+  MPI_Alltoallv(sendBuf.data(),sendCounts.data(),sendDispls.data(),MPI_LONG_LONG,recvBuf.data(),recvCounts.data(),recvDispls.data(),MPI_LONG_LONG,comm);
+  std::map<INTERP_KERNEL::NormalizedCellType,std::vector<mcIdType> > ret;
+  for(std::size_t i=0;i+1<recvBuf.size();i+=2)
+    ret[(INTERP_KERNEL::NormalizedCellType)recvBuf[i]].push_back((mcIdType)recvBuf[i+1]);
+  for(std::map<INTERP_KERNEL::NormalizedCellType,std::vector<mcIdType> >::iterator it=ret.begin();it!=ret.end();it++)
+    std::sort((*it).second.begin(),(*it).second.end());
+  return ret;
+}
+
+/*!
+ * Collective over \a comm. Returns the meshes of \a fileName where unstructured meshes are restricted to the part of the current process along the space filling curve.
+ * Other meshes are loaded by slices.
+ */
+MEDFileMeshes *MEDFileMeshesPartitioner::LoadAlongSpaceFillingCurve(const char *fileName, MPI_Comm comm)
+{
+  int iPart(0),nbOfParts(1);
+  MPI_Comm_rank(comm,&iPart);
+  MPI_Comm_size(comm,&nbOfParts);
+  MCAuto<MEDFileMeshes> ms(ParaMEDFileMeshes::New(iPart,nbOfParts,fileName));
+  int nbMeshes(ms->getNumberOfMeshes());
+  for(int i=0;i<nbMeshes;i++)
+    {
+      const MEDFileUMesh *mm(dynamic_cast<const MEDFileUMesh *>(ms->getMeshAtPos(i)));
+      if(!mm)
+        continue;
+      std::map<INTERP_KERNEL::NormalizedCellType,std::vector<mcIdType> > distrib(ComputeDistribution(mm,comm));
+      MCAuto<MEDFileUMesh> part(MEDFileUMesh::LoadPartOfFromUserDistrib(fileName,mm->getName(),distrib,mm->getIteration(),mm->getOrder()));
+      ms->setMeshAtPos(i,part);
+    }
+  return ms.retn();
+}
+
+#endif
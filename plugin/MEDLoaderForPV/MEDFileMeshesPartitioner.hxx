@@ -0,0 +1,64 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#ifndef __MEDFILEMESHESPARTITIONER_HXX__
+#define __MEDFILEMESHESPARTITIONER_HXX__
+
+#include "MEDLoaderForPV.h"
+#include "MEDFileMesh.hxx"
+
+#ifdef MEDREADER_USE_MPI
+  #include <mpi.h>
+#endif
+
+#include <cstdint>
+#include <map>
+#include <vector>
+
+/*!
+ * Distribution over MPI processes of the cells of the unstructured meshes of a MED file, used by MEDFileFieldRepresentationTree::loadMainStructureOfFile.
+ * SLICES is the historical one : contiguous ranges of cell ids per geometric type (see ParaMEDFileMeshes).
+ * SPACE_FILLING_CURVE sorts the cells along a Morton (Z-order) curve on their centers of mass and cuts the curve into parts having the same number of cells
+ * (up to one). Parts are compact, so interfaces between processes and ghost layers are smaller.
+ * It is computed in parallel : each process starts from its slice. Histograms of the Morton codes reduced over all processes locate the cuts of the curve :
+ * the first one on the most significant bits, then the bins containing a cut are refined until the cuts fall at exact quantiles of the codes. So the
+ * balance does not depend on how the cells are spread in space. Finally the cells are exchanged so that each process reads from the file only the cells
+ * (and the nodes) of its part.
+ * All the collective methods work on the communicator given by the caller (the one of the vtkMultiProcessController of the reader).
+ */
+class MEDLOADERFORPV_EXPORT MEDFileMeshesPartitioner
+{
+public:
+  enum Strategy { SLICES=0, SPACE_FILLING_CURVE=1 };
+  static std::uint64_t ComputeMortonCode(const double *pt, const double *bbox, int spaceDim);
+#ifdef MEDREADER_USE_MPI
+  static MEDCoupling::MEDFileMeshes *LoadAlongSpaceFillingCurve(const char *fileName, MPI_Comm comm);
+  static std::vector<int> ComputePartsOfCells(const std::vector<std::uint64_t>& codes, int nbOfParts, MPI_Comm comm);
+private:
+  static std::map<INTERP_KERNEL::NormalizedCellType,std::vector<mcIdType> > ComputeDistribution(const MEDCoupling::MEDFileUMesh *mm, MPI_Comm comm);
+#endif
+public:
+  //! number of most significant bits of the Morton codes used to build the first histogram.
+  static const int NB_OF_BITS_OF_HISTOGRAM;
+  //! number of bits added at each refinement of the bins containing a cut.
+  static const int NB_OF_BITS_OF_REFINEMENT;
+};
+
+#endif
@@ -0,0 +1,322 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#include "MEDFileStructureIndex.hxx"
+
+#include "vtksys/SystemTools.hxx"
+
+#include <fstream>
+#include <functional>
+#include <iterator>
+#include <limits>
+#include <sstream>
+
+using namespace MEDCoupling;
+
+const char MEDFileStructureIndex::MAGIC[]="MEDReaderStructureIndex 2";
+
+const char MEDFileStructureIndex::EXTENSION[]=".mrindex";
+
+/*!
+ * Returns the directory of the user cache dedicated to the indexes ("medreader" in XDG_CACHE_HOME, ~/.cache or LOCALAPPDATA).
+ * Returns an empty string if none of them is defined.
+ */
+std::string MEDFileStructureIndex::GetDefaultDirectory()
+{
+  std::string base;
+#ifdef _WIN32
+  if(!vtksys::SystemTools::GetEnv("LOCALAPPDATA",base))
+    return std::string();
+#else
+  if(!vtksys::SystemTools::GetEnv("XDG_CACHE_HOME",base) || base.empty())
+    {
+      if(!vtksys::SystemTools::GetEnv("HOME",base) || base.empty())
+        return std::string();
+      base+="/.cache";
+    }
+#endif
+  return base+"/medreader";
+}
+
+/*!
+ * Returns the name of the index of \a fileName in \a directory (GetDefaultDirectory if empty). The base name of \a fileName is
+ * followed by a hash of its full path to distinguish MED files having the same name in different directories.
+ */
+std::string MEDFileStructureIndex::GetIndexFileName(const std::string& fileName, const std::string& directory)
+{
+  std::string dir(directory.empty()?GetDefaultDirectory():directory);
+  if(dir.empty())
+    return std::string();
+  std::ostringstream oss; oss << vtksys::SystemTools::GetFilenameName(fileName) << "_" << std::hex << std::hash<std::string>()(vtksys::SystemTools::CollapseFullPath(fileName)) << EXTENSION;
+  return vtksys::SystemTools::CollapseFullPath(oss.str(),dir);
+}
+
+/*!
+ * Names may contain spaces so one name per line.
+ */
+static void WriteName(std::ostream& os, const std::string& name)
+{
+  os << name << "\n";
+}
+
+static bool ReadName(std::istream& is, std::string& name)
+{
+  return static_cast<bool>(std::getline(is,name));
+}
+
+/*!
+ * Reads the last value of a line.
+ */
+template<class T>
+static bool ReadValue(std::istream& is, T& val)
+{
+  if(!(is >> val))
+    return false;
+  is.ignore(std::numeric_limits<std::streamsize>::max(),'\n');
+  return true;
+}
+
+/*!
+ * Sizes greater than \a maxSize are rejected to not allocate huge vectors from a corrupted index.
+ */
+static bool ReadSize(std::istream& is, std::size_t& sz, std::size_t maxSize)
+{
+  return ReadValue(is,sz) && sz<=maxSize;
+}
+
+MEDFileStructureIndexMesh::MEDFileStructureIndexMesh(const MEDFileMesh *mesh):_name(mesh->getName())
+{
+  std::vector<std::string> grps(mesh->getGroupsNames());
+  _groups.resize(grps.size());
+  for(std::size_t i=0;i<grps.size();i++)
+    {
+      _groups[i].first=grps[i];
+      _groups[i].second=mesh->getFamiliesOnGroup(grps[i]);
+    }
+  std::vector<std::string> fams(mesh->getFamiliesNames());
+  _families.resize(fams.size());
+  for(std::size_t i=0;i<fams.size();i++)
+    {
+      _families[i].first=fams[i];
+      _families[i].second=mesh->getFamilyId(fams[i]);
+    }
+}
+
+/*!
+ * Removes the index of \a fileName stored in \a directory. To be called if the index does not match the MED file.
+ */
+bool MEDFileStructureIndex::Remove(const std::string& fileName, const std::string& directory)
+{
+  std::string indexFileName(GetIndexFileName(fileName,directory));
+  if(indexFileName.empty())
+    return false;
+  return static_cast<bool>(vtksys::SystemTools::RemoveFile(indexFileName));
+}
+
+/*!
+ * Returns the families and groups of \a meshName or 0 if \a meshName is not in \a this.
+ */
+const MEDFileStructureIndexMesh *MEDFileStructureIndex::getMeshWithName(const std::string& meshName) const
+{
+  for(std::vector<MEDFileStructureIndexMesh>::const_iterator it=_meshes.begin();it!=_meshes.end();it++)
+    if((*it)._name==meshName)
+      return &(*it);
+  return 0;
+}
+
+void MEDFileStructureIndex::clear()
+{
+  _leaves.clear();
+  _meshes.clear();
+}
+
+std::string MEDFileStructureIndex::serialize() const
+{
+  std::ostringstream oss;
+  oss.precision(std::numeric_limits<double>::max_digits10);
+  oss << _meshes.size() << "\n";
+  for(std::vector<MEDFileStructureIndexMesh>::const_iterator it=_meshes.begin();it!=_meshes.end();it++)
+    {
+      WriteName(oss,(*it)._name);
+      oss << (*it)._groups.size() << "\n";
+      for(std::vector< std::pair< std::string, std::vector<std::string> > >::const_iterator it2=(*it)._groups.begin();it2!=(*it)._groups.end();it2++)
+        {
+          WriteName(oss,(*it2).first);
+          oss << (*it2).second.size() << "\n";
+          for(std::vector<std::string>::const_iterator it3=(*it2).second.begin();it3!=(*it2).second.end();it3++)
+            WriteName(oss,*it3);
+        }
+      oss << (*it)._families.size() << "\n";
+      for(std::vector< std::pair<std::string,mcIdType> >::const_iterator it2=(*it)._families.begin();it2!=(*it)._families.end();it2++)
+        {
+          oss << (*it2).second << "\n";
+          WriteName(oss,(*it2).first);
+        }
+    }
+  oss << _leaves.size() << "\n";
+  for(std::vector< std::vector< std::vector<MEDFileStructureIndexLeaf> > >::const_iterator it0=_leaves.begin();it0!=_leaves.end();it0++)
+    {
+      oss << (*it0).size() << "\n";
+      for(std::vector< std::vector<MEDFileStructureIndexLeaf> >::const_iterator it1=(*it0).begin();it1!=(*it0).end();it1++)
+        {
+          oss << (*it1).size() << "\n";
+          for(std::vector<MEDFileStructureIndexLeaf>::const_iterator it2=(*it1).begin();it2!=(*it1).end();it2++)
+            {
+              WriteName(oss,(*it2)._mesh_name);
+              WriteName(oss,(*it2)._dt_unit);
+              oss << (*it2)._dtits.size() << "\n";
+              for(std::size_t i=0;i<(*it2)._dtits.size();i++)
+                oss << (*it2)._dtits[i].first << " " << (*it2)._dtits[i].second << " " << (*it2)._times[i] << "\n";
+              oss << (*it2)._geo_types.size();
+              for(std::vector<INTERP_KERNEL::NormalizedCellType>::const_iterator it3=(*it2)._geo_types.begin();it3!=(*it2)._geo_types.end();it3++)
+                oss << " " << (int)(*it3);
+              oss << "\n" << (*it2)._arrays.size() << "\n";
+              for(std::vector<MEDFileStructureIndexArray>::const_iterator it3=(*it2)._arrays.begin();it3!=(*it2)._arrays.end();it3++)
+                {
+                  WriteName(oss,(*it3)._source_name);
+                  WriteName(oss,(*it3)._field_name);
+                  WriteName(oss,(*it3)._ze_name);
+                  oss << (*it3)._pos_of_discr << " " << (*it3)._pos_of_multi_discr << " " << (*it3)._mesh_info << "\n";
+                }
+            }
+        }
+    }
+  return oss.str();
+}
+
+/*!
+ * Returns false (and leaves \a this empty) if \a data is corrupted.
+ */
+bool MEDFileStructureIndex::unserialize(const std::string& data)
+{
+  clear();
+  std::istringstream iss(data);
+  std::size_t maxSize(data.size()),sz0(0),sz1(0),sz2(0),sz3(0);
+  bool ok(ReadSize(iss,sz0,maxSize));
+  _meshes.resize(ok?sz0:0);
+  for(std::vector<MEDFileStructureIndexMesh>::iterator it=_meshes.begin();it!=_meshes.end() && ok;it++)
+    {
+      ok=ReadName(iss,(*it)._name) && ReadSize(iss,sz1,maxSize);
+      (*it)._groups.resize(ok?sz1:0);
+      for(std::vector< std::pair< std::string, std::vector<std::string> > >::iterator it2=(*it)._groups.begin();it2!=(*it)._groups.end() && ok;it2++)
+        {
+          ok=ReadName(iss,(*it2).first) && ReadSize(iss,sz2,maxSize);
+          (*it2).second.resize(ok?sz2:0);
+          for(std::vector<std::string>::iterator it3=(*it2).second.begin();it3!=(*it2).second.end() && ok;it3++)
+            ok=ReadName(iss,*it3);
+        }
+      ok=ok && ReadSize(iss,sz1,maxSize);
+      (*it)._families.resize(ok?sz1:0);
+      for(std::vector< std::pair<std::string,mcIdType> >::iterator it2=(*it)._families.begin();it2!=(*it)._families.end() && ok;it2++)
+        ok=ReadValue(iss,(*it2).second) && ReadName(iss,(*it2).first);
+    }
+  ok=ok && ReadSize(iss,sz0,maxSize);
+  _leaves.resize(ok?sz0:0);
+  for(std::size_t i=0;i<_leaves.size() && ok;i++)
+    {
+      ok=ReadSize(iss,sz1,maxSize);
+      _leaves[i].resize(ok?sz1:0);
+      for(std::size_t j=0;j<_leaves[i].size() && ok;j++)
+        {
+          ok=ReadSize(iss,sz2,maxSize);
+          _leaves[i][j].resize(ok?sz2:0);
+          for(std::vector<MEDFileStructureIndexLeaf>::iterator it=_leaves[i][j].begin();it!=_leaves[i][j].end() && ok;it++)
+            {
+              ok=ReadName(iss,(*it)._mesh_name) && ReadName(iss,(*it)._dt_unit) && ReadSize(iss,sz3,maxSize);
+              (*it)._dtits.resize(ok?sz3:0); (*it)._times.resize(ok?sz3:0);
+              for(std::size_t k=0;k<(*it)._dtits.size() && ok;k++)
+                ok=static_cast<bool>(iss >> (*it)._dtits[k].first >> (*it)._dtits[k].second) && ReadValue(iss,(*it)._times[k]);
+              ok=ok && static_cast<bool>(iss >> sz3) && sz3<=maxSize;
+              (*it)._geo_types.resize(ok?sz3:0);
+              for(std::size_t k=0;k<(*it)._geo_types.size() && ok;k++)
+                {
+                  int gt(0);
+                  ok=static_cast<bool>(iss >> gt);
+                  (*it)._geo_types[k]=(INTERP_KERNEL::NormalizedCellType)gt;
+                }
+              ok=ok && ReadSize(iss,sz3,maxSize) && sz3>0;
+              (*it)._arrays.resize(ok?sz3:0);
+              for(std::vector<MEDFileStructureIndexArray>::iterator it2=(*it)._arrays.begin();it2!=(*it)._arrays.end() && ok;it2++)
+                ok=ReadName(iss,(*it2)._source_name) && ReadName(iss,(*it2)._field_name) && ReadName(iss,(*it2)._ze_name) &&
+                  static_cast<bool>(iss >> (*it2)._pos_of_discr >> (*it2)._pos_of_multi_discr) && ReadValue(iss,(*it2)._mesh_info);
+            }
+          ok=ok && !_leaves[i][j].empty();
+        }
+      ok=ok && !_leaves[i].empty();
+    }
+  if(!ok || _leaves.empty())
+    {
+      clear();
+      return false;
+    }
+  return true;
+}
+
+/*!
+ * Loads the index of \a fileName stored in \a directory. Returns false if there is no index or if it is outdated regarding \a fileName.
+ */
+bool MEDFileStructureIndex::load(const std::string& fileName, const std::string& directory)
+{
+  std::string stamp,indexFileName(GetIndexFileName(fileName,directory));
+  if(indexFileName.empty() || !GetStampOf(fileName,stamp))
+    return false;
+  std::ifstream ifs(indexFileName.c_str());
+  if(!ifs)
+    return false;
+  std::string line;
+  if(!std::getline(ifs,line) || line!=MAGIC)
+    return false;
+  if(!std::getline(ifs,line) || line!=stamp)
+    return false;
+  std::string data((std::istreambuf_iterator<char>(ifs)),std::istreambuf_iterator<char>());
+  return unserialize(data);
+}
+
+/*!
+ * Stores \a this as the index of \a fileName in \a directory, created if needed. Returns false if the index can't be written (read only directory for example).
+ */
+bool MEDFileStructureIndex::save(const std::string& fileName, const std::string& directory) const
+{
+  std::string stamp,indexFileName(GetIndexFileName(fileName,directory));
+  if(indexFileName.empty() || !GetStampOf(fileName,stamp))
+    return false;
+  if(!vtksys::SystemTools::MakeDirectory(vtksys::SystemTools::GetFilenamePath(indexFileName)))
+    return false;
+  std::string tmpFileName(indexFileName+".tmp");
+  {
+    std::ofstream ofs(tmpFileName.c_str());
+    if(!ofs)
+      return false;
+    ofs << MAGIC << "\n" << stamp << "\n" << serialize();
+    if(!ofs)
+      return false;
+  }
+  // rename to never let a partially written index
+  return static_cast<bool>(vtksys::SystemTools::RenameFile(tmpFileName,indexFileName));
+}
+
+bool MEDFileStructureIndex::GetStampOf(const std::string& fileName, std::string& stamp)
+{
+  if(!vtksys::SystemTools::FileExists(fileName,true))
+    return false;
+  std::ostringstream oss; oss << vtksys::SystemTools::CollapseFullPath(fileName) << " " << vtksys::SystemTools::FileLength(fileName) << " " << vtksys::SystemTools::ModifiedTime(fileName);
+  stamp=oss.str();
+  return true;
+}
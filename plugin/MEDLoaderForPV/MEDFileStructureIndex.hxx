@@ -0,0 +1,117 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#ifndef __MEDFILESTRUCTUREINDEX_HXX__
+#define __MEDFILESTRUCTUREINDEX_HXX__
+
+#include "MEDLoaderForPV.h"
+#include "MEDFileMesh.hxx"
+#include "MEDFileField.hxx"
+
+#include <string>
+#include <vector>
+
+/*!
+ * Description of a field of a leaf of the tree : the field of the MED file it comes from and the names given to VTK.
+ */
+class MEDLOADERFORPV_EXPORT MEDFileStructureIndexArray
+{
+public:
+  MEDFileStructureIndexArray():_pos_of_discr(0),_pos_of_multi_discr(-1),_mesh_info(false) { }
+  MEDFileStructureIndexArray(const std::string& sourceName, int posOfDiscr, int posOfMultiDiscr):_source_name(sourceName),_pos_of_discr(posOfDiscr),_pos_of_multi_discr(posOfMultiDiscr),_mesh_info(false) { }
+public:
+  //! name of the field in the MED file. Empty for the field built from the mesh (see MEDFileFieldRepresentationTree::BuildFieldFromMeshes).
+  std::string _source_name;
+  //! position of the field in MEDFileAnyTypeFieldMultiTS::splitDiscretizations of the field of the file.
+  int _pos_of_discr;
+  //! position of the field in MEDFileAnyTypeFieldMultiTS::splitMultiDiscrPerGeoTypes. -1 if not split.
+  int _pos_of_multi_discr;
+  //! name of the field in the tree. It differs from _source_name for the fields split per geometric type and for the field of the mesh.
+  std::string _field_name;
+  //! name of the field and of its discretization (see MEDFileFieldRepresentationLeavesArrays::getZeName).
+  std::string _ze_name;
+  //! true if the field is the one built from the mesh (see MEDFileFieldRepresentationTree::IsFieldMeshRegardingInfo).
+  bool _mesh_info;
+};
+
+/*!
+ * Description of a leaf of the tree : its mesh, its time steps, the geometric types of its support and its fields.
+ */
+class MEDLOADERFORPV_EXPORT MEDFileStructureIndexLeaf
+{
+public:
+  std::string _mesh_name;
+  std::string _dt_unit;
+  std::vector< std::pair<int,int> > _dtits;
+  std::vector<double> _times;
+  std::vector<INTERP_KERNEL::NormalizedCellType> _geo_types;
+  std::vector<MEDFileStructureIndexArray> _arrays;
+};
+
+/*!
+ * Families and groups of a mesh, as shown in the SIL.
+ */
+class MEDLOADERFORPV_EXPORT MEDFileStructureIndexMesh
+{
+public:
+  MEDFileStructureIndexMesh() { }
+  MEDFileStructureIndexMesh(const MEDCoupling::MEDFileMesh *mesh);
+public:
+  std::string _name;
+  //! groups with the names of their families, in the order of MEDFileMesh::getGroupsNames.
+  std::vector< std::pair< std::string, std::vector<std::string> > > _groups;
+  //! families with their ids, in the order of MEDFileMesh::getFamiliesNames.
+  std::vector< std::pair<std::string,mcIdType> > _families;
+};
+
+/*!
+ * Tree of the fields of a MED file computed by MEDFileFieldRepresentationTree::loadInMemory (common time series, then mesh, then common support)
+ * with everything needed to build the tree and its SIL without reading the MED file : names of the fields, time steps, geometric types, families and groups.
+ * It is stored in a file of a cache directory (see GetIndexFileName) bound to the path, the size and the modification time of the MED file.
+ * Each field keeps the name of the field of the file it comes from to let MEDFileFieldRepresentationTree read only the fields and the mesh of a leaf when it is used.
+ */
+class MEDLOADERFORPV_EXPORT MEDFileStructureIndex
+{
+public:
+  static std::string GetDefaultDirectory();
+  static std::string GetIndexFileName(const std::string& fileName, const std::string& directory);
+  static bool Remove(const std::string& fileName, const std::string& directory);
+  std::vector< std::vector< std::vector<MEDFileStructureIndexLeaf> > >& getLeaves() { return _leaves; }
+  const std::vector< std::vector< std::vector<MEDFileStructureIndexLeaf> > >& getLeaves() const { return _leaves; }
+  std::vector<MEDFileStructureIndexMesh>& getMeshes() { return _meshes; }
+  const MEDFileStructureIndexMesh *getMeshWithName(const std::string& meshName) const;
+  bool empty() const { return _leaves.empty(); }
+  void clear();
+  std::string serialize() const;
+  bool unserialize(const std::string& data);
+  bool load(const std::string& fileName, const std::string& directory);
+  bool save(const std::string& fileName, const std::string& directory) const;
+private:
+  static bool GetStampOf(const std::string& fileName, std::string& stamp);
+private:
+  // 1st : timesteps, 2nd : meshName, 3rd : common support
+  std::vector< std::vector< std::vector<MEDFileStructureIndexLeaf> > > _leaves;
+  std::vector<MEDFileStructureIndexMesh> _meshes;
+public:
+  static const char MAGIC[];
+  static const char EXTENSION[];
+};
+
+#endif
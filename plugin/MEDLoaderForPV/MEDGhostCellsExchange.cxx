@@ -0,0 +1,316 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#include "MEDGhostCellsExchange.hxx"
+#include "InterpKernelException.hxx"
+
+#include "vtkCellArray.h"
+#include "vtkCellData.h"
+#include "vtkDataArray.h"
+#include "vtkFieldData.h"
+#include "vtkIdTypeArray.h"
+#include "vtkPointData.h"
+#include "vtkPoints.h"
+#include "vtkUnstructuredGrid.h"
+
+#ifdef MEDREADER_USE_MPI
+  #include <mpi.h>
+#endif
+
+#include <cstring>
+#include <functional>
+#include <sstream>
+#include <string>
+
+const char MEDGhostCellsExchange::OWNER_ARRAY_NAME[]="vtkMEDReaderOwner";
+
+MEDGhostCellsExchange::MEDGhostCellsExchange():_is_set_up(false),_points_mtime(0),_nb_of_cells(0)
+{
+#ifdef MEDREADER_USE_MPI
+  _comm=MPI_COMM_WORLD;
+#endif
+}
+
+void MEDGhostCellsExchange::clear()
+{
+  _is_set_up=false;
+  _output=0;
+  _points=0;
+  _cells=0;
+}
+
+/*!
+ * Adds to \a input the owner (process, local id) of each point and each cell. To be called before running vtkGhostCellsGenerator on \a input.
+ */
+void MEDGhostCellsExchange::prepare(vtkDataSet *input) const
+{
+  int rank(0);
+#ifdef MEDREADER_USE_MPI
+  MPI_Comm_rank(_comm,&rank);
+#endif
+  vtkDataSetAttributes *atts[2]={input->GetPointData(),input->GetCellData()};
+  vtkIdType nbOfTuples[2]={input->GetNumberOfPoints(),input->GetNumberOfCells()};
+  for(int i=0;i<2;i++)
+    {
+      vtkIdTypeArray *owner(vtkIdTypeArray::New());
+      owner->SetName(OWNER_ARRAY_NAME);
+      owner->SetNumberOfComponents(2);
+      owner->SetNumberOfTuples(nbOfTuples[i]);
+      vtkIdType *pt(owner->GetPointer(0));
+      for(vtkIdType j=0;j<nbOfTuples[i];j++)
+        {
+          pt[2*j]=rank;
+          pt[2*j+1]=j;
+        }
+      atts[i]->AddArray(owner);
+      owner->Delete();
+    }
+}
+
+bool MEDGhostCellsExchange::isSameMeshAsSetUp(vtkDataSet *input) const
+{
+  vtkUnstructuredGrid *ug(vtkUnstructuredGrid::SafeDownCast(input));
+  if(!_is_set_up || !ug || !ug->GetPoints())
+    return false;
+  return ug->GetPoints()==_points && ug->GetPoints()->GetMTime()==_points_mtime && ug->GetCells()==_cells && ug->GetNumberOfCells()==_nb_of_cells;
+}
+
+/*!
+ * Returns a hash of the name, the type and the number of components of the point and cell arrays of \a input exchanged by apply, in their order.
+ */
+unsigned long long MEDGhostCellsExchange::ComputeSignatureOfArrays(vtkDataSet *input)
+{
+  std::ostringstream oss;
+  vtkDataSetAttributes *atts[2]={input->GetPointData(),input->GetCellData()};
+  for(int i=0;i<2;i++)
+    {
+      oss << "/" << i;
+      int nbOfArrays(atts[i]->GetNumberOfArrays());
+      for(int j=0;j<nbOfArrays;j++)
+        {
+          vtkDataArray *arr(atts[i]->GetArray(j));
+          if(!arr || !arr->GetName() || strcmp(arr->GetName(),vtkDataSetAttributes::GhostArrayName())==0)
+            continue;
+          oss << "/" << arr->GetName() << "/" << arr->GetDataType() << "/" << arr->GetNumberOfComponents();
+        }
+    }
+  return (unsigned long long)std::hash<std::string>()(oss.str());
+}
+
+#ifdef MEDREADER_USE_MPI
+
+/*!
+ * Collective. Returns true if on all processes \a input lies on the mesh given to setUp and if all processes have the same arrays
+ * (see ComputeSignatureOfArrays). In this case apply can be used instead of vtkGhostCellsGenerator.
+ */
+bool MEDGhostCellsExchange::isApplicableTo(vtkDataSet *input) const
+{
+  // the minimum of the opposite of the signature gives its maximum : a single reduction is enough
+  unsigned long long sig(ComputeSignatureOfArrays(input));
+  unsigned long long loc[3]={isSameMeshAsSetUp(input)?1ULL:0ULL,sig,~sig},glob[3];
+  MPI_Allreduce(loc,glob,3,MPI_UNSIGNED_LONG_LONG,MPI_MIN,_comm);
+  return glob[0]==1ULL && glob[1]==~glob[2];
+}
+
+/*!
+ * Collective. \a input has been given to prepare then to vtkGhostCellsGenerator which result is \a output.
+ * The tags added by prepare are removed from \a input and \a output.
+ */
+void MEDGhostCellsExchange::setUp(vtkDataSet *input, vtkDataSet *output)
+{
+  clear();
+  int rank(0),nbOfProcs(1);
+  MPI_Comm_rank(_comm,&rank);
+  MPI_Comm_size(_comm,&nbOfProcs);
+  vtkUnstructuredGrid *ug(vtkUnstructuredGrid::SafeDownCast(input)),*ugOut(vtkUnstructuredGrid::SafeDownCast(output));
+  bool isOK(ug && ugOut && ug->GetPoints() && output->GetPointData()->GetArray(OWNER_ARRAY_NAME) && output->GetCellData()->GetArray(OWNER_ARRAY_NAME));
+  int loc(isOK?1:0),glob(0);
+  MPI_Allreduce(&loc,&glob,1,MPI_INT,MPI_MIN,_comm);
+  if(glob==1)
+    {
+      _points_pattern.setUp(output->GetPointData(),rank,nbOfProcs,_comm);
+      _cells_pattern.setUp(output->GetCellData(),rank,nbOfProcs,_comm);
+      _output=vtkSmartPointer<vtkUnstructuredGrid>::New();
+      _output->CopyStructure(ugOut);
+      vtkDataArray *ghosts(output->GetPointData()->GetArray(vtkDataSetAttributes::GhostArrayName()));
+      if(ghosts)
+        _output->GetPointData()->AddArray(ghosts);
+      ghosts=output->GetCellData()->GetArray(vtkDataSetAttributes::GhostArrayName());
+      if(ghosts)
+        _output->GetCellData()->AddArray(ghosts);
+      _points=ug->GetPoints();
+      _points_mtime=_points->GetMTime();
+      _cells=ug->GetCells();
+      _nb_of_cells=ug->GetNumberOfCells();
+      _is_set_up=true;
+    }
+  input->GetPointData()->RemoveArray(OWNER_ARRAY_NAME);
+  input->GetCellData()->RemoveArray(OWNER_ARRAY_NAME);
+  output->GetPointData()->RemoveArray(OWNER_ARRAY_NAME);
+  output->GetCellData()->RemoveArray(OWNER_ARRAY_NAME);
+}
+
+/*!
+ * Collective. Returns a new dataset (to be deallocated by the caller) with the ghost topology computed by setUp and the point and cell arrays of \a input
+ * completed with the values of the ghost points and cells owned by the other processes.
+ */
+vtkDataSet *MEDGhostCellsExchange::apply(vtkDataSet *input) const
+{
+  vtkUnstructuredGrid *ret(vtkUnstructuredGrid::New());
+  ret->CopyStructure(_output);
+  _points_pattern.apply(input->GetPointData(),ret->GetPointData(),_output->GetPointData(),_comm);
+  _cells_pattern.apply(input->GetCellData(),ret->GetCellData(),_output->GetCellData(),_comm);
+  ret->GetFieldData()->ShallowCopy(input->GetFieldData());
+  return ret;
+}
+
+/*!
+ * \a output contains the owners of its tuples (see prepare). Computes for each process the ids it has to send to the others and
+ * where to put the tuples received from them.
+ */
+void MEDGhostCellsExchange::Pattern::setUp(vtkDataSetAttributes *output, int rank, int nbOfProcs, MPI_Comm comm)
+{
+  vtkIdTypeArray *owner(vtkIdTypeArray::SafeDownCast(output->GetArray(OWNER_ARRAY_NAME)));
+  _nb_of_tuples=owner->GetNumberOfTuples();
+  _local_dst.clear(); _local_src.clear();
+  std::vector< std::vector<long long> > requests(nbOfProcs);
+  std::vector< std::vector<vtkIdType> > recvDst(nbOfProcs);
+  const vtkIdType *pt(owner->GetPointer(0));
+  for(vtkIdType i=0;i<_nb_of_tuples;i++)
+    {
+      int ownerRank((int)pt[2*i]);
+      if(ownerRank==rank)
+        {
+          _local_dst.push_back(i);
+          _local_src.push_back(pt[2*i+1]);
+        }
+      else
+        {
+          requests[ownerRank].push_back((long long)pt[2*i+1]);
+          recvDst[ownerRank].push_back(i);
+        }
+    }
+  _recv_counts.resize(nbOfProcs);
+  _send_counts.resize(nbOfProcs);
+  std::vector<long long> reqBuf;
+  _recv_dst.clear();
+  for(int i=0;i<nbOfProcs;i++)
+    {
+      _recv_counts[i]=(int)requests[i].size();
+      reqBuf.insert(reqBuf.end(),requests[i].begin(),requests[i].end());
+      _recv_dst.insert(_recv_dst.end(),recvDst[i].begin(),recvDst[i].end());
+    }
+  MPI_Alltoall(_recv_counts.data(),1,MPI_INT,_send_counts.data(),1,MPI_INT,comm);
+  std::vector<int> reqDispls(nbOfProcs,0),sendDispls(nbOfProcs,0);
+  for(int i=1;i<nbOfProcs;i++)
+    {
+      reqDispls[i]=reqDispls[i-1]+_recv_counts[i-1];
+      sendDispls[i]=sendDispls[i-1]+_send_counts[i-1];
+    }
+  std::vector<long long> sendIds(sendDispls[nbOfProcs-1]+_send_counts[nbOfProcs-1]);
+  MPI_Alltoallv(reqBuf.data(),_recv_counts.data(),reqDispls.data(),MPI_LONG_LONG,sendIds.data(),_send_counts.data(),sendDispls.data(),MPI_LONG_LONG,comm);
+  _send_ids.assign(sendIds.begin(),sendIds.end());
+}
+
+/*!
+ * Fills \a output with the arrays of \a input completed with the tuples received from the other processes. Ghost arrays are taken from \a ghostRef.
+ * Collective over \a comm : all processes are expected to have the same arrays in the same order (checked by isApplicableTo).
+ * Tuples are copied as raw bytes so the arrays of \a output are arrays of structures. Arrays of \a input with another layout (structure of arrays,
+ * implicit arrays...) are deep copied into an array of structures first.
+ */
+void MEDGhostCellsExchange::Pattern::apply(vtkDataSetAttributes *input, vtkDataSetAttributes *output, vtkDataSetAttributes *ghostRef, MPI_Comm comm) const
+{
+  int nbOfProcs((int)_send_counts.size());
+  int nbOfArrays(input->GetNumberOfArrays());
+  for(int i=0;i<nbOfArrays;i++)
+    {
+      vtkDataArray *arr(input->GetArray(i));
+      if(!arr || !arr->GetName() || strcmp(arr->GetName(),vtkDataSetAttributes::GhostArrayName())==0)
+        continue;
+      vtkSmartPointer<vtkDataArray> arrAOS(arr);
+      if(!arr->HasStandardMemoryLayout())
+        {
+          arrAOS.TakeReference(vtkDataArray::CreateDataArray(arr->GetDataType()));
+          arrAOS->DeepCopy(arr);
+        }
+      vtkDataArray *arr2(vtkDataArray::CreateDataArray(arr->GetDataType()));
+      arr2->SetName(arr->GetName());
+      arr2->SetNumberOfComponents(arr->GetNumberOfComponents());
+      for(int j=0;j<arr->GetNumberOfComponents();j++)
+        if(arr->GetComponentName(j))
+          arr2->SetComponentName(j,arr->GetComponentName(j));
+      arr2->CopyInformation(arr->GetInformation(),1);
+      arr2->SetNumberOfTuples(_nb_of_tuples);
+      int tupleSize(arr->GetDataTypeSize()*arr->GetNumberOfComponents());
+      const char *src(reinterpret_cast<const char *>(arrAOS->GetVoidPointer(0)));
+      char *dst(reinterpret_cast<char *>(arr2->GetVoidPointer(0)));
+      for(std::size_t j=0;j<_local_dst.size();j++)
+        std::memcpy(dst+_local_dst[j]*tupleSize,src+_local_src[j]*tupleSize,tupleSize);
+      // values of the tuples owned here and needed by the others
+      std::vector<char> sendBuf(_send_ids.size()*tupleSize),recvBuf(_recv_dst.size()*tupleSize);
+      for(std::size_t j=0;j<_send_ids.size();j++)
+        std::memcpy(sendBuf.data()+j*tupleSize,src+_send_ids[j]*tupleSize,tupleSize);
+      std::vector<int> sendCounts(nbOfProcs),recvCounts(nbOfProcs),sendDispls(nbOfProcs,0),recvDispls(nbOfProcs,0);
+      for(int j=0;j<nbOfProcs;j++)
+        {
+          sendCounts[j]=_send_counts[j]*tupleSize;
+          recvCounts[j]=_recv_counts[j]*tupleSize;
+          if(j>0)
+            {
+              sendDispls[j]=sendDispls[j-1]+sendCounts[j-1];
+              recvDispls[j]=recvDispls[j-1]+recvCounts[j-1];
+            }
+        }
+      MPI_Alltoallv(sendBuf.data(),sendCounts.data(),sendDispls.data(),MPI_BYTE,recvBuf.data(),recvCounts.data(),recvDispls.data(),MPI_BYTE,comm);
+      for(std::size_t j=0;j<_recv_dst.size();j++)
+        std::memcpy(dst+_recv_dst[j]*tupleSize,recvBuf.data()+j*tupleSize,tupleSize);
+      output->AddArray(arr2);
+      arr2->Delete();
+    }
+  vtkDataArray *ghosts(ghostRef->GetArray(vtkDataSetAttributes::GhostArrayName()));
+  if(ghosts)
+    output->AddArray(ghosts);
+  // active attributes (scalars, vectors...) of input are kept
+  for(int i=0;i<vtkDataSetAttributes::NUM_ATTRIBUTES;i++)
+    {
+      vtkAbstractArray *attr(input->GetAbstractAttribute(i));
+      if(attr && attr->GetName())
+        output->SetActiveAttribute(attr->GetName(),i);
+    }
+}
+
+#else
+
+bool MEDGhostCellsExchange::isApplicableTo(vtkDataSet *input) const
+{
+  return false;
+}
+
+void MEDGhostCellsExchange::setUp(vtkDataSet *input, vtkDataSet *output)
+{
+  throw INTERP_KERNEL::Exception("MEDGhostCellsExchange::setUp : Plugin not compiled with MPI !");
+}
+
+vtkDataSet *MEDGhostCellsExchange::apply(vtkDataSet *input) const
+{
+  throw INTERP_KERNEL::Exception("MEDGhostCellsExchange::apply : Plugin not compiled with MPI !");
+}
+
+#endif
@@ -0,0 +1,103 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#ifndef __MEDGHOSTCELLSEXCHANGE_HXX__
+#define __MEDGHOSTCELLSEXCHANGE_HXX__
+
+#include "MEDLoaderForPV.h"
+
+#include "vtkType.h"
+#include "vtkSmartPointer.h"
+
+#ifdef MEDREADER_USE_MPI
+  #include <mpi.h>
+#endif
+
+#include <vector>
+
+class vtkCellArray;
+class vtkDataSet;
+class vtkDataSetAttributes;
+class vtkPoints;
+class vtkUnstructuredGrid;
+
+/*!
+ * Ghost layer of an unstructured grid distributed over MPI processes, computed once by vtkGhostCellsGenerator and reused as long as the mesh does not change.
+ * prepare tags each cell and each point of the input of the generator with its owner (process and local id).
+ * setUp reads these tags in the output of the generator : the ghost topology is kept and each process tells once to the others the ids it needs from them.
+ * Then apply builds the output for a new input lying on the same mesh : the topology is shared with the kept output and only the values
+ * of the point and cell arrays are exchanged (one MPI_Alltoallv per array). It requires the same arrays (name, type and number of components)
+ * in the same order on all processes : isApplicableTo checks it collectively. Arrays not stored as arrays of structures are copied into such arrays before.
+ * All methods but prepare are collective over the communicator given by setCommunicator (the one of the vtkMultiProcessController of the reader).
+ */
+class MEDLOADERFORPV_EXPORT MEDGhostCellsExchange
+{
+public:
+  MEDGhostCellsExchange();
+#ifdef MEDREADER_USE_MPI
+  void setCommunicator(MPI_Comm comm) { _comm=comm; }
+#endif
+  void clear();
+  bool isApplicableTo(vtkDataSet *input) const;
+  void prepare(vtkDataSet *input) const;
+  void setUp(vtkDataSet *input, vtkDataSet *output);
+  vtkDataSet *apply(vtkDataSet *input) const;
+public:
+  static const char OWNER_ARRAY_NAME[];
+private:
+  //! how the tuples of the output (points or cells) are filled from the tuples of the inputs of all processes.
+  class Pattern
+  {
+  public:
+#ifdef MEDREADER_USE_MPI
+    void setUp(vtkDataSetAttributes *output, int rank, int nbOfProcs, MPI_Comm comm);
+    void apply(vtkDataSetAttributes *input, vtkDataSetAttributes *output, vtkDataSetAttributes *ghostRef, MPI_Comm comm) const;
+#endif
+  private:
+    vtkIdType _nb_of_tuples;
+    //! positions in the output and in the local input of the tuples owned by the current process.
+    std::vector<vtkIdType> _local_dst;
+    std::vector<vtkIdType> _local_src;
+    //! for each process, ids in the local input of the tuples it needs.
+    std::vector<int> _send_counts;
+    std::vector<vtkIdType> _send_ids;
+    //! for each process, positions in the output of the tuples received from it.
+    std::vector<int> _recv_counts;
+    std::vector<vtkIdType> _recv_dst;
+  };
+  bool isSameMeshAsSetUp(vtkDataSet *input) const;
+  static unsigned long long ComputeSignatureOfArrays(vtkDataSet *input);
+private:
+#ifdef MEDREADER_USE_MPI
+  MPI_Comm _comm;
+#endif
+  bool _is_set_up;
+  //! output of vtkGhostCellsGenerator whose topology is shared by the outputs of apply.
+  vtkSmartPointer<vtkUnstructuredGrid> _output;
+  //! mesh of the input given to setUp.
+  vtkSmartPointer<vtkPoints> _points;
+  vtkSmartPointer<vtkCellArray> _cells;
+  vtkMTimeType _points_mtime;
+  vtkIdType _nb_of_cells;
+  Pattern _points_pattern;
+  Pattern _cells_pattern;
+};
+
+#endif
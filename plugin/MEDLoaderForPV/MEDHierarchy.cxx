@@ -0,0 +1,107 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#include "MEDHierarchy.hxx"
+
+#include "vtkDataSetAttributes.h"
+#include "vtkMutableDirectedGraph.h"
+#include "vtkStringArray.h"
+
+#include <cstring>
+#include <list>
+#include <mutex>
+
+const std::size_t MEDHierarchy::CACHE_SIZE=4;
+
+/*!
+ * Returns the hierarchy of \a sil. It is built at the first call for a given SIL and kept for the next ones (the last CACHE_SIZE SILs are kept).
+ * Thread safe.
+ */
+std::shared_ptr<const MEDHierarchy> MEDHierarchy::GetOrBuildFrom(vtkMutableDirectedGraph *sil)
+{
+  class Entry
+  {
+  public:
+    const vtkMutableDirectedGraph *_sil;
+    vtkMTimeType _mtime;
+    std::shared_ptr<const MEDHierarchy> _hierarchy;
+  };
+  static std::mutex mutex;
+  static std::list<Entry> entries;
+  if(!sil)
+    return std::shared_ptr<const MEDHierarchy>();
+  std::lock_guard<std::mutex> lock(mutex);
+  // the MTime distinguishes a new SIL allocated at the address of a deleted one
+  vtkMTimeType mtime(sil->GetMTime());
+  for(std::list<Entry>::iterator it=entries.begin();it!=entries.end();it++)
+    if((*it)._sil==sil && (*it)._mtime==mtime)
+      {
+        entries.splice(entries.begin(),entries,it);
+        return entries.front()._hierarchy;
+      }
+  Entry entry;
+  entry._sil=sil; entry._mtime=mtime;
+  entry._hierarchy=std::make_shared<const MEDHierarchy>(sil);
+  entries.push_front(entry);
+  if(entries.size()>CACHE_SIZE)
+    entries.pop_back();
+  return entry._hierarchy;
+}
+
+MEDHierarchy::MEDHierarchy(vtkMutableDirectedGraph *sil)
+{
+  vtkIdType nbOfVertices(sil->GetNumberOfVertices());
+  vtkStringArray *names(vtkStringArray::SafeDownCast(sil->GetVertexData()->GetAbstractArray("Names")));
+  _name_offsets.resize(nbOfVertices+1);
+  _children_offsets.resize(nbOfVertices+1);
+  _name_offsets[0]=0; _children_offsets[0]=0;
+  for(vtkIdType i=0;i<nbOfVertices;i++)
+    {
+      std::size_t len(0);
+      if(names && i<names->GetNumberOfValues())
+        {
+          const std::string& name(names->GetValue(i));
+          len=name.size();
+          _names.insert(_names.end(),name.begin(),name.end());
+        }
+      _names.push_back('\0');
+      _name_offsets[i+1]=_name_offsets[i]+len+1;
+      _children_offsets[i+1]=_children_offsets[i]+sil->GetOutDegree(i);
+    }
+  _children.resize(_children_offsets[nbOfVertices]);
+  for(vtkIdType i=0;i<nbOfVertices;i++)
+    {
+      vtkIdType nbOfChildren(_children_offsets[i+1]-_children_offsets[i]);
+      for(vtkIdType j=0;j<nbOfChildren;j++)
+        _children[_children_offsets[i]+j]=sil->GetOutEdge(i,j).Target;
+    }
+}
+
+/*!
+ * Returns the first vertex named \a name, -1 if none.
+ */
+vtkIdType MEDHierarchy::findVertex(const char *name) const
+{
+  vtkIdType nbOfVertices(getNumberOfVertices());
+  for(vtkIdType i=0;i<nbOfVertices;i++)
+    if(strcmp(getNameOf(i),name)==0)
+      return i;
+  return -1;
+}
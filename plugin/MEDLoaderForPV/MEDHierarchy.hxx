@@ -0,0 +1,58 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#ifndef __MEDHIERARCHY_HXX__
+#define __MEDHIERARCHY_HXX__
+
+#include "MEDLoaderForPV.h"
+
+#include "vtkType.h"
+
+#include <memory>
+#include <string>
+#include <vector>
+
+class vtkMutableDirectedGraph;
+
+/*!
+ * Read only copy of the SIL built by vtkMEDReader. Names of the vertices are interned in a single buffer and
+ * the children of each vertex are stored contiguously (CSR), in the order of the edges of the SIL.
+ * An instance is built once per SIL and shared by all the filters of the process reading it (see GetOrBuildFrom).
+ */
+class MEDLOADERFORPV_EXPORT MEDHierarchy
+{
+public:
+  static std::shared_ptr<const MEDHierarchy> GetOrBuildFrom(vtkMutableDirectedGraph *sil);
+  MEDHierarchy(vtkMutableDirectedGraph *sil);
+  vtkIdType getNumberOfVertices() const { return (vtkIdType)_name_offsets.size()-1; }
+  const char *getNameOf(vtkIdType vertex) const { return _names.data()+_name_offsets[vertex]; }
+  vtkIdType getNumberOfChildren(vtkIdType vertex) const { return _children_offsets[vertex+1]-_children_offsets[vertex]; }
+  vtkIdType getChild(vtkIdType vertex, vtkIdType i) const { return _children[_children_offsets[vertex]+i]; }
+  vtkIdType findVertex(const char *name) const;
+private:
+  //! names of all the vertices, each one followed by '\0'.
+  std::vector<char> _names;
+  std::vector<std::size_t> _name_offsets;
+  std::vector<vtkIdType> _children_offsets;
+  std::vector<vtkIdType> _children;
+  static const std::size_t CACHE_SIZE;
+};
+
+#endif
@@ -26,6 +26,49 @@ MEDTimeReq::~MEDTimeReq()
 {
 }
 
+/*!
+ * Returns true if arrays loaded to build the dataset have to be given to VTK and released from the MED structures.
+ */
+bool MEDTimeReq::isMemoryBounded() const
+{
+  return false;
+}
+
+bool MEDTimeReq::isMemoryLimitReached() const
+{
+  return false;
+}
+
+/*!
+ * Does nothing ! It is not a bug
+ */
+void MEDTimeReq::addMemoryUsed(std::size_t /*sz*/) const
+{
+}
+
+/*!
+ * Does nothing ! It is not a bug
+ */
+void MEDTimeReq::setTruncated() const
+{
+}
+
+/*!
+ * Returns true if some of the requested time steps have not been built because of the memory limit.
+ */
+bool MEDTimeReq::isTruncated() const
+{
+  return false;
+}
+
+/*!
+ * Returns true if the time steps of an array have to be gathered into a single multi-component array.
+ */
+bool MEDTimeReq::isPacked() const
+{
+  return false;
+}
+
 ///////////
 
 MEDStdTimeReq::~MEDStdTimeReq()
@@ -74,7 +117,7 @@ void MEDStdTimeReq::operator++() const
 
 ///////////
 
-MEDModeTimeReq::MEDModeTimeReq(const std::vector<bool>& v, const std::vector<double>& ts):_v(v),_ts(ts),_it(0),_sz(0)
+MEDModeTimeReq::MEDModeTimeReq(const std::vector<bool>& v, const std::vector<double>& ts, std::size_t memoryLimitInBytes, bool packed):_v(v),_ts(ts),_it(0),_sz(0),_mem_limit(memoryLimitInBytes),_mem_used(0),_truncated(false),_packed(packed)
 {
 }
 
@@ -133,3 +176,36 @@ void MEDModeTimeReq::operator++() const
     if(_v[_it])
       return;
 }
+
+bool MEDModeTimeReq::isMemoryBounded() const
+{
+  return _mem_limit>0;
+}
+
+/*!
+ * Returns true if the arrays already built for \a this exceed the limit. No more time step should be built then.
+ */
+bool MEDModeTimeReq::isMemoryLimitReached() const
+{
+  return _mem_limit>0 && _mem_used>=_mem_limit;
+}
+
+void MEDModeTimeReq::addMemoryUsed(std::size_t sz) const
+{
+  _mem_used+=sz;
+}
+
+void MEDModeTimeReq::setTruncated() const
+{
+  _truncated=true;
+}
+
+bool MEDModeTimeReq::isTruncated() const
+{
+  return _truncated;
+}
+
+bool MEDModeTimeReq::isPacked() const
+{
+  return _packed;
+}
@@ -35,6 +35,12 @@ public:
   virtual void initIterator() const = 0;
   virtual int getCurrent() const = 0;
   virtual void operator++() const = 0;
+  virtual bool isMemoryBounded() const;
+  virtual bool isMemoryLimitReached() const;
+  virtual void addMemoryUsed(std::size_t sz) const;
+  virtual void setTruncated() const;
+  virtual bool isTruncated() const;
+  virtual bool isPacked() const;
   virtual ~MEDTimeReq();
 };
 
@@ -57,7 +63,7 @@ private:
 class MEDLOADERFORPV_EXPORT MEDModeTimeReq : public MEDTimeReq
 {
 public:
-  MEDModeTimeReq(const std::vector<bool>& v, const std::vector<double>& ts);
+  MEDModeTimeReq(const std::vector<bool>& v, const std::vector<double>& ts, std::size_t memoryLimitInBytes=0, bool packed=false);
   ~MEDModeTimeReq();
   int size() const;
   int getCurrent() const;
@@ -65,11 +71,24 @@ public:
   void setNumberOfTS(int nbOfTS) const;
   std::string buildName(const std::string& name) const;
   void operator++() const;
+  bool isMemoryBounded() const;
+  bool isMemoryLimitReached() const;
+  void addMemoryUsed(std::size_t sz) const;
+  void setTruncated() const;
+  bool isTruncated() const;
+  bool isPacked() const;
 private:
   std::vector<bool> _v;
   std::vector<double> _ts;
   mutable int _it;
   mutable int _sz;
+  //! 0 means no limit.
+  std::size_t _mem_limit;
+  //! updated in the order of the modes once all the arrays of a mode are built.
+  mutable std::size_t _mem_used;
+  //! true if some of the selected modes have not been built because of _mem_limit.
+  mutable bool _truncated;
+  bool _packed;
 };
 
 #endif
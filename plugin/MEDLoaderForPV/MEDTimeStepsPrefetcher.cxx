@@ -0,0 +1,204 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#include "MEDTimeStepsPrefetcher.hxx"
+#include "MEDFileFieldRepresentationTree.hxx"
+
+#include <algorithm>
+#include <sstream>
+
+using namespace MEDCoupling;
+
+MEDTimeStepsPrefetcher::MEDTimeStepsPrefetcher():_depth(0),_max_size_in_mb(256),_stop(false),_suspended(true),_busy(false),_interrupt(false),
+                                                 _leaf(0),_last_time_step_id(-1),_direction(1),_size(0)
+{
+}
+
+MEDTimeStepsPrefetcher::~MEDTimeStepsPrefetcher()
+{
+  suspend();
+  {
+    std::lock_guard<std::mutex> lock(_mutex);
+    _stop=true;
+  }
+  _cv.notify_all();
+  if(_thread.joinable())
+    _thread.join();
+  cancel();
+}
+
+/*!
+ * Waits for the worker to finish the field it is loading and prevents it from starting anything else until resume is called.
+ * Once this method returned the caller can safely access the MEDCoupling objects.
+ */
+void MEDTimeStepsPrefetcher::suspend()
+{
+  std::unique_lock<std::mutex> lock(_mutex);
+  _suspended=true;
+  _interrupt=true;
+  _cv.wait(lock,[this]{ return !_busy; });
+  _interrupt=false;
+}
+
+/*!
+ * To be called after suspend, once time step \a timeStepId of \a leaf has been built.
+ * The arrays already prefetched for \a timeStepId are now owned by the built dataset and are forgotten.
+ * If the requested time step does not follow the previous one (jump) or if \a leaf or its activated arrays changed,
+ * the other prefetched arrays are released. Then the worker is restarted on the \a _depth next time steps in the play direction
+ * (among the published ones only if they are decimated).
+ * The worker thread is started by the first call.
+ */
+void MEDTimeStepsPrefetcher::resume(const MEDFileFieldRepresentationLeaves *leaf, int timeStepId)
+{
+  std::ostringstream oss; oss << leaf << "/" << leaf->getKeyOfActivatedArrays();
+  std::string leafKey(oss.str());
+  std::lock_guard<std::mutex> lock(_mutex);
+  std::map<int,Entry>::iterator it(_prefetched.find(timeStepId));
+  if(it!=_prefetched.end())
+    {
+      _size-=(*it).second._size;
+      _prefetched.erase(it);
+    }
+  int nbOfTS(leaf->getNumberOfTS()),delta(0);
+  if(getFollowingTimeStep(_last_time_step_id,1,nbOfTS)==timeStepId)
+    delta=1;
+  else if(getFollowingTimeStep(_last_time_step_id,-1,nbOfTS)==timeStepId)
+    delta=-1;
+  if(leafKey!=_leaf_key || delta==0)
+    releaseAllExcept(timeStepId);
+  if(delta!=0)
+    _direction=delta;
+  _leaf=leaf; _leaf_key=leafKey;
+  _last_time_step_id=timeStepId;
+  _todo.clear();
+  for(int i=1,tsId=timeStepId;i<=_depth;i++)
+    {
+      tsId=getFollowingTimeStep(tsId,_direction,nbOfTS);
+      if(tsId<0)
+        break;
+      if(_prefetched.find(tsId)==_prefetched.end())
+        _todo.push_back(tsId);
+    }
+  _suspended=false;
+  if(!_thread.joinable())
+    _thread=std::thread(&MEDTimeStepsPrefetcher::run,this);
+  _cv.notify_all();
+}
+
+/*!
+ * Releases all the arrays prefetched and not used. To be called after suspend.
+ * The arrays prefetched for the time steps \a usedTimeStepIds have been given without copy to the dataset just built :
+ * they are forgotten without being released.
+ */
+void MEDTimeStepsPrefetcher::cancel(const std::vector<int>& usedTimeStepIds)
+{
+  std::lock_guard<std::mutex> lock(_mutex);
+  _todo.clear();
+  for(std::vector<int>::const_iterator it=usedTimeStepIds.begin();it!=usedTimeStepIds.end();it++)
+    {
+      std::map<int,Entry>::iterator it2(_prefetched.find(*it));
+      if(it2==_prefetched.end())
+        continue;
+      _size-=(*it2).second._size;
+      _prefetched.erase(it2);
+    }
+  releaseAllExcept(-1);
+  _leaf=0; _leaf_key.clear();
+  _last_time_step_id=-1;
+}
+
+/*!
+ * \a _mutex is expected to be held and the worker to be idle.
+ */
+void MEDTimeStepsPrefetcher::releaseAllExcept(int timeStepId)
+{
+  for(std::map<int,Entry>::iterator it=_prefetched.begin();it!=_prefetched.end();)
+    {
+      if((*it).first==timeStepId)
+        {
+          it++;
+          continue;
+        }
+      for(std::vector< MCAuto<MEDFileAnyTypeField1TS> >::iterator it2=(*it).second._f1ts.begin();it2!=(*it).second._f1ts.end();it2++)
+        (*it2)->unloadArraysWithoutDataLoss();
+      _size-=(*it).second._size;
+      it=_prefetched.erase(it);
+    }
+}
+
+/*!
+ * Returns the time step played after \a timeStepId in the direction \a direction (1 or -1) : the next one or, if the time steps are
+ * decimated, the next published one. Returns -1 if there is none.
+ */
+int MEDTimeStepsPrefetcher::getFollowingTimeStep(int timeStepId, int direction, int nbOfTS) const
+{
+  if(_published.empty())
+    {
+      int ret(timeStepId+direction);
+      return ret>=0 && ret<nbOfTS?ret:-1;
+    }
+  if(direction>0)
+    {
+      std::vector<int>::const_iterator it(std::upper_bound(_published.begin(),_published.end(),timeStepId));
+      return it!=_published.end() && *it<nbOfTS?*it:-1;
+    }
+  std::vector<int>::const_iterator it(std::lower_bound(_published.begin(),_published.end(),timeStepId));
+  return it!=_published.begin() && timeStepId>=0?*(--it):-1;
+}
+
+void MEDTimeStepsPrefetcher::run()
+{
+  std::unique_lock<std::mutex> lock(_mutex);
+  while(true)
+    {
+      _cv.wait(lock,[this]{ return _stop || (!_suspended && !_todo.empty()); });
+      if(_stop)
+        return ;
+      if(_size>=((std::size_t)_max_size_in_mb)*1024*1024)
+        {
+          _todo.clear();
+          continue;
+        }
+      int timeStepId(_todo.front());
+      _todo.pop_front();
+      const MEDFileFieldRepresentationLeaves *leaf(_leaf);
+      _busy=true;
+      lock.unlock();
+      std::vector< MCAuto<MEDFileAnyTypeField1TS> > loaded;
+      std::size_t sz(0);
+      try
+        {
+          sz=leaf->prefetchTimeStep(timeStepId,loaded,_interrupt);
+        }
+      catch(INTERP_KERNEL::Exception&)
+        {// the main thread will report the problem when requesting this time step
+        }
+      lock.lock();
+      _busy=false;
+      if(!loaded.empty())
+        {
+          Entry& entry(_prefetched[timeStepId]);
+          entry._f1ts.insert(entry._f1ts.end(),loaded.begin(),loaded.end());
+          entry._size+=sz;
+          _size+=sz;
+        }
+      _cv.notify_all();
+    }
+}
@@ -0,0 +1,94 @@
+// Copyright (C) 2010-2026  CEA, EDF
+//
+// This library is free software; you can redistribute it and/or
+// modify it under the terms of the GNU Lesser General Public
+// License as published by the Free Software Foundation; either
+// version 2.1 of the License, or (at your option) any later version.
+//
+// This library is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+// Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public
+// License along with this library; if not, write to the Free Software
+// Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+//
+// See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+//
+// Author : Anthony Geay
+
+#ifndef __MEDTIMESTEPSPREFETCHER_HXX__
+#define __MEDTIMESTEPSPREFETCHER_HXX__
+
+#include "MEDLoaderForPV.h"
+#include "MEDFileField.hxx"
+
+#include <atomic>
+#include <condition_variable>
+#include <deque>
+#include <map>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <vector>
+
+class MEDFileFieldRepresentationLeaves;
+
+/*!
+ * Loads in a worker thread the arrays of the time steps following (in the play direction) the last time step requested.
+ * If the time steps given to the pipeline are decimated (see setPublishedTimeSteps), the following ones are the next published ones.
+ * The worker and the caller never access the MEDCoupling objects at the same time : the caller has to invoke suspend
+ * before touching the tree and resume once it is done. Accesses to the file itself are serialized with MEDUtilities::IOMutex.
+ * Only the arrays loaded by the worker and not used since are released (when the requested time step jumps, when
+ * the activated arrays change, when the prefetch is disabled or at destruction).
+ * The worker thread is only started when something has to be prefetched.
+ */
+class MEDLOADERFORPV_EXPORT MEDTimeStepsPrefetcher
+{
+public:
+  MEDTimeStepsPrefetcher();
+  ~MEDTimeStepsPrefetcher();
+  void setDepth(int depth) { _depth=depth>0?depth:0; }
+  int getDepth() const { return _depth; }
+  void setMaxSizeInMB(int maxSizeInMB) { _max_size_in_mb=maxSizeInMB>0?maxSizeInMB:0; }
+  int getMaxSizeInMB() const { return _max_size_in_mb; }
+  void setPublishedTimeSteps(const std::vector<int>& timeStepIds) { _published=timeStepIds; }
+  void suspend();
+  void resume(const MEDFileFieldRepresentationLeaves *leaf, int timeStepId);
+  void cancel(const std::vector<int>& usedTimeStepIds=std::vector<int>());
+private:
+  void run();
+  void releaseAllExcept(int timeStepId);
+  int getFollowingTimeStep(int timeStepId, int direction, int nbOfTS) const;
+private:
+  class Entry
+  {
+  public:
+    Entry():_size(0) { }
+    std::vector< MEDCoupling::MCAuto<MEDCoupling::MEDFileAnyTypeField1TS> > _f1ts;
+    std::size_t _size;
+  };
+  int _depth;
+  int _max_size_in_mb;
+  std::thread _thread;
+  std::mutex _mutex;
+  std::condition_variable _cv;
+  bool _stop;
+  bool _suspended;
+  bool _busy;
+  //! set by suspend to stop as soon as possible the time step currently loaded.
+  std::atomic<bool> _interrupt;
+  std::deque<int> _todo;
+  const MEDFileFieldRepresentationLeaves *_leaf;
+  std::string _leaf_key;
+  int _last_time_step_id;
+  int _direction;
+  //! sorted positions of the time steps played. Empty means all the time steps.
+  std::vector<int> _published;
+  //! for each time step loaded by the worker and not used since, the 1TS loaded.
+  std::map<int,Entry> _prefetched;
+  std::size_t _size;
+};
+
+#endif
@@ -28,6 +28,17 @@
 vtkInformationKeyMacro(MEDUtilities,ELGA,Integer)
 vtkInformationKeyMacro(MEDUtilities,ELNO,Integer)
 
+/*!
+ * Mutex to be held during each read in a MED file. HDF5 is not thread safe and files are read by several threads
+ * (see MEDTimeStepsPrefetcher). It is also held when MEDCoupling objects shared between threads are used, their reference
+ * counters not being atomic (see MEDFileFieldRepresentationLeavesArrays::buildDataArrays).
+ */
+std::mutex& MEDUtilities::IOMutex()
+{
+  static std::mutex ioMutex;
+  return ioMutex;
+}
+
 void ExportedTinyInfo::pushGaussAdditionnalInfo(int ct, int dim, const std::vector<double>& refCoo, const std::vector<double>& posInRefCoo)
 {
   prepareForAppend();
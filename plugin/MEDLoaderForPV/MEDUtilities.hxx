@@ -24,6 +24,7 @@
 #include "MEDLoaderForPV.h"
 #include "vtkCellType.h"
 
+#include <mutex>
 #include <vector>
 
 class vtkInformationIntegerKey;
@@ -33,6 +34,7 @@ class MEDLOADERFORPV_EXPORT MEDUtilities
 public:
   static vtkInformationIntegerKey *ELGA();
   static vtkInformationIntegerKey *ELNO();
+  static std::mutex& IOMutex();
 };
 
 class ExportedTinyInfo
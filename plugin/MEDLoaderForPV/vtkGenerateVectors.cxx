@@ -21,6 +21,7 @@
 #include "vtkGenerateVectors.h"
 #include "vtkAOSDataArrayTemplate.h"
 #include "vtkDoubleArray.h"
+#include "vtkFloatArray.h"
 #include "vtkInformation.h"
 #include "vtkUnstructuredGrid.h"
 #include "vtkQuadratureSchemeDefinition.h"
@@ -54,26 +55,25 @@ void vtkGenerateVectors::Operate(vtkFieldData *fd)
   if(!fd)
     return ;
   const int nbOfArrs(fd->GetNumberOfArrays());
-  std::vector<vtkDoubleArray *> daToAppend;
+  std::vector<vtkDataArray *> daToAppend;
   for(int i=0;i<nbOfArrs;i++)
     {
       vtkDataArray *arr(fd->GetArray(i));
       if(!arr)
         continue;
-      vtkDoubleArray *arrc(vtkDoubleArray::SafeDownCast(arr));
-      if(!arrc)
-        continue;
-      int nbOfCompo(arrc->GetNumberOfComponents());
+      int nbOfCompo(arr->GetNumberOfComponents());
       if(nbOfCompo<=1 || nbOfCompo==3)
         continue;
-      if(nbOfCompo==2)
-        daToAppend.push_back(Operate2Compo(arrc));
-      else
-        daToAppend.push_back(OperateMoreThan3Compo(arrc));
+      vtkDoubleArray *arrc(vtkDoubleArray::SafeDownCast(arr));
+      vtkFloatArray *arrf(vtkFloatArray::SafeDownCast(arr));// single precision mode of MEDReader
+      if(arrc)
+        daToAppend.push_back(nbOfCompo==2?Operate2Compo(arrc):OperateMoreThan3Compo(arrc));
+      else if(arrf)
+        daToAppend.push_back(nbOfCompo==2?Operate2Compo(arrf):OperateMoreThan3Compo(arrf));
     }
-  for(std::vector<vtkDoubleArray *>::const_iterator it=daToAppend.begin();it!=daToAppend.end();it++)
+  for(std::vector<vtkDataArray *>::const_iterator it=daToAppend.begin();it!=daToAppend.end();it++)
     {
-      vtkDoubleArray *elt(*it);
+      vtkDataArray *elt(*it);
       if(!elt)
 	continue;
       fd->AddArray(elt);
@@ -81,37 +81,40 @@ void vtkGenerateVectors::Operate(vtkFieldData *fd)
     }
 }
 
-vtkDoubleArray *vtkGenerateVectors::Operate2Compo(vtkDoubleArray *oldArr)
+template<class VTKT>
+VTKT *GenerateVector2Compo(VTKT *oldArr)
 {
-  const int VTK_DATA_ARRAY_FREE=vtkAOSDataArrayTemplate<double>::VTK_DATA_ARRAY_FREE;
-  vtkDoubleArray *ret(vtkDoubleArray::New());
+  typedef typename VTKT::ValueType T;
+  const int VTK_DATA_ARRAY_FREE=vtkAOSDataArrayTemplate<T>::VTK_DATA_ARRAY_FREE;
+  VTKT *ret(VTKT::New());
   vtkIdType nbOfTuples(oldArr->GetNumberOfTuples());
-  const double *inPt(oldArr->GetPointer(0));
-  double *pt((double *)malloc(nbOfTuples*3*sizeof(double)));
+  const T *inPt(oldArr->GetPointer(0));
+  T *pt((T *)malloc(nbOfTuples*3*sizeof(T)));
   for(vtkIdType i=0;i<nbOfTuples;i++)
     {
       pt[3*i+0]=inPt[2*i+0];
       pt[3*i+1]=inPt[2*i+1];
-      pt[3*i+2]=0.;
+      pt[3*i+2]=(T)0;
     }
   ret->SetNumberOfComponents(3);
-  std::string newName(SuffixFieldName(oldArr->GetName()));
+  std::string newName(vtkGenerateVectors::SuffixFieldName(oldArr->GetName()));
   ret->SetName(newName.c_str());
   ret->SetComponentName(0,oldArr->GetComponentName(0));
   ret->SetComponentName(1,oldArr->GetComponentName(1));
   ret->SetArray(pt,3*nbOfTuples,0,VTK_DATA_ARRAY_FREE);
-  UpdateInformationOfArray(oldArr,ret);
   return ret;
 }
 
-vtkDoubleArray *vtkGenerateVectors::OperateMoreThan3Compo(vtkDoubleArray *oldArr)
+template<class VTKT>
+VTKT *GenerateVectorMoreThan3Compo(VTKT *oldArr)
 {
-  const int VTK_DATA_ARRAY_FREE=vtkAOSDataArrayTemplate<double>::VTK_DATA_ARRAY_FREE;
-  vtkDoubleArray *ret(vtkDoubleArray::New());
+  typedef typename VTKT::ValueType T;
+  const int VTK_DATA_ARRAY_FREE=vtkAOSDataArrayTemplate<T>::VTK_DATA_ARRAY_FREE;
+  VTKT *ret(VTKT::New());
   int nbOfCompo(oldArr->GetNumberOfComponents());
   vtkIdType nbOfTuples(oldArr->GetNumberOfTuples());
-  const double *inPt(oldArr->GetPointer(0));
-  double *pt((double *)malloc(nbOfTuples*3*sizeof(double)));
+  const T *inPt(oldArr->GetPointer(0));
+  T *pt((T *)malloc(nbOfTuples*3*sizeof(T)));
   for(vtkIdType i=0;i<nbOfTuples;i++)
     {
       pt[3*i+0]=inPt[nbOfCompo*i+0];
@@ -119,17 +122,44 @@ vtkDoubleArray *vtkGenerateVectors::OperateMoreThan3Compo(vtkDoubleArray *oldArr
       pt[3*i+2]=inPt[nbOfCompo*i+2];
     }
   ret->SetNumberOfComponents(3);
-  std::string newName(SuffixFieldName(oldArr->GetName()));
+  std::string newName(vtkGenerateVectors::SuffixFieldName(oldArr->GetName()));
   ret->SetName(newName.c_str());
   ret->SetComponentName(0,oldArr->GetComponentName(0));
   ret->SetComponentName(1,oldArr->GetComponentName(1));
   ret->SetComponentName(2,oldArr->GetComponentName(2));
   ret->SetArray(pt,3*nbOfTuples,0,VTK_DATA_ARRAY_FREE);
+  return ret;
+}
+
+vtkDoubleArray *vtkGenerateVectors::Operate2Compo(vtkDoubleArray *oldArr)
+{
+  vtkDoubleArray *ret(GenerateVector2Compo<vtkDoubleArray>(oldArr));
+  UpdateInformationOfArray(oldArr,ret);
+  return ret;
+}
+
+vtkDoubleArray *vtkGenerateVectors::OperateMoreThan3Compo(vtkDoubleArray *oldArr)
+{
+  vtkDoubleArray *ret(GenerateVectorMoreThan3Compo<vtkDoubleArray>(oldArr));
+  UpdateInformationOfArray(oldArr,ret);
+  return ret;
+}
+
+vtkFloatArray *vtkGenerateVectors::Operate2Compo(vtkFloatArray *oldArr)
+{
+  vtkFloatArray *ret(GenerateVector2Compo<vtkFloatArray>(oldArr));
+  UpdateInformationOfArray(oldArr,ret);
+  return ret;
+}
+
+vtkFloatArray *vtkGenerateVectors::OperateMoreThan3Compo(vtkFloatArray *oldArr)
+{
+  vtkFloatArray *ret(GenerateVectorMoreThan3Compo<vtkFloatArray>(oldArr));
   UpdateInformationOfArray(oldArr,ret);
   return ret;
 }
 
-void vtkGenerateVectors::UpdateInformationOfArray(vtkDoubleArray *oldArr, vtkDoubleArray *arr)
+void vtkGenerateVectors::UpdateInformationOfArray(vtkDataArray *oldArr, vtkDataArray *arr)
 {
   if(oldArr->GetInformation()->Has(vtkQuadratureSchemeDefinition::QUADRATURE_OFFSET_ARRAY_NAME()))
     {
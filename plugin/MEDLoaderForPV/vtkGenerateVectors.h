@@ -25,6 +25,8 @@
 
 class vtkFieldData;
 class vtkDoubleArray;
+class vtkFloatArray;
+class vtkDataArray;
 
 class VTK_EXPORT vtkGenerateVectors
 {
@@ -33,11 +35,13 @@ public:
   static void Operate(vtkFieldData *fd);
   static vtkDoubleArray *Operate2Compo(vtkDoubleArray *oldArr);
   static vtkDoubleArray *OperateMoreThan3Compo(vtkDoubleArray *oldArr);
+  static vtkFloatArray *Operate2Compo(vtkFloatArray *oldArr);
+  static vtkFloatArray *OperateMoreThan3Compo(vtkFloatArray *oldArr);
   static std::string SuffixFieldName(const std::string& name);
 public:
   static const char VECTOR_SUFFIX[];
 protected:
-  static void UpdateInformationOfArray(vtkDoubleArray *oldArr, vtkDoubleArray *arr);
+  static void UpdateInformationOfArray(vtkDataArray *oldArr, vtkDataArray *arr);
 };
 
 #endif
@@ -21,6 +21,7 @@
 #include "vtkExtractGroup.h"
 #include "MEDFileFieldRepresentationTree.hxx"
 #include "ExtractGroupHelper.h"
+#include "MEDFamilyIdsIndex.hxx"
 #include "vtkMEDReader.h"
 #include "VTKMEDTraits.hxx"
 
@@ -63,14 +64,28 @@
 #include "vtkMultiBlockDataGroupFilter.h"
 #include "vtkMergeBlocks.h"
 #include "vtkInformationDataObjectMetaDataKey.h"
+#include "vtkCellArray.h"
+#include "vtkCellType.h"
+#include "vtkFieldData.h"
+#include "vtkIdList.h"
+#include "vtkIdTypeArray.h"
+#include "vtkPoints.h"
+#include "vtkSMPThreadLocalObject.h"
+#include "vtkSMPTools.h"
 
+#include <algorithm>
 #include <map>
 #include <deque>
+#include <vector>
 
 vtkStandardNewMacro(vtkExtractGroup)
 
 class vtkExtractGroup::vtkExtractGroupInternal : public ExtractGroupInternal
 {
+public:
+  //! inverted indexes of the family ids on cells and on points of the input, kept from one request to the next.
+  MEDFamilyIdsIndex _cells_index;
+  MEDFamilyIdsIndex _points_index;
 };
 
 ////////////////////
@@ -130,24 +145,128 @@ void vtkExtractGroup::SetSIL(vtkMutableDirectedGraph *mdg)
   this->SIL=mdg;
 }
 
+/*!
+ * Returns a new unstructured grid made of the cells of \a input selected by \a selection, and of their points only (renumbered in ascending order).
+ * If \a selection is on points (\a onCells false), a cell is selected if all its points are. If \a insideOut is true the other cells are extracted.
+ * Returns 0 if \a input is not an unstructured grid or if a polyhedron is to be extracted : vtkThreshold has to be used in these cases.
+ */
+vtkUnstructuredGrid *ExtractSelection(vtkDataSet *input, const std::vector<char>& selection, bool onCells, bool insideOut)
+{
+  vtkUnstructuredGrid *ug(vtkUnstructuredGrid::SafeDownCast(input));
+  if(!ug || !ug->GetPoints())
+    return 0;
+  vtkCellArray *cells(ug->GetCells());
+  vtkIdType nbOfCells(ug->GetNumberOfCells()),nbOfPts(ug->GetNumberOfPoints());
+  const char *sel(selection.data());
+  char expected(insideOut?0:1);
+  std::vector<char> keep(nbOfCells);
+  char *keepPt(keep.data());
+  vtkSMPThreadLocalObject<vtkIdList> tmpIds;
+  if(onCells)
+    vtkSMPTools::For(0,nbOfCells,[sel,expected,keepPt](vtkIdType begin, vtkIdType end)
+      {
+        for(vtkIdType i=begin;i<end;i++)
+          keepPt[i]=sel[i]==expected;
+      });
+  else
+    vtkSMPTools::For(0,nbOfCells,[cells,sel,expected,keepPt,&tmpIds](vtkIdType begin, vtkIdType end)
+      {
+        vtkIdList *ptIds(tmpIds.Local());
+        for(vtkIdType i=begin;i<end;i++)
+          {
+            vtkIdType npts;
+            const vtkIdType *pts;
+            cells->GetCellAtId(i,npts,pts,ptIds);
+            bool ok(true);
+            for(vtkIdType j=0;j<npts && ok;j++)
+              ok=sel[pts[j]]==expected;
+            keepPt[i]=ok;
+          }
+      });
+  vtkNew<vtkIdList> srcCellIds,ptIds;
+  vtkNew<vtkIdTypeArray> outOffsets;
+  outOffsets->InsertNextValue(0);
+  std::vector<vtkIdType> pointMap(nbOfPts,-1);
+  for(vtkIdType i=0;i<nbOfCells;i++)
+    {
+      if(!keepPt[i])
+        continue;
+      if(ug->GetCellType(i)==VTK_POLYHEDRON)
+        return 0;
+      vtkIdType npts;
+      const vtkIdType *pts;
+      cells->GetCellAtId(i,npts,pts,ptIds);
+      for(vtkIdType j=0;j<npts;j++)
+        pointMap[pts[j]]=0;
+      srcCellIds->InsertNextId(i);
+      outOffsets->InsertNextValue(outOffsets->GetValue(outOffsets->GetNumberOfTuples()-1)+npts);
+    }
+  vtkNew<vtkIdList> srcPtIds;
+  for(vtkIdType i=0;i<nbOfPts;i++)
+    if(pointMap[i]==0)
+      {
+        pointMap[i]=srcPtIds->GetNumberOfIds();
+        srcPtIds->InsertNextId(i);
+      }
+  // connectivity renumbering
+  vtkIdType nbOfCellsOut(srcCellIds->GetNumberOfIds()),nbOfPtsOut(srcPtIds->GetNumberOfIds());
+  vtkNew<vtkIdTypeArray> outConn;
+  outConn->SetNumberOfTuples(outOffsets->GetValue(nbOfCellsOut));
+  vtkNew<vtkUnsignedCharArray> outTypes;
+  outTypes->SetNumberOfTuples(nbOfCellsOut);
+  const vtkIdType *cellIdsPt(srcCellIds->GetPointer(0)),*offsetsPt(outOffsets->GetPointer(0)),*mapPt(pointMap.data());
+  vtkIdType *connPt(outConn->GetPointer(0));
+  unsigned char *typesPt(outTypes->GetPointer(0));
+  vtkSMPTools::For(0,nbOfCellsOut,[ug,cells,cellIdsPt,offsetsPt,mapPt,connPt,typesPt,&tmpIds](vtkIdType begin, vtkIdType end)
+    {
+      vtkIdList *ptIds(tmpIds.Local());
+      for(vtkIdType i=begin;i<end;i++)
+        {
+          vtkIdType npts;
+          const vtkIdType *pts;
+          cells->GetCellAtId(cellIdsPt[i],npts,pts,ptIds);
+          vtkIdType *dst(connPt+offsetsPt[i]);
+          for(vtkIdType j=0;j<npts;j++)
+            dst[j]=mapPt[pts[j]];
+          typesPt[i]=(unsigned char)ug->GetCellType(cellIdsPt[i]);
+        }
+    });
+  vtkUnstructuredGrid *ret(vtkUnstructuredGrid::New());
+  vtkNew<vtkCellArray> outCells;
+  outCells->SetData(outOffsets,outConn);
+  ret->SetCells(outTypes,outCells);
+  vtkNew<vtkPoints> outPts;
+  outPts->SetDataType(ug->GetPoints()->GetDataType());
+  outPts->SetNumberOfPoints(nbOfPtsOut);
+  ug->GetPoints()->GetData()->GetTuples(srcPtIds,outPts->GetData());
+  ret->SetPoints(outPts);
+  // point and cell arrays
+  vtkNew<vtkIdList> dstPtIds,dstCellIds;
+  dstPtIds->SetNumberOfIds(nbOfPtsOut);
+  for(vtkIdType i=0;i<nbOfPtsOut;i++)
+    dstPtIds->SetId(i,i);
+  dstCellIds->SetNumberOfIds(nbOfCellsOut);
+  for(vtkIdType i=0;i<nbOfCellsOut;i++)
+    dstCellIds->SetId(i,i);
+  ret->GetPointData()->CopyAllocate(ug->GetPointData(),nbOfPtsOut);
+  ret->GetPointData()->CopyData(ug->GetPointData(),srcPtIds,dstPtIds);
+  ret->GetCellData()->CopyAllocate(ug->GetCellData(),nbOfCellsOut);
+  ret->GetCellData()->CopyData(ug->GetCellData(),srcCellIds,dstCellIds);
+  ret->GetFieldData()->ShallowCopy(input->GetFieldData());
+  return ret;
+}
+
+/*!
+ * The tuples to keep are found thanks to \a index (updated if needed) which is way faster than scanning the family array once per family.
+ * The extraction itself is done by ExtractSelection when possible, by \a thres otherwise.
+ */
 template<class CellPointExtractor>
-vtkDataSet *FilterFamilies(vtkSmartPointer<vtkThreshold>& thres,
+vtkDataSet *FilterFamilies(MEDFamilyIdsIndex& index, vtkSmartPointer<vtkThreshold>& thres,
                            vtkDataSet *input, const std::set<int>& idsToKeep, bool insideOut, const char *arrNameOfFamilyField,
                            const char *associationForThreshold, bool& catchAll, bool& catchSmth)
 {
   const int VTK_DATA_ARRAY_DELETE=vtkAOSDataArrayTemplate<double>::VTK_DATA_ARRAY_DELETE;
   const char ZE_SELECTION_ARR_NAME[]="@@ZeSelection@@";
-  vtkDataSet *output(input->NewInstance());
-  output->ShallowCopy(input);
-  thres->SetInputData(output);
-  //vtkDataSetAttributes *dscIn(input->GetCellData()),*dscIn2(input->GetPointData()); // todo: unused
-  //vtkDataSetAttributes *dscOut(output->GetCellData()),*dscOut2(output->GetPointData()); // todo: unused
-  //
-  double vMin(insideOut==0?1.:0.),vMax(insideOut==0?2.:1.);
-  thres->SetUpperThreshold(vMax);
-  thres->SetLowerThreshold(vMin);
-  // OK for the output
-  //
   CellPointExtractor cpe2(input);
   vtkDataArray *da(cpe2.Get()->GetScalars(arrNameOfFamilyField));
   if(!da)
@@ -158,30 +277,27 @@ vtkDataSet *FilterFamilies(vtkSmartPointer<vtkThreshold>& thres,
   if(daName!=arrNameOfFamilyField || !dai)
     return 0;
   //
+  std::vector<char> selection;
+  index.update(dai);
+  index.select(idsToKeep,selection,catchAll,catchSmth);
+  vtkDataSet *ret(ExtractSelection(input,selection,CellPointExtractor::ON_CELLS,insideOut));
+  if(ret)
+    return ret;
+  //
+  vtkDataSet *output(input->NewInstance());
+  output->ShallowCopy(input);
+  thres->SetInputData(output);
+  double vMin(insideOut==0?1.:0.),vMax(insideOut==0?2.:1.);
+  thres->SetUpperThreshold(vMax);
+  thres->SetLowerThreshold(vMin);
   int nbOfTuples(dai->GetNumberOfTuples());
   vtkCharArray *zeSelection(vtkCharArray::New());
   zeSelection->SetName(ZE_SELECTION_ARR_NAME);
   zeSelection->SetNumberOfComponents(1);
   char *pt(new char[nbOfTuples]);
   zeSelection->SetArray(pt,nbOfTuples,0,VTK_DATA_ARRAY_DELETE);
-  const MEDCoupling::mcIdType *inPtr(dai->GetPointer(0));
-  std::fill(pt,pt+nbOfTuples,0);
-  catchAll=true; catchSmth=false;
-  std::vector<bool> pt2(nbOfTuples,false);
-  for(std::set<int>::const_iterator it=idsToKeep.begin();it!=idsToKeep.end();it++)
-    {
-      bool catchFid(false);
-      for(int i=0;i<nbOfTuples;i++)
-        if(inPtr[i]==*it)
-          { pt2[i]=true; catchFid=true; }
-      if(!catchFid)
-        catchAll=false;
-      else
-        catchSmth=true;
-    }
   for(int ii=0;ii<nbOfTuples;ii++)
-    if(pt2[ii])
-      pt[ii]=2;
+    pt[ii]=selection[ii]?2:0;
   CellPointExtractor cpe3(output);
   int idx(cpe3.Get()->AddArray(zeSelection));
   cpe3.Get()->SetActiveAttribute(idx,vtkDataSetAttributes::SCALARS);
@@ -201,6 +317,7 @@ vtkDataSet *FilterFamilies(vtkSmartPointer<vtkThreshold>& thres,
 class CellExtractor
 {
 public:
+  static const bool ON_CELLS=true;
   CellExtractor(vtkDataSet *ds):_ds(ds) { }
   vtkDataSetAttributes *Get() { return _ds->GetCellData(); }
 private:
@@ -210,6 +327,7 @@ private:
 class PointExtractor
 {
 public:
+  static const bool ON_CELLS=false;
   PointExtractor(vtkDataSet *ds):_ds(ds) { }
   vtkDataSetAttributes *Get() { return _ds->GetPointData(); }
 private:
@@ -242,7 +360,7 @@ int vtkExtractGroup::RequestData(vtkInformation * /*request*/, vtkInformationVec
       // first shrink the input
       bool catchAll,catchSmth;
       vtkSmartPointer<vtkThreshold> thres1(vtkSmartPointer<vtkThreshold>::New()),thres2(vtkSmartPointer<vtkThreshold>::New());
-      vtkDataSet *tryOnCell(FilterFamilies<CellExtractor>(thres1,input,idsToKeep,this->InsideOut,
+      vtkDataSet *tryOnCell(FilterFamilies<CellExtractor>(this->Internal->_cells_index,thres1,input,idsToKeep,this->InsideOut,
                                                           MEDFileFieldRepresentationLeavesArrays::FAMILY_ID_CELL_NAME,"vtkDataObject::FIELD_ASSOCIATION_CELLS",catchAll,catchSmth));
       if(tryOnCell)
         {
@@ -256,7 +374,7 @@ int vtkExtractGroup::RequestData(vtkInformation * /*request*/, vtkInformationVec
             {
               if(catchSmth)
                 {
-                  vtkDataSet *tryOnNode(FilterFamilies<PointExtractor>(thres2,input,idsToKeep,this->InsideOut,
+                  vtkDataSet *tryOnNode(FilterFamilies<PointExtractor>(this->Internal->_points_index,thres2,input,idsToKeep,this->InsideOut,
                                                                        MEDFileFieldRepresentationLeavesArrays::FAMILY_ID_NODE_NAME,"vtkDataObject::FIELD_ASSOCIATION_POINTS",catchAll,catchSmth));
                   if(tryOnNode && catchSmth)
                     {
@@ -277,7 +395,7 @@ int vtkExtractGroup::RequestData(vtkInformation * /*request*/, vtkInformationVec
                 }
               else
                 {
-                  vtkDataSet *tryOnNode(FilterFamilies<PointExtractor>(thres1,input,idsToKeep,this->InsideOut,
+                  vtkDataSet *tryOnNode(FilterFamilies<PointExtractor>(this->Internal->_points_index,thres1,input,idsToKeep,this->InsideOut,
                                                                        MEDFileFieldRepresentationLeavesArrays::FAMILY_ID_NODE_NAME,"vtkDataObject::FIELD_ASSOCIATION_POINTS",catchAll,catchSmth));
                   if(tryOnNode)
                     {
@@ -297,7 +415,7 @@ int vtkExtractGroup::RequestData(vtkInformation * /*request*/, vtkInformationVec
         }
       else
         {
-          vtkDataSet *tryOnNode(FilterFamilies<PointExtractor>(thres1,input,idsToKeep,this->InsideOut,
+          vtkDataSet *tryOnNode(FilterFamilies<PointExtractor>(this->Internal->_points_index,thres1,input,idsToKeep,this->InsideOut,
                                                                MEDFileFieldRepresentationLeavesArrays::FAMILY_ID_NODE_NAME,"vtkDataObject::FIELD_ASSOCIATION_POINTS",catchAll,catchSmth));
           if(tryOnNode)
             {
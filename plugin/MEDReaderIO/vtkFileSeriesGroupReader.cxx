@@ -19,17 +19,26 @@
 
 #include "vtkFileSeriesGroupReader.h"
 
-#include <vtkCollection.h>
 #include <vtkInformation.h>
 #include <vtkInformationVector.h>
+#include <vtkIntArray.h>
 #include <vtkMultiBlockDataSet.h>
 #include <vtkMultiProcessController.h>
+#include <vtkNew.h>
 #include <vtkObjectFactory.h>
 #include <vtkSmartPointer.h>
 #include <vtkStreamingDemandDrivenPipeline.h>
+#include <vtksys/SystemTools.hxx>
 
 #include "vtkMEDReader.h"
 
+#include <algorithm>
+#include <atomic>
+#include <exception>
+#include <future>
+#include <iterator>
+#include <map>
+#include <set>
 #include <vector>
 #include <string>
 
@@ -39,9 +48,68 @@ vtkStandardNewMacro(vtkFileSeriesGroupReader);
 struct vtkFileSeriesGroupReaderInternals
 {
   std::vector<std::string> FileNames;
-  vtkNew<vtkCollection> ReaderCollection;
+  // Readers of the files read by this process, kept across time steps to avoid reloading the structure of the files.
+  std::map<std::string, vtkSmartPointer<vtkMEDReader> > ReaderPool;
+  // Rank of the process reading each file, and the files and number of processes it was computed for.
+  vtkNew<vtkIntArray> FileAssignment;
+  std::vector<std::string> AssignedFileNames;
+  int AssignedNumberOfProcesses = 0;
 };
 
+namespace
+{
+//----------------------------------------------------------------------------
+// Copy the properties of src to dst. Only the differing ones are set, so that an unchanged
+// dst keeps its MTime and does not execute again its RequestInformation.
+void PropagateProperties(vtkMEDReader* src, vtkMEDReader* dst)
+{
+  for (int iField = 0; iField < src->GetNumberOfFieldsTreeArrays(); iField++)
+  {
+    const char* name = src->GetFieldsTreeArrayName(iField);
+    dst->SetFieldsStatus(name, src->GetFieldsTreeArrayStatus(name));
+  }
+  for (int iTimes = 0; iTimes < src->GetNumberOfTimesFlagsArrays(); iTimes++)
+  {
+    const char* name = src->GetTimesFlagsArrayName(iTimes);
+    dst->SetTimesFlagsStatus(name, src->GetTimesFlagsArrayStatus(name));
+  }
+  dst->GenerateVectors(src->GetGenerateVect());
+  dst->ChangeMode(src->GetIsStdOrMode());
+  dst->GhostCellGeneratorCallForPara(src->GetGCGCP());
+  dst->GetRidOffDebugArrays(src->GetRemoveDebugArrays());
+  dst->SetCacheSizeInMB(src->GetCacheSizeInMB());
+  dst->SetPrefetchDepth(src->GetPrefetchDepth());
+  dst->SetPrefetchMemoryInMB(src->GetPrefetchMemoryInMB());
+  dst->SetNumberOfFieldsThreads(src->GetNumberOfFieldsThreads());
+  dst->SetUseStructureIndex(src->GetUseStructureIndex());
+  dst->SetStructureIndexDirectory(src->GetStructureIndexDirectory());
+  dst->SetModeMemoryLimitInMB(src->GetModeMemoryLimitInMB());
+  dst->SetPackModes(src->GetPackModes());
+  dst->SetMaxNumberOfPublishedTimeSteps(src->GetMaxNumberOfPublishedTimeSteps());
+  dst->SetSinglePrecision(src->GetSinglePrecision());
+  if (dst->GetDoublePrecisionArrays() != src->GetDoublePrecisionArrays())
+  {
+    dst->ClearDoublePrecisionArrays();
+    for (const std::string& fieldName : src->GetDoublePrecisionArrays())
+      dst->AddDoublePrecisionArray(fieldName.c_str());
+  }
+  dst->SetPartitioningStrategy(src->GetPartitioningStrategy());
+  if (dst->GetGroupsToLoad() != src->GetGroupsToLoad())
+  {
+    dst->ClearGroupsToLoad();
+    for (const std::string& entry : src->GetGroupsToLoad())
+      dst->AddGroupToLoad(entry.c_str());
+  }
+  if (dst->GetComponentsToLoad() != src->GetComponentsToLoad())
+  {
+    dst->ClearComponentsToLoad();
+    for (const auto& fieldCompos : src->GetComponentsToLoad())
+      for (const std::string& compo : fieldCompos.second)
+        dst->AddComponentToLoad(fieldCompos.first.c_str(), compo.c_str());
+  }
+}
+}
+
 //=============================================================================
 vtkFileSeriesGroupReader::vtkFileSeriesGroupReader()
   : Internals(new vtkFileSeriesGroupReaderInternals())
@@ -98,6 +166,69 @@ const char* vtkFileSeriesGroupReader::GetFileName(unsigned int idx)
   return this->Internals->FileNames[idx].c_str();
 }
 
+//----------------------------------------------------------------------------
+vtkIntArray* vtkFileSeriesGroupReader::GetFileAssignment()
+{
+  return this->Internals->FileAssignment;
+}
+
+//----------------------------------------------------------------------------
+void vtkFileSeriesGroupReader::UpdateFileAssignment(vtkMultiProcessController* controller)
+{
+  int nProc = controller ? controller->GetNumberOfProcesses() : 1;
+  vtkFileSeriesGroupReaderInternals* internals = this->Internals.get();
+  if (internals->AssignedFileNames == internals->FileNames && internals->AssignedNumberOfProcesses == nProc)
+  {
+    return;
+  }
+
+  // Cost of a file is its size. Sizes are taken on the first process so that all
+  // processes compute the same assignment.
+  vtkIdType nBlock = static_cast<vtkIdType>(internals->FileNames.size());
+  std::vector<long long> sizes(nBlock, 0);
+  if (!controller || controller->GetLocalProcessId() == 0)
+  {
+    for (vtkIdType i = 0; i < nBlock; i++)
+    {
+      sizes[i] = static_cast<long long>(vtksys::SystemTools::FileLength(internals->FileNames[i]));
+    }
+  }
+  if (nProc > 1 && nBlock > 0)
+  {
+    controller->Broadcast(sizes.data(), nBlock, 0);
+  }
+
+  // Longest processing time first : largest files first, each one given to the least loaded process
+  std::vector<vtkIdType> order(nBlock);
+  for (vtkIdType i = 0; i < nBlock; i++)
+  {
+    order[i] = i;
+  }
+  std::stable_sort(order.begin(), order.end(),
+    [&sizes](vtkIdType a, vtkIdType b) { return sizes[a] > sizes[b]; });
+  std::vector<long long> loads(nProc, 0);
+  std::vector<int> nbOfFiles(nProc, 0);
+  internals->FileAssignment->SetNumberOfValues(nBlock);
+  for (vtkIdType fileId : order)
+  {
+    // With files of the same size, the process having the fewest files wins
+    int best = 0;
+    for (int iProc = 1; iProc < nProc; iProc++)
+    {
+      if (loads[iProc] < loads[best] || (loads[iProc] == loads[best] && nbOfFiles[iProc] < nbOfFiles[best]))
+      {
+        best = iProc;
+      }
+    }
+    loads[best] += sizes[fileId];
+    nbOfFiles[best]++;
+    internals->FileAssignment->SetValue(fileId, best);
+  }
+  internals->FileAssignment->Modified();
+  internals->AssignedFileNames = internals->FileNames;
+  internals->AssignedNumberOfProcesses = nProc;
+}
+
 //----------------------------------------------------------------------------
 int vtkFileSeriesGroupReader::CanReadFile(const char* filename)
 {
@@ -129,7 +260,6 @@ int vtkFileSeriesGroupReader::RequestData(vtkInformation* request,
 
   vtkMultiProcessController *vmpc(vtkMultiProcessController::GetGlobalController());
   unsigned int iProc = vmpc ? vmpc->GetLocalProcessId() : 0;
-  unsigned int nProc = vmpc ? vmpc->GetNumberOfProcesses() : 1;
 
   // Simple case, one file/bloc for n proc
   if (nBlock == 1)
@@ -147,86 +277,109 @@ int vtkFileSeriesGroupReader::RequestData(vtkInformation* request,
       info->CopyEntry(mInfo, vtkMEDReader::GAUSS_DATA());
     }
   }
-  // N file/block read by m proc, with n <= m, means 0/1 file/block per proc
-  else if (nBlock <= nProc && iProc < nBlock)
+  // Multiple files/block, distributed over the procs by size and each one read by a reader of the pool
+  else
   {
-    // Distribute in MEDReader only when reading a single file in a single block
-    vtkMEDReader::SafeDownCast(this->Reader)->SetDistributeWithMPI(false);
-
-    // Needed as the MEDReader do not support changing its filename
-    // without reloading everything.
-    this->ReaderSetFileName(this->GetFileName(iProc));
-    vtkMEDReader::SafeDownCast(this->Reader)->ReloadInternals();
-
-    // Creating new output information.
-    vtkNew<vtkMultiBlockDataSet> mb;
-    vtkNew<vtkInformationVector> newOutInfoVec;
-    newOutInfoVec->Copy(outputVector, true);
-    vtkInformation* newOutInfo = newOutInfoVec->GetInformationObject(0);
-    newOutInfo->Set(vtkDataObject::DATA_OBJECT(), mb);
-
-    // Update the reader
-    this->Reader->ProcessRequest(request, inputVector, newOutInfoVec);
+    this->UpdateFileAssignment(vmpc);
+    std::vector<unsigned int> fileIds;
+    for (unsigned int i = 0; i < nBlock; i++)
+    {
+      if (static_cast<unsigned int>(this->Internals->FileAssignment->GetValue(i)) == iProc)
+      {
+        fileIds.push_back(i);
+      }
+    }
 
-    // Recover the output
-    output->SetBlock(iProc, mb->GetBlock(0));
+    vtkMEDReader* exposedReader = vtkMEDReader::SafeDownCast(this->Reader);
 
-    // Copy the GAUSS_DATA info key
-    vtkInformation* mInfo = this->Reader->GetOutputInformation(0);
-    if (mInfo->Has(vtkMEDReader::GAUSS_DATA()))
+    // Forget the readers of the files no longer read by this process
+    std::set<std::string> filesOfProc;
+    for (unsigned int fileId : fileIds)
     {
-      info->CopyEntry(mInfo, vtkMEDReader::GAUSS_DATA());
+      filesOfProc.insert(this->GetFileName(fileId));
     }
-  }
-  // Multiple files/block per proc
-  else
-  {
-    unsigned int nFiles = nBlock / nProc;
-    unsigned int offFile = iProc * nFiles;
-    unsigned int supFiles = nBlock % nProc;
-
-    // Last proc handle remaining files/block
-    if (iProc + 1 == nProc)
+    auto& pool = this->Internals->ReaderPool;
+    for (auto it = pool.begin(); it != pool.end();)
     {
-      nFiles += supFiles;
+      it = filesOfProc.count(it->first) ? std::next(it) : pool.erase(it);
     }
 
-    vtkMEDReader* exposedReader = vtkMEDReader::SafeDownCast(this->Reader);
-    this->Internals->ReaderCollection->RemoveAllItems();
-    for (unsigned int i = 0; i < nFiles; i++)
+    std::vector<vtkMEDReader*> localReaders;
+    for (unsigned int fileId : fileIds)
     {
-      // Create as many MEDReader as we need to avoid deep copy
-      vtkNew<vtkMEDReader> localReader;
-      this->Internals->ReaderCollection->AddItem(localReader.Get());
+      // One MEDReader per file to avoid deep copy. It is created at the first request only.
+      vtkSmartPointer<vtkMEDReader>& localReader = pool[this->GetFileName(fileId)];
+      if (!localReader)
+      {
+        localReader = vtkSmartPointer<vtkMEDReader>::New();
+        localReader->SetFileName(this->GetFileName(fileId));
+        localReader->SetDistributeWithMPI(false);
+      }
+      PropagateProperties(exposedReader, localReader);
+      localReaders.push_back(localReader);
+    }
 
-      for (int iField = 0; iField < exposedReader->GetNumberOfFieldsTreeArrays(); iField++)
+    // Structure of a file is loaded only once, unless a property requiring it changed.
+    // Readers are independent pipelines : with several threads each one takes the next file not read yet.
+    // Accesses to the MED files are serialized by the readers themselves (MEDUtilities::IOMutex).
+    std::size_t nFiles = localReaders.size();
+    auto readFile = [&localReaders, time](std::size_t i)
+    {
+      localReaders[i]->UpdateInformation();
+      localReaders[i]->UpdateTimeStep(time);
+    };
+    int nThreads = std::min(this->NumberOfReadingThreads, static_cast<int>(nFiles));
+    if (nThreads <= 1)
+    {
+      for (std::size_t i = 0; i < nFiles; i++)
       {
-        const char* name = exposedReader->GetFieldsTreeArrayName(iField);
-        localReader->SetFieldsStatus(name, exposedReader->GetFieldsTreeArrayStatus(name));
+        readFile(i);
       }
-      for (int iTimes = 0; iTimes < exposedReader->GetNumberOfTimesFlagsArrays(); iTimes++)
+    }
+    else
+    {
+      std::vector<std::future<void> > workers;
+      std::atomic<std::size_t> next(0);
+      for (int i = 0; i < nThreads; i++)
       {
-        const char* name = exposedReader->GetTimesFlagsArrayName(iTimes);
-        localReader->SetTimesFlagsStatus(name, exposedReader->GetTimesFlagsArrayStatus(name));
+        workers.push_back(std::async(std::launch::async, [&]()
+        {
+          for (std::size_t j = next++; j < nFiles; j = next++)
+          {
+            readFile(j);
+          }
+        }));
       }
-      localReader->GenerateVectors(exposedReader->GetGenerateVect());
-      localReader->ChangeMode(exposedReader->GetIsStdOrMode());
-      localReader->GhostCellGeneratorCallForPara(exposedReader->GetGCGCP());
-      localReader->GetRidOffDebugArrays(exposedReader->GetRemoveDebugArrays());
-
-      // Configure the localReader for usage with the files
-      localReader->SetFileName(this->GetFileName(i + offFile));
-      localReader->SetDistributeWithMPI(false);
-      localReader->UpdateInformation();
-      localReader->UpdateTimeStep(time);
+      bool isOK = true;
+      for (auto& worker : workers)
+      {
+        try
+        {
+          worker.get();
+        }
+        catch (std::exception& e)
+        {
+          vtkErrorMacro("Exception has been thrown while reading the files : " << e.what());
+          next = nFiles;
+          isOK = false;
+        }
+      }
+      if (!isOK)
+      {
+        return 0;
+      }
+    }
 
-      vtkDataObject* outputReader = vtkMultiBlockDataSet::SafeDownCast(localReader->GetOutputDataObject(0))->GetBlock(0);
-      output->SetBlock(i + offFile, outputReader);
+    // Blocks of the readers are put in the output without copy
+    for (std::size_t i = 0; i < nFiles; i++)
+    {
+      vtkDataObject* outputReader = vtkMultiBlockDataSet::SafeDownCast(localReaders[i]->GetOutputDataObject(0))->GetBlock(0);
+      output->SetBlock(fileIds[i], outputReader);
 
       if (i == 0)
       {
         // Copy the GAUSS_DATA info key of the first filename
-        vtkInformation* mInfo = localReader->GetOutputInformation(0);
+        vtkInformation* mInfo = localReaders[i]->GetOutputInformation(0);
         if (mInfo->Has(vtkMEDReader::GAUSS_DATA()))
         {
           info->CopyEntry(mInfo, vtkMEDReader::GAUSS_DATA());
@@ -252,4 +405,5 @@ void vtkFileSeriesGroupReader::PrintSelf(ostream& os, vtkIndent indent)
 
   os << indent << "MetaFileName: " << (this->_MetaFileName ? this->_MetaFileName : "(none)")
      << endl;
+  os << indent << "NumberOfReadingThreads: " << this->NumberOfReadingThreads << endl;
 }
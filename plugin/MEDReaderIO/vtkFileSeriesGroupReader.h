@@ -25,6 +25,8 @@
 #include <memory>
 
 struct vtkFileSeriesGroupReaderInternals;
+class vtkIntArray;
+class vtkMultiProcessController;
 
 class VTK_EXPORT vtkFileSeriesGroupReader : public vtkMetaReader
 {
@@ -59,6 +61,21 @@ public:
    */
   virtual const char* GetFileName(unsigned int idx);
 
+  /**
+   * Returns, for each file, the rank of the process reading it. Files are
+   * distributed so that the total size of the files read is balanced over
+   * the processes. Empty before the first RequestData.
+   */
+  vtkIntArray* GetFileAssignment();
+
+  /**
+   * Number of threads reading the files of a process when it reads several files.
+   * Reads in the MED files remain serialized, conversions to VTK are done
+   * concurrently. Default is 1 (files are read one after another).
+   */
+  vtkSetClampMacro(NumberOfReadingThreads, int, 1, VTK_INT_MAX);
+  vtkGetMacro(NumberOfReadingThreads, int);
+
 protected:
   vtkFileSeriesGroupReader();
   ~vtkFileSeriesGroupReader() override;
@@ -73,11 +90,17 @@ protected:
   int RequestData(vtkInformation* vtkNotUsed(request), vtkInformationVector** inputVector, vtkInformationVector* outputVector);
   int FillOutputPortInformation(int vtkNotUsed(port), vtkInformation* info);
 
+  /**
+   * Computes the file assignment if the files or the number of processes changed.
+   */
+  void UpdateFileAssignment(vtkMultiProcessController* controller);
+
 private:
   vtkFileSeriesGroupReader(const vtkFileSeriesGroupReader&) = delete;
   void operator=(const vtkFileSeriesGroupReader&) = delete;
 
   std::unique_ptr<vtkFileSeriesGroupReaderInternals> Internals;
+  int NumberOfReadingThreads = 1;
 };
 
 #endif
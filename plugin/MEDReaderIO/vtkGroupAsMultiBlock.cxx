@@ -20,6 +20,7 @@
 
 #include "vtkGroupAsMultiBlock.h"
 #include "ExtractGroupHelper.h"
+#include "MEDFamilyIdsIndex.hxx"
 #include "vtkMEDReader.h"
 #include "vtkUgSelectCellIds.h"
 #include "MEDFileFieldRepresentationTree.hxx"
@@ -43,14 +44,18 @@
 #include <vtkMultiBlockDataSet.h>
 #include <vtkCellCenters.h>
 #include <vtkGlyphSource2D.h>
+#include <vtkSMPTools.h>
 
 class vtkGroupAsMultiBlockInternal : public ExtractGroupInternal
 {
+public:
+  //! inverted index of the family ids of the cells of the input, kept from one request to the next.
+  MEDFamilyIdsIndex _cells_index;
 };
 
 vtkStandardNewMacro(vtkGroupAsMultiBlock)
 
-vtkGroupAsMultiBlock::vtkGroupAsMultiBlock():Internal(new ExtractGroupInternal)
+vtkGroupAsMultiBlock::vtkGroupAsMultiBlock():Internal(new vtkGroupAsMultiBlockInternal)
 {
 }
 
@@ -112,29 +117,39 @@ int vtkGroupAsMultiBlock::RequestData(vtkInformation *vtkNotUsed(request), vtkIn
     vtkErrorMacro(<< "vtkGroupAsMultiBlock::RequestData : cell array " << MEDFileFieldRepresentationLeavesArrays::FAMILY_ID_CELL_NAME << " is exepected to be IdType !");
     return 0; 
   }
-  // Let's go !
+  // Let's go ! cells are bucketed by family once, then the cells of each group are gathered from the buckets of its families
+  vtkGroupAsMultiBlockInternal *internal(this->Internal);
+  internal->_cells_index.update(famIdsArr);
   vtkIdType inputNbCell(famIdsArr->GetNumberOfTuples());
   std::vector< std::pair<std::string,std::vector<int> > > allGroups(this->Internal->getAllGroups());
-  output->SetNumberOfBlocks(allGroups.size());
-  int blockId(0);
-  for(const auto& grp : allGroups)
+  std::size_t nbOfGroups(allGroups.size());
+  std::vector<vtkIdType> offsets(nbOfGroups+1,0);
+  for(std::size_t i=0;i<nbOfGroups;i++)
+    offsets[i+1]=offsets[i]+internal->_cells_index.getNumberOfTuplesOn(allGroups[i].second);
+  std::vector<vtkIdType> ids(offsets[nbOfGroups]);
+  std::vector< vtkSmartPointer<vtkUnstructuredGrid> > blocks(nbOfGroups);
+  bool compactPoints(this->CompactPoints);
+  vtkSMPTools::For(0,(vtkIdType)nbOfGroups,[internal,inputc,inputNbCell,compactPoints,&allGroups,&offsets,&ids,&blocks](vtkIdType begin, vtkIdType end)
   {
-    std::vector<vtkIdType> ids;
-    // iterate on all families on current group grp
-    for(const auto& famId : grp.second)
-    {// for each family of group grp locate cells in input lying on that group
-      vtkIdType pos(0);
-      std::for_each(famIdsArr->GetPointer(0),famIdsArr->GetPointer(inputNbCell),[&pos,&ids,famId](vtkIdType curFamId) { if(curFamId == famId) { ids.push_back(pos); } pos++; });
+    for(vtkIdType i=begin;i<end;i++)
+    {
+      vtkIdType *grpIds(ids.data()+offsets[i]);
+      vtkIdType nbOfIds(offsets[i+1]-offsets[i]);
+      if(nbOfIds==inputNbCell && !compactPoints)
+        continue;// group lying on the whole mesh : done below without any copy
+      internal->_cells_index.fillTuplesOn(allGroups[i].second,grpIds);
+      blocks[i].TakeReference(vtkUgSelectCellIds::SelectCells(inputc,grpIds,nbOfIds,compactPoints));
     }
-    std::sort(ids.begin(),ids.end());
-    vtkNew<vtkIdTypeArray> idsVTK;
-    idsVTK->SetNumberOfComponents(1); idsVTK->SetNumberOfTuples(ids.size());
-    std::copy(ids.begin(),ids.end(),idsVTK->GetPointer(0));
-    vtkNew<vtkUgSelectCellIds> cellSelector;
-    cellSelector->SetIds(idsVTK);
-    cellSelector->SetInputData(inputc);
-    cellSelector->Update();
-    output->SetBlock(blockId++,cellSelector->GetOutput());
+  });
+  output->SetNumberOfBlocks(nbOfGroups);
+  for(std::size_t i=0;i<nbOfGroups;i++)
+  {
+    if(!blocks[i])
+    {
+      blocks[i]=vtkSmartPointer<vtkUnstructuredGrid>::New();
+      blocks[i]->ShallowCopy(inputc);
+    }
+    output->SetBlock(i,blocks[i]);
   }
   return 1;
 }
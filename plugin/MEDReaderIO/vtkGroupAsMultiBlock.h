@@ -22,18 +22,22 @@
 
 #include "vtkMultiBlockDataSetAlgorithm.h"
 
-class ExtractGroupInternal;
+class vtkGroupAsMultiBlockInternal;
 
 class vtkGroupAsMultiBlock : public vtkMultiBlockDataSetAlgorithm
 {
 public:
     static vtkGroupAsMultiBlock *New();
     vtkTypeMacro(vtkGroupAsMultiBlock, vtkMultiBlockDataSetAlgorithm)
+    //! If on, each block only keeps the points of the cells of its group (see vtkUgSelectCellIds).
+    vtkSetMacro(CompactPoints, bool);
+    vtkGetMacro(CompactPoints, bool);
 protected:
     vtkGroupAsMultiBlock();
     ~vtkGroupAsMultiBlock();
     int RequestInformation(vtkInformation * request, vtkInformationVector **inputVector, vtkInformationVector *outputVector) override;
     int RequestData(vtkInformation*, vtkInformationVector**, vtkInformationVector*) override;
 private:
-    ExtractGroupInternal *Internal;
+    vtkGroupAsMultiBlockInternal *Internal;
+    bool CompactPoints = false;
 };
@@ -50,10 +50,16 @@
 
 #ifdef MEDREADER_USE_MPI
 #include "vtkMultiProcessController.h"
+#include "vtkMPI.h"
+#include "vtkMPICommunicator.h"
 #include "vtkGhostCellsGenerator.h"
+#include "MEDGhostCellsExchange.hxx"
 #endif
 
 #include "MEDFileFieldRepresentationTree.hxx"
+#include "MEDDataSetCache.hxx"
+#include "MEDTimeStepsPrefetcher.hxx"
+#include "MEDFileMeshesPartitioner.hxx"
 
 #include <map>
 #include <string>
@@ -61,6 +67,19 @@
 #include <sstream>
 #include <algorithm>
 
+#ifdef MEDREADER_USE_MPI
+/*!
+ * Returns the MPI communicator of \a controller. MPI_COMM_SELF if \a controller is not based on MPI.
+ */
+static MPI_Comm GetMPICommunicator(vtkMultiProcessController *controller)
+{
+  vtkMPICommunicator *comm(controller?vtkMPICommunicator::SafeDownCast(controller->GetCommunicator()):nullptr);
+  if(comm && comm->GetMPIComm() && comm->GetMPIComm()->GetHandle())
+    return *comm->GetMPIComm()->GetHandle();
+  return MPI_COMM_SELF;
+}
+#endif
+
 class vtkMEDReader::vtkMEDReaderInternal
 {
 
@@ -77,12 +96,22 @@ public:
 public:
   MEDFileFieldRepresentationTree Tree;
   TimeKeeper TK;
+  // Datasets already built. Reset each time the Tree is reloaded.
+  MEDDataSetCache Cache;
+  // Loads in background the next time steps. Declared after Tree to be destroyed before it.
+  MEDTimeStepsPrefetcher Prefetcher;
+#ifdef MEDREADER_USE_MPI
+  // Ghost layer of the last output, reused while the mesh is the same.
+  MEDGhostCellsExchange Ghosts;
+#endif
 
   std::string DftMeshName;
   // Store the vtkMutableDirectedGraph that represents links between family, groups and cell types
   vtkMutableDirectedGraph* SIL;
   // store the lev0 id in Tree corresponding to the TIME_STEPS in the pipeline.
   int LastLev0;
+  // positions of the time steps published in TIME_STEPS when they are decimated. Empty if all the time steps are published.
+  std::vector<int> PublishedTimeStepIds;
 };
 
 vtkStandardNewMacro(vtkMEDReader)
@@ -140,6 +169,20 @@ void vtkMEDReader::Reload()
   this->GenerateVect = false;
   this->GCGCP = true;
   this->RemoveDebugArrays = false;
+  this->CacheSizeInMB = 0;
+  this->PrefetchDepth = 0;
+  this->PrefetchMemoryInMB = 256;
+  this->NumberOfFieldsThreads = 1;
+  this->UseStructureIndex = false;
+  this->StructureIndexDirectory.clear();
+  this->ModeMemoryLimitInMB = 0;
+  this->PackModes = false;
+  this->MaxNumberOfPublishedTimeSteps = 0;
+  this->SinglePrecision = false;
+  this->DoublePrecisionArrays.clear();
+  this->PartitioningStrategy = 0;
+  this->GroupsToLoad.clear();
+  this->ComponentsToLoad.clear();
   this->FieldSelection->RemoveAllArrays();
   this->TimeFlagSelection->RemoveAllArrays();
   this->Modified();
@@ -203,6 +246,211 @@ void vtkMEDReader::GetRidOffDebugArrays(int rmda)
     }
 }
 
+void vtkMEDReader::SetCacheSizeInMB(int cacheSizeInMB)
+{
+  if ( !this->Internal )
+    return;
+
+  // No call to Modified here : the output is the same whatever the cache size.
+  this->CacheSizeInMB=cacheSizeInMB>0?cacheSizeInMB:0;
+  this->Internal->Cache.setMaxSizeInMB(this->CacheSizeInMB);
+}
+
+int vtkMEDReader::GetNumberOfCacheHits()
+{
+  return this->Internal ? this->Internal->Cache.getNumberOfHits() : 0;
+}
+
+int vtkMEDReader::GetNumberOfCacheMisses()
+{
+  return this->Internal ? this->Internal->Cache.getNumberOfMisses() : 0;
+}
+
+int vtkMEDReader::GetNumberOfCacheEvictions()
+{
+  return this->Internal ? this->Internal->Cache.getNumberOfEvictions() : 0;
+}
+
+void vtkMEDReader::SetPrefetchDepth(int prefetchDepth)
+{
+  if ( !this->Internal )
+    return;
+
+  // No call to Modified here : the output is the same whatever the prefetch depth.
+  this->PrefetchDepth=prefetchDepth>0?prefetchDepth:0;
+}
+
+void vtkMEDReader::SetPrefetchMemoryInMB(int prefetchMemoryInMB)
+{
+  if ( !this->Internal )
+    return;
+
+  // No call to Modified here : the output is the same whatever the prefetch budget.
+  this->PrefetchMemoryInMB=prefetchMemoryInMB>0?prefetchMemoryInMB:0;
+}
+
+void vtkMEDReader::SetNumberOfFieldsThreads(int nbOfThreads)
+{
+  if ( !this->Internal )
+    return;
+
+  // No call to Modified here : the output is the same whatever the number of threads.
+  this->NumberOfFieldsThreads=nbOfThreads>1?nbOfThreads:1;
+}
+
+void vtkMEDReader::SetUseStructureIndex(int useIndex)
+{
+  if ( !this->Internal )
+    return;
+
+  // No call to Modified here : the index is only used at the next load of the file and does not change the output.
+  this->UseStructureIndex=useIndex!=0;
+}
+
+void vtkMEDReader::SetStructureIndexDirectory(const char *directory)
+{
+  if ( !this->Internal )
+    return;
+
+  // No call to Modified here : the index is only used at the next load of the file and does not change the output.
+  this->StructureIndexDirectory=directory?directory:"";
+}
+
+void vtkMEDReader::SetModeMemoryLimitInMB(int limitInMB)
+{
+  if ( !this->Internal )
+    return;
+
+  int newVal(limitInMB>0?limitInMB:0);
+  if(newVal!=this->ModeMemoryLimitInMB)
+    {
+      this->ModeMemoryLimitInMB=newVal;
+      this->Modified();
+    }
+}
+
+void vtkMEDReader::SetPackModes(int pack)
+{
+  if ( !this->Internal )
+    return;
+
+  bool newVal(pack!=0);
+  if(newVal!=this->PackModes)
+    {
+      this->PackModes=newVal;
+      this->Modified();
+    }
+}
+
+void vtkMEDReader::SetMaxNumberOfPublishedTimeSteps(int maxNbOfTS)
+{
+  if ( !this->Internal )
+    return;
+
+  int newVal(maxNbOfTS>0?maxNbOfTS:0);
+  if(newVal!=this->MaxNumberOfPublishedTimeSteps)
+    {
+      this->MaxNumberOfPublishedTimeSteps=newVal;
+      this->Internal->LastLev0=-1;// to force the publication of the time steps
+      this->Modified();
+    }
+}
+
+void vtkMEDReader::SetSinglePrecision(int single)
+{
+  if ( !this->Internal )
+    return;
+
+  bool newVal(single!=0);
+  if(newVal!=this->SinglePrecision)
+    {
+      this->SinglePrecision=newVal;
+      this->Modified();
+    }
+}
+
+void vtkMEDReader::AddDoublePrecisionArray(const char *fieldName)
+{
+  if ( !this->Internal || !fieldName )
+    return;
+
+  if(this->DoublePrecisionArrays.insert(fieldName).second)
+    this->Modified();
+}
+
+void vtkMEDReader::ClearDoublePrecisionArrays()
+{
+  if ( !this->Internal )
+    return;
+
+  if(!this->DoublePrecisionArrays.empty())
+    {
+      this->DoublePrecisionArrays.clear();
+      this->Modified();
+    }
+}
+
+void vtkMEDReader::SetPartitioningStrategy(int strategy)
+{
+  if ( !this->Internal )
+    return;
+
+  // The file is reloaded by RequestInformation if the strategy differs from the one used to load it.
+  int newVal(strategy==MEDFileMeshesPartitioner::SPACE_FILLING_CURVE?strategy:MEDFileMeshesPartitioner::SLICES);
+  if(newVal!=this->PartitioningStrategy)
+    {
+      this->PartitioningStrategy=newVal;
+      this->Modified();
+    }
+}
+
+void vtkMEDReader::AddGroupToLoad(const char *entry)
+{
+  if ( !this->Internal || !entry )
+    return;
+
+  // The file is reloaded by RequestInformation if the entries differ from the ones used to load it.
+  if(this->GroupsToLoad.insert(entry).second)
+    this->Modified();
+}
+
+void vtkMEDReader::ClearGroupsToLoad()
+{
+  if ( !this->Internal )
+    return;
+
+  if(!this->GroupsToLoad.empty())
+    {
+      this->GroupsToLoad.clear();
+      this->Modified();
+    }
+}
+
+void vtkMEDReader::AddComponentToLoad(const char *fieldName, const char *compo)
+{
+  if ( !this->Internal || !fieldName || !compo )
+    return;
+
+  std::vector<std::string>& compos(this->ComponentsToLoad[fieldName]);
+  if(std::find(compos.begin(),compos.end(),compo)==compos.end())
+    {
+      compos.push_back(compo);
+      this->Modified();
+    }
+}
+
+void vtkMEDReader::ClearComponentsToLoad()
+{
+  if ( !this->Internal )
+    return;
+
+  if(!this->ComponentsToLoad.empty())
+    {
+      this->ComponentsToLoad.clear();
+      this->Modified();
+    }
+}
+
 const char *vtkMEDReader::GetSeparator()
 {
   return MEDFileFieldRepresentationLeavesArrays::ZE_SEP;
@@ -248,6 +496,14 @@ int vtkMEDReader::RequestInformation(vtkInformation *request, vtkInformationVect
     return 0;
   try
     {
+      if(this->Internal->Tree.getNumberOfLeavesArrays()!=0 &&
+         (this->Internal->Tree.getGroupsToLoad()!=this->GroupsToLoad || this->Internal->Tree.getPartitioningStrategy()!=this->PartitioningStrategy))
+        {// The meshes loaded are not the requested ones. Everything is reloaded, prefetched arrays included.
+          delete this->Internal;
+          this->Internal=new vtkMEDReaderInternal(this);
+        }
+      // The tree is going to be modified. Worker of prefetcher must be idle.
+      this->Internal->Prefetcher.suspend();
       // Process file meta data
       if(this->Internal->Tree.getNumberOfLeavesArrays()==0)
         {
@@ -260,9 +516,14 @@ int vtkMEDReader::RequestInformation(vtkInformation *request, vtkInformationVect
             {
               iPart=vmpc->GetLocalProcessId();
               nbOfParts=vmpc->GetNumberOfProcesses();
+              this->Internal->Tree.setCommunicator(GetMPICommunicator(vmpc));
             }
           }
 #endif
+          this->Internal->Tree.setStructureIndexEnabled(this->UseStructureIndex);
+          this->Internal->Tree.setStructureIndexDirectory(this->StructureIndexDirectory);
+          this->Internal->Tree.setGroupsToLoad(this->GroupsToLoad);
+          this->Internal->Tree.setPartitioningStrategy(this->PartitioningStrategy);
           this->Internal->Tree.loadMainStructureOfFile(this->FileName.c_str(),iPart,nbOfParts);
 
           // Leaves
@@ -336,6 +597,7 @@ int vtkMEDReader::RequestData(vtkInformation *request, vtkInformationVector ** /
     return 0;
   try
   {
+      this->Internal->Prefetcher.suspend();
       for(int i = 0; i < this->FieldSelection->GetNumberOfArrays(); i++)
       {
         this->Internal->Tree.changeStatusOfAndUpdateToHaveCoherentVTKDataSet(
@@ -367,17 +629,28 @@ int vtkMEDReader::RequestData(vtkInformation *request, vtkInformationVector ** /
 #else
       if (this->DistributeWithMPI && this->GCGCP)
       {
-        vtkSmartPointer<vtkGhostCellsGenerator> gcg(vtkSmartPointer<vtkGhostCellsGenerator>::New());
-        {
-          vtkDataSet *ret(RetrieveDataSetAtTime(reqTS,&ti));
-          gcg->SetInputData(ret);
-          ret->Delete();
-        }
-              // To be checked
-        // gcg->SetUseGlobalPointIds(true);
-        gcg->SetBuildIfRequired(false);
-        gcg->Update();
-        output->SetBlock(0,gcg->GetOutput());
+        vtkDataSet *ret(RetrieveDataSetAtTime(reqTS,&ti));
+        MEDGhostCellsExchange& ghosts(this->Internal->Ghosts);
+        ghosts.setCommunicator(GetMPICommunicator(vtkMultiProcessController::GetGlobalController()));
+        if(ghosts.isApplicableTo(ret))
+          {// same mesh than the previous request : only the arrays are exchanged
+            vtkDataSet *ret2(ghosts.apply(ret));
+            output->SetBlock(0,ret2);
+            ret2->Delete();
+          }
+        else
+          {
+            ghosts.prepare(ret);
+            vtkSmartPointer<vtkGhostCellsGenerator> gcg(vtkSmartPointer<vtkGhostCellsGenerator>::New());
+            gcg->SetInputData(ret);
+                  // To be checked
+            // gcg->SetUseGlobalPointIds(true);
+            gcg->SetBuildIfRequired(false);
+            gcg->Update();
+            ghosts.setUp(ret,gcg->GetOutput());
+            output->SetBlock(0,gcg->GetOutput());
+          }
+        ret->Delete();
       }
       else
 	      this->FillMultiBlockDataSetInstance(output,reqTS,&ti);
@@ -391,6 +664,12 @@ int vtkMEDReader::RequestData(vtkInformation *request, vtkInformationVector ** /
       output->GetInformation()->Set(vtkDataObject::DATA_TIME_STEP(),reqTS);
       // Is it really needed ? TODO
       this->UpdateSIL(request, outInfo);
+      // Start loading the next time steps while the current one is processed downstream.
+      MEDTimeStepsPrefetcher& prefetcher(this->Internal->Prefetcher);
+      prefetcher.setDepth(this->PrefetchDepth);
+      prefetcher.setMaxSizeInMB(this->PrefetchMemoryInMB);
+      prefetcher.setPublishedTimeSteps(this->Internal->PublishedTimeStepIds);
+      this->Internal->Tree.schedulePrefetch(prefetcher,this->IsStdOrMode,reqTS,this->Internal->TK);
     }
   catch(INTERP_KERNEL::Exception& e)
     {
@@ -549,6 +828,20 @@ double vtkMEDReader::PublishTimeStepsIfNeeded(vtkInformation *outInfo, bool& isU
   if(lev0!=this->Internal->LastLev0)
     {
       isUpdated=true;
+      std::size_t nbOfTS(tsteps.size()),maxNbOfTS(this->MaxNumberOfPublishedTimeSteps);
+      this->Internal->PublishedTimeStepIds.clear();
+      if(maxNbOfTS>0 && nbOfTS>maxNbOfTS)
+        {// evenly decimated, first and last time steps kept
+          std::vector<double> tsteps2(maxNbOfTS);
+          this->Internal->PublishedTimeStepIds.resize(maxNbOfTS);
+          for(std::size_t i=0;i<maxNbOfTS;i++)
+            {
+              std::size_t id(maxNbOfTS>1?(i*(nbOfTS-1))/(maxNbOfTS-1):nbOfTS-1);
+              tsteps2[i]=tsteps[id];
+              this->Internal->PublishedTimeStepIds[i]=(int)id;
+            }
+          tsteps=tsteps2;
+        }
       double timeRange[2];
       timeRange[0]=tsteps.front();
       timeRange[1]=tsteps.back();
@@ -572,8 +865,27 @@ vtkDataSet *vtkMEDReader::RetrieveDataSetAtTime(double reqTS, ExportedTinyInfo *
 {
   if( !this->Internal )
     return 0;
+  this->Internal->Tree.setNumberOfThreads(this->NumberOfFieldsThreads);
+  this->Internal->Tree.setModeMemoryLimitInMB(this->ModeMemoryLimitInMB);
+  this->Internal->Tree.setPackModes(this->PackModes);
+  this->Internal->Tree.setSinglePrecision(this->SinglePrecision);
+  this->Internal->Tree.setDoublePrecisionArrays(this->DoublePrecisionArrays);
+  this->Internal->Tree.setSelectedComponents(this->ComponentsToLoad);
+  MEDDataSetCache& cache(this->Internal->Cache);
+  cache.setMaxSizeInMB(this->CacheSizeInMB);
+  std::string key;
+  if(cache.isEnabled())
+    {
+      std::ostringstream oss; oss << this->Internal->Tree.getKeyOfVTKInstance(this->IsStdOrMode,reqTS,this->Internal->TK,!this->RemoveDebugArrays) << "/" << this->GenerateVect;
+      key=oss.str();
+      vtkDataSet *ret(cache.retrieve(key,internalInfo));
+      if(ret)
+        return ret;
+    }
   std::string meshName;
   vtkDataSet *ret(this->Internal->Tree.buildVTKInstance(this->IsStdOrMode,reqTS,meshName,this->Internal->TK,!this->RemoveDebugArrays,internalInfo));
+  if(this->Internal->Tree.areModesTruncated())
+    vtkWarningMacro("Memory limit of " << this->ModeMemoryLimitInMB << " MB reached : only the first selected modes have been loaded. Increase ModeMemoryLimitInMB to load all of them.");
   if(this->GenerateVect)
     {
       vtkGenerateVectors::Operate(ret->GetPointData());
@@ -583,6 +895,8 @@ vtkDataSet *vtkMEDReader::RetrieveDataSetAtTime(double reqTS, ExportedTinyInfo *
       // To enforce the cache recomputation declare modification of mesh.
       //vtkGenerateVectors::ChangeMeshTimeToUpdateCache(ret);
     }
+  if(cache.isEnabled() && !this->Internal->Tree.areModesTruncated())// a truncated output is built again to warn again
+    cache.store(key,ret,internalInfo);
   return ret;
 }
 
@@ -21,7 +21,10 @@
 #ifndef __vtkMEDReader_h_
 #define __vtkMEDReader_h_
 
+#include <map>
+#include <set>
 #include <string>
+#include <vector>
 
 #include "vtkMultiBlockDataSetAlgorithm.h"
 #include "vtkInformationGaussDoubleVectorKey.h"
@@ -107,6 +110,97 @@ class VTK_EXPORT vtkMEDReader : public vtkMultiBlockDataSetAlgorithm
   void GetRidOffDebugArrays(int);
   vtkGetMacro(RemoveDebugArrays, bool);
 
+  // Description
+  // Memory budget (in MB) of the cache keeping the datasets already built (per time step, activated arrays and mode).
+  // Changing it does not modify the output.
+  // Default is 0 (no cache)
+  void SetCacheSizeInMB(int);
+  vtkGetMacro(CacheSizeInMB, int);
+  int GetNumberOfCacheHits();
+  int GetNumberOfCacheMisses();
+  int GetNumberOfCacheEvictions();
+
+  // Description
+  // Number of time steps following the requested one (in the play direction) loaded in background.
+  // PrefetchMemoryInMB caps the memory used by the time steps prefetched and not requested yet.
+  // Changing them does not modify the output.
+  // Default is 0 (no prefetch) and 256 MB
+  void SetPrefetchDepth(int);
+  vtkGetMacro(PrefetchDepth, int);
+  void SetPrefetchMemoryInMB(int);
+  vtkGetMacro(PrefetchMemoryInMB, int);
+
+  // Description
+  // Number of threads converting the selected arrays, each one on its own copy of the mesh support.
+  // Only the reads in file are serialized.
+  // Default is 1 (serial)
+  void SetNumberOfFieldsThreads(int);
+  vtkGetMacro(NumberOfFieldsThreads, int);
+
+  // Description
+  // Control if the tree of the fields computed at load (grouping, time steps, geometric types, families and groups) is stored in and
+  // retrieved from an index file (".mrindex") written in StructureIndexDirectory (user cache directory when empty, see MEDFileStructureIndex::GetDefaultDirectory).
+  // With an index the MED file is not read at opening : only the mesh and the fields of the leaf requested are read when data are requested.
+  // The index is ignored as soon as path, size or modification time of the MED file changes. It is not used in MPI mode,
+  // with GroupsToLoad or with structure elements.
+  // Default is false and empty
+  void SetUseStructureIndex(int);
+  vtkGetMacro(UseStructureIndex, bool);
+  void SetStructureIndexDirectory(const char *directory);
+  const char *GetStructureIndexDirectory() const { return this->StructureIndexDirectory.c_str(); }
+
+  // Description
+  // In mode, the selected modes are loaded one after the other, each one for all the selected fields, and no more mode is
+  // loaded once ModeMemoryLimitInMB MB of values have been read. A warning is emitted if some modes are not loaded. Values read for the
+  // output are given to VTK and released from the MED structures. If PackModes is true, the time steps of a cell or
+  // node field are gathered in a single array with nbOfTS*nbOfCompo components.
+  // Default is 0 (unlimited) and false
+  void SetModeMemoryLimitInMB(int);
+  vtkGetMacro(ModeMemoryLimitInMB, int);
+  void SetPackModes(int);
+  vtkGetMacro(PackModes, bool);
+
+  // Description
+  // Maximal number of time steps published in TIME_STEPS. For longer series, time steps are evenly decimated (the last one is always kept).
+  // Other time steps remain reachable by requesting explicitly their time.
+  // Default is 0 (all time steps published)
+  void SetMaxNumberOfPublishedTimeSteps(int);
+  vtkGetMacro(MaxNumberOfPublishedTimeSteps, int);
+
+  // Description
+  // Control if coordinates and FLOAT64 fields are given to VTK in single precision. FLOAT64 fields
+  // added with AddDoublePrecisionArray (MED name of the field) are kept in double precision.
+  // Default is false
+  void SetSinglePrecision(int);
+  vtkGetMacro(SinglePrecision, bool);
+  void AddDoublePrecisionArray(const char *fieldName);
+  void ClearDoublePrecisionArrays();
+  const std::set<std::string>& GetDoublePrecisionArrays() const { return this->DoublePrecisionArrays; }
+
+  // Description
+  // Distribution of the cells over the MPI processes when DistributeWithMPI is on.
+  // 0 : contiguous slices of cell ids, 1 : cells sorted along a space filling curve on their centers (compact parts, smaller ghost layers).
+  // Changing it reloads the file. Default is 0
+  void SetPartitioningStrategy(int);
+  vtkGetMacro(PartitioningStrategy, int);
+
+  // Description
+  // Restrict the loading of the meshes to the cells lying on groups and families. Entries are the ones
+  // of ExtractGroup ("GRP_" or "FAM_" followed by the name). Only these cells, their nodes and the field
+  // values on them are read from the file. Changing the entries reloads the file. Ignored with DistributeWithMPI.
+  // Default is empty (whole meshes)
+  void AddGroupToLoad(const char *entry);
+  void ClearGroupsToLoad();
+  const std::set<std::string>& GetGroupsToLoad() const { return this->GroupsToLoad; }
+
+  // Description
+  // Restrict the components of a field given to VTK. The field is designated by its name in the MED file,
+  // the component by its name or its position. Components are given in the order they are added.
+  // Default is empty (all components of all fields)
+  void AddComponentToLoad(const char *fieldName, const char *compo);
+  void ClearComponentsToLoad();
+  const std::map<std::string, std::vector<std::string> >& GetComponentsToLoad() const { return this->ComponentsToLoad; }
+
 
  protected:
   vtkMEDReader();
@@ -135,6 +229,20 @@ class VTK_EXPORT vtkMEDReader : public vtkMultiBlockDataSetAlgorithm
   bool GCGCP = true;
   bool DistributeWithMPI = true;
   bool RemoveDebugArrays = false;
+  int CacheSizeInMB = 0;
+  int PrefetchDepth = 0;
+  int PrefetchMemoryInMB = 256;
+  int NumberOfFieldsThreads = 1;
+  bool UseStructureIndex = false;
+  std::string StructureIndexDirectory;
+  int ModeMemoryLimitInMB = 0;
+  bool PackModes = false;
+  int MaxNumberOfPublishedTimeSteps = 0;
+  bool SinglePrecision = false;
+  std::set<std::string> DoublePrecisionArrays;
+  int PartitioningStrategy = 0;
+  std::set<std::string> GroupsToLoad;
+  std::map<std::string, std::vector<std::string> > ComponentsToLoad;
 };
 
 #endif //__vtkMEDReader_h_
@@ -25,21 +25,144 @@
 #include "vtkClientServerStream.h"
 #include "vtkExecutive.h"
 #include "vtkDataObject.h"
-#include "vtkGenericDataObjectReader.h"
-#include "vtkGenericDataObjectWriter.h"
+#include "vtkDataSetAttributes.h"
 #include "vtkInformationDataObjectMetaDataKey.h"
 #include "vtkInformation.h"
+#include "vtkMultiProcessStream.h"
+#include "vtkMutableDirectedGraph.h"
+#include "vtkNew.h"
 #include "vtkObjectFactory.h"
+#include "vtkSmartPointer.h"
+#include "vtkStringArray.h"
+#include "vtkUnsignedCharArray.h"
+#include "vtkZLibDataCompressor.h"
 
 #include "vtkMEDReader.h"
 
+#include <algorithm>
+#include <list>
+#include <random>
+#include <string>
+#include <utility>
+
 vtkStandardNewMacro(vtkPVMetaDataInformation)
 vtkCxxSetObjectMacro(vtkPVMetaDataInformation, InformationData, vtkDataObject)
 
+// The SIL graph is sent as a compact binary message. All integers are written as varints (7 bits per byte).
+//   version, kind, stamp, [size of the graph, graph (compressed with zlib if kind is FULL_ZLIB)]
+//   graph : nb of vertices, name of each vertex (length, chars), nb of edges, source, target and cross edge flag of each edge
+// The stamp identifies a graph built on the server. A graph already received by the client is not sent again (kind UNCHANGED).
+namespace
+{
+const unsigned char SIL_FORMAT_VERSION = 1;
+enum SILMessageKind { SIL_FULL = 0, SIL_FULL_ZLIB = 1, SIL_UNCHANGED = 2 };
+// Graphs smaller than this are not compressed
+const std::size_t SIL_COMPRESSION_THRESHOLD = 4096;
+// Number of graphs kept by the client
+const std::size_t SIL_CLIENT_CACHE_SIZE = 8;
+
+void WriteVarInt(std::string& buf, vtkTypeUInt64 val)
+{
+  while (val >= 0x80)
+  {
+    buf.push_back(static_cast<char>((val & 0x7f) | 0x80));
+    val >>= 7;
+  }
+  buf.push_back(static_cast<char>(val));
+}
+
+bool ReadVarInt(const unsigned char*& pt, const unsigned char* end, vtkTypeUInt64& val)
+{
+  val = 0;
+  for (int shift = 0; pt != end && shift < 64; shift += 7)
+  {
+    unsigned char c(*pt++);
+    val |= static_cast<vtkTypeUInt64>(c & 0x7f) << shift;
+    if (!(c & 0x80))
+      return true;
+  }
+  return false;
+}
+
+// Stamp of a graph : MTime of the graph combined with an id of the server process, so that stamps
+// of a previous server are never taken for stamps of the current one.
+vtkTypeUInt64 ComputeStamp(vtkDataObject* graph)
+{
+  static const vtkTypeUInt64 SERVER_ID = std::random_device()() & 0xffffff;
+  return (SERVER_ID << 40) | (static_cast<vtkTypeUInt64>(graph->GetMTime()) & ((vtkTypeUInt64(1) << 40) - 1));
+}
+
+// Graphs received by the client, most recently used first
+std::list<std::pair<vtkTypeUInt64, vtkSmartPointer<vtkDataObject> > >& ClientCache()
+{
+  static std::list<std::pair<vtkTypeUInt64, vtkSmartPointer<vtkDataObject> > > cache;
+  return cache;
+}
+
+std::string EncodeGraph(vtkGraph* graph)
+{
+  std::string ret;
+  vtkStringArray* names(vtkStringArray::SafeDownCast(graph->GetVertexData()->GetAbstractArray("Names")));
+  vtkUnsignedCharArray* crossEdges(vtkUnsignedCharArray::SafeDownCast(graph->GetEdgeData()->GetAbstractArray("CrossEdges")));
+  vtkIdType nbOfVertices(graph->GetNumberOfVertices()), nbOfEdges(graph->GetNumberOfEdges());
+  WriteVarInt(ret, nbOfVertices);
+  for (vtkIdType i = 0; i < nbOfVertices; i++)
+  {
+    const std::string& name(names && i < names->GetNumberOfValues() ? names->GetValue(i) : std::string());
+    WriteVarInt(ret, name.size());
+    ret += name;
+  }
+  WriteVarInt(ret, nbOfEdges);
+  for (vtkIdType i = 0; i < nbOfEdges; i++)
+  {
+    WriteVarInt(ret, graph->GetSourceVertex(i));
+    WriteVarInt(ret, graph->GetTargetVertex(i));
+    ret.push_back(static_cast<char>(crossEdges && i < crossEdges->GetNumberOfValues() ? crossEdges->GetValue(i) : 0));
+  }
+  return ret;
+}
+
+vtkDataObject* DecodeGraph(const unsigned char* pt, const unsigned char* end)
+{
+  vtkTypeUInt64 nbOfVertices(0), nbOfEdges(0), len(0), src(0), tgt(0);
+  if (!ReadVarInt(pt, end, nbOfVertices) || nbOfVertices > static_cast<vtkTypeUInt64>(end - pt))
+    return nullptr;
+  vtkSmartPointer<vtkMutableDirectedGraph> graph(vtkSmartPointer<vtkMutableDirectedGraph>::New());
+  graph->SetNumberOfVertices(static_cast<vtkIdType>(nbOfVertices));
+  vtkNew<vtkStringArray> names;
+  names->SetName("Names");
+  names->SetNumberOfValues(static_cast<vtkIdType>(nbOfVertices));
+  for (vtkTypeUInt64 i = 0; i < nbOfVertices; i++)
+  {
+    if (!ReadVarInt(pt, end, len) || len > static_cast<vtkTypeUInt64>(end - pt))
+      return nullptr;
+    names->SetValue(static_cast<vtkIdType>(i), std::string(reinterpret_cast<const char*>(pt), len));
+    pt += len;
+  }
+  if (!ReadVarInt(pt, end, nbOfEdges))
+    return nullptr;
+  vtkNew<vtkUnsignedCharArray> crossEdges;
+  crossEdges->SetName("CrossEdges");
+  for (vtkTypeUInt64 i = 0; i < nbOfEdges; i++)
+  {
+    if (!ReadVarInt(pt, end, src) || !ReadVarInt(pt, end, tgt) || pt == end || src >= nbOfVertices || tgt >= nbOfVertices)
+      return nullptr;
+    graph->AddEdge(static_cast<vtkIdType>(src), static_cast<vtkIdType>(tgt));
+    crossEdges->InsertNextValue(*pt++);
+  }
+  graph->GetVertexData()->AddArray(names);
+  graph->GetEdgeData()->AddArray(crossEdges);
+  graph->Register(nullptr);
+  return graph;
+}
+}
+
 //----------------------------------------------------------------------------
 vtkPVMetaDataInformation::vtkPVMetaDataInformation()
 {
   this->InformationData = NULL;
+  // Only the server root sends the graph. The others would send the same.
+  this->RootOnly = 1;
 }
 
 //----------------------------------------------------------------------------
@@ -83,7 +206,8 @@ void vtkPVMetaDataInformation::CopyFromObject(vtkObject* obj)
 void vtkPVMetaDataInformation::CopyToStream(vtkClientServerStream* css)
 {
   css->Reset();
-  if (!this->InformationData)
+  vtkGraph* graph = vtkGraph::SafeDownCast(this->InformationData);
+  if (!graph)
     {
     *css << vtkClientServerStream::Reply
          << vtkClientServerStream::InsertArray(
@@ -92,23 +216,38 @@ void vtkPVMetaDataInformation::CopyToStream(vtkClientServerStream* css)
     return;
     }
 
-  vtkDataObject* clone = this->InformationData->NewInstance();
-  clone->ShallowCopy(this->InformationData);
-
-  vtkGenericDataObjectWriter* writer = vtkGenericDataObjectWriter::New();
-  writer->SetFileTypeToBinary();
-  writer->WriteToOutputStringOn();
-  writer->SetInputData(clone);
-  writer->Write();
+  std::string msg;
+  msg.push_back(static_cast<char>(SIL_FORMAT_VERSION));
+  vtkTypeUInt64 stamp(ComputeStamp(graph));
+  if (std::find(this->KnownStamps.begin(), this->KnownStamps.end(), stamp) != this->KnownStamps.end())
+    {
+    msg.push_back(static_cast<char>(SIL_UNCHANGED));
+    WriteVarInt(msg, stamp);
+    }
+  else
+    {
+    std::string data(EncodeGraph(graph));
+    vtkNew<vtkZLibDataCompressor> compressor;
+    std::string compressed;
+    if (data.size() > SIL_COMPRESSION_THRESHOLD)
+      {
+      compressed.resize(compressor->GetMaximumCompressionSpace(data.size()));
+      std::size_t sz(compressor->Compress(reinterpret_cast<const unsigned char*>(data.data()), data.size(),
+        reinterpret_cast<unsigned char*>(&compressed[0]), compressed.size()));
+      compressed.resize(sz);
+      }
+    bool isCompressed(!compressed.empty() && compressed.size() < data.size());
+    msg.push_back(static_cast<char>(isCompressed ? SIL_FULL_ZLIB : SIL_FULL));
+    WriteVarInt(msg, stamp);
+    WriteVarInt(msg, data.size());
+    msg += isCompressed ? compressed : data;
+    }
 
   *css << vtkClientServerStream::Reply
        << vtkClientServerStream::InsertArray(
-         writer->GetBinaryOutputString(),
-         writer->GetOutputStringLength())
+         reinterpret_cast<const unsigned char*>(msg.data()),
+         static_cast<int>(msg.size()))
        << vtkClientServerStream::End;
-  writer->RemoveAllInputs();
-  writer->Delete();
-  clone->Delete();
 }
 
 //----------------------------------------------------------------------------
@@ -116,17 +255,91 @@ void vtkPVMetaDataInformation::CopyFromStream(const vtkClientServerStream* css)
 {
   this->SetInformationData(0);
   vtkTypeUInt32 length;
-  if (css->GetArgumentLength(0, 0, &length) && length > 0)
-    {
-    unsigned char* raw_data = new unsigned char[length];
-    css->GetArgument(0, 0, raw_data, length);
-    vtkGenericDataObjectReader* reader = vtkGenericDataObjectReader::New();
-    reader->SetBinaryInputString(reinterpret_cast<const char*>(raw_data), length);
-    reader->ReadFromInputStringOn();
-    delete []raw_data;
-    reader->Update();
-    this->SetInformationData(reader->GetOutput());
-    reader->Delete();
+  if (!css->GetArgumentLength(0, 0, &length) || length < 2)
+    {
+    return;
+    }
+  std::vector<unsigned char> raw_data(length);
+  css->GetArgument(0, 0, raw_data.data(), length);
+  const unsigned char* pt(raw_data.data());
+  const unsigned char* end(pt + length);
+  if (*pt++ != SIL_FORMAT_VERSION)
+    {
+    vtkErrorMacro("Unsupported version of the SIL sent by the server.");
+    return;
+    }
+  unsigned char kind(*pt++);
+  vtkTypeUInt64 stamp(0);
+  if (!ReadVarInt(pt, end, stamp))
+    {
+    return;
+    }
+  auto& cache(ClientCache());
+  if (kind == SIL_UNCHANGED)
+    {
+    auto it = std::find_if(cache.begin(), cache.end(),
+      [stamp](const std::pair<vtkTypeUInt64, vtkSmartPointer<vtkDataObject> >& elt) { return elt.first == stamp; });
+    if (it != cache.end())
+      {
+      cache.splice(cache.begin(), cache, it);
+      this->SetInformationData(it->second);
+      }
+    return;
+    }
+  vtkTypeUInt64 size(0);
+  if (!ReadVarInt(pt, end, size))
+    {
+    return;
+    }
+  std::vector<unsigned char> uncompressed;
+  if (kind == SIL_FULL_ZLIB)
+    {
+    uncompressed.resize(size);
+    vtkNew<vtkZLibDataCompressor> compressor;
+    if (compressor->Uncompress(pt, end - pt, uncompressed.data(), size) != size)
+      {
+      vtkErrorMacro("Corrupted SIL sent by the server.");
+      return;
+      }
+    pt = uncompressed.data();
+    end = pt + size;
+    }
+  vtkDataObject* graph(DecodeGraph(pt, end));
+  if (!graph)
+    {
+    vtkErrorMacro("Corrupted SIL sent by the server.");
+    return;
+    }
+  this->SetInformationData(graph);
+  cache.remove_if([stamp](const std::pair<vtkTypeUInt64, vtkSmartPointer<vtkDataObject> >& elt) { return elt.first == stamp; });
+  cache.emplace_front(stamp, graph);
+  graph->Delete();
+  if (cache.size() > SIL_CLIENT_CACHE_SIZE)
+    {
+    cache.pop_back();
+    }
+}
+
+//----------------------------------------------------------------------------
+void vtkPVMetaDataInformation::CopyParametersToStream(vtkMultiProcessStream& str)
+{
+  const auto& cache(ClientCache());
+  str << static_cast<unsigned int>(cache.size());
+  for (const auto& elt : cache)
+    {
+    str << static_cast<vtkTypeUInt64>(elt.first);
+    }
+}
+
+//----------------------------------------------------------------------------
+void vtkPVMetaDataInformation::CopyParametersFromStream(vtkMultiProcessStream& str)
+{
+  unsigned int nbOfStamps(0);
+  str >> nbOfStamps;
+  this->KnownStamps.resize(nbOfStamps);
+  for (unsigned int i = 0; i < nbOfStamps; i++)
+    {
+    str >> this->KnownStamps[i];
     }
 }
 
@@ -23,6 +23,8 @@
 
 #include "vtkPVInformation.h"
 
+#include <vector>
+
 class vtkDataObject;
 class vtkInformationDataObjectKey;
 
@@ -43,6 +45,12 @@ public:
   virtual void CopyToStream(vtkClientServerStream*);
   virtual void CopyFromStream(const vtkClientServerStream*);
   virtual void AddInformation(vtkPVInformation*);
+
+  // Description:
+  // The client sends the stamps of the graphs it already received. The server
+  // does not send again a graph having one of these stamps.
+  virtual void CopyParametersToStream(vtkMultiProcessStream&);
+  virtual void CopyParametersFromStream(vtkMultiProcessStream&);
   //ETX
 
   // Description:
@@ -55,6 +63,8 @@ protected:
   ~vtkPVMetaDataInformation();
   void SetInformationData(vtkDataObject*);
   vtkDataObject* InformationData;
+  // Stamps of the graphs already received by the client. Set on the server by CopyParametersFromStream.
+  std::vector<vtkTypeUInt64> KnownStamps;
 
 private:
   vtkPVMetaDataInformation(const vtkPVMetaDataInformation&); // Not implemented
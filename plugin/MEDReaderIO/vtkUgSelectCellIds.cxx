@@ -21,12 +21,20 @@
 #include "vtkUgSelectCellIds.h"
 
 #include "vtkCellArray.h"
+#include "vtkIdList.h"
 #include "vtkUnstructuredGrid.h"
 #include "vtkInformationVector.h"
 #include "vtkUnsignedCharArray.h"
 #include "vtkInformation.h"
 #include "vtkCellData.h"
 #include "vtkPointData.h"
+#include "vtkPoints.h"
+#include "vtkArrayDispatch.h"
+#include "vtkDataArrayRange.h"
+#include "vtkSMPThreadLocalObject.h"
+#include "vtkSMPTools.h"
+
+#include <vector>
 
 vtkStandardNewMacro(vtkUgSelectCellIds)
 
@@ -35,6 +43,51 @@ void vtkUgSelectCellIds::SetIds(vtkIdTypeArray *ids)
   _ids = ids;
 }
 
+void vtkUgSelectCellIds::SetCompactPoints(bool compactPoints)
+{
+  if( _compact_points != compactPoints )
+  {
+    _compact_points = compactPoints;
+    this->Modified();
+  }
+}
+
+/*!
+ * Copies the tuples \a ids of \a src into \a dst concurrently. The dispatch on the concrete types of the arrays
+ * makes the copy of each tuple inlined, instead of one virtual call per tuple.
+ */
+struct GatherTuplesWorker
+{
+  template<class SrcArrayT, class DstArrayT>
+  void operator()(SrcArrayT *src, DstArrayT *dst, const vtkIdType *ids) const
+  {
+    const auto srcTuples(vtk::DataArrayTupleRange(src));
+    auto dstTuples(vtk::DataArrayTupleRange(dst));
+    vtkSMPTools::For(0,dstTuples.size(),[&srcTuples,&dstTuples,ids](vtkIdType begin, vtkIdType end)
+    {
+      for( vtkIdType i = begin ; i < end ; ++i )
+        dstTuples[i] = srcTuples[ids[i]];
+    });
+  }
+};
+
+/*!
+ * Returns a new array (same type, name and components than \a array) made of the \a nbOfIds tuples \a ids of \a array.
+ */
+static vtkDataArray *GatherTuples(vtkDataArray *array, const vtkIdType *ids, vtkIdType nbOfIds)
+{
+  vtkDataArray *ret( array->NewInstance() );
+  ret->SetNumberOfComponents(array->GetNumberOfComponents()); ret->SetNumberOfTuples(nbOfIds);
+  ret->SetName(array->GetName());
+  for( int i = 0 ; i < array->GetNumberOfComponents() ; ++i )
+    if( array->GetComponentName(i) )
+      ret->SetComponentName(i,array->GetComponentName(i));
+  GatherTuplesWorker worker;
+  if( !vtkArrayDispatch::Dispatch2SameValueType::Execute(array,ret,worker,ids) )
+    worker(array,ret,ids);
+  return ret;
+}
+
 int vtkUgSelectCellIds::RequestData(vtkInformation *vtkNotUsed(request), vtkInformationVector **inputVector, vtkInformationVector *outputVector)
 {
   vtkInformation* inputInfo=inputVector[0]->GetInformationObject(0);
@@ -51,77 +104,131 @@ int vtkUgSelectCellIds::RequestData(vtkInformation *vtkNotUsed(request), vtkInfo
   }
   vtkInformation *outInfo(outputVector->GetInformationObject(0));
   vtkUnstructuredGrid *output(vtkUnstructuredGrid::SafeDownCast(outInfo->Get(vtkDataObject::DATA_OBJECT())));
-  output->SetPoints(ds->GetPoints());
-  vtkNew<vtkCellArray> outCellArray;
-  vtkNew<vtkIdTypeArray> outConn;
-  vtkCellData *inputCellData(ds->GetCellData());
-  vtkPointData *inputPointData(ds->GetPointData());
-  // Finish the parlote : feed data arrays
-  vtkCellData *outCellData(output->GetCellData());
-  vtkPointData *outPointData(output->GetPointData());
   vtkIdType inpNbCells( ds->GetNumberOfCells() );
   vtkIdType outputNbCells( _ids->GetNumberOfTuples() );
-  vtkNew<vtkIdTypeArray> outNodalConn;
-  vtkNew<vtkUnsignedCharArray> outCellTypes;
-  outCellTypes->SetNumberOfComponents(1); outCellTypes->SetNumberOfTuples(outputNbCells);
-  vtkNew<vtkIdTypeArray> outCellLocations;
-  outCellLocations->SetNumberOfComponents(1); outCellLocations->SetNumberOfTuples(outputNbCells);
-  vtkIdType outConnLgth(0);
   for( const vtkIdType *cellId = _ids->GetPointer(0) ; cellId != _ids->GetPointer(outputNbCells) ; ++cellId )
   {
-    if( *cellId >=0 && *cellId < inpNbCells )
-    {
-      vtkIdType npts;
-      const vtkIdType *pts;
-      ds->GetCellPoints(*cellId, npts, pts);
-      outConnLgth += 1+npts;
-    }
-    else
+    if( *cellId < 0 || *cellId >= inpNbCells )
     {
       vtkErrorMacro(<< "vtkUgSelectCellIds::RequestData : presence of " << *cellId << " in array must be in [0," << inpNbCells << "[ !");
       return 0;
-    } 
+    }
   }
-  outNodalConn->SetNumberOfComponents(1); outNodalConn->SetNumberOfTuples(outConnLgth);
-  vtkIdType *outConnPt(outNodalConn->GetPointer(0)),*outCellLocPt(outCellLocations->GetPointer(0));
-  vtkIdType outCurCellLoc = 0;
+  vtkSmartPointer<vtkUnstructuredGrid> ret;
+  ret.TakeReference( SelectCells(ds,_ids->GetPointer(0),outputNbCells,_compact_points) );
+  output->ShallowCopy(ret);
+  return 1;
+}
+
+/*!
+ * Returns a new vtkUnstructuredGrid (to be deallocated by the caller) made of the \a nbOfIds cells \a ids of \a ds, in this order.
+ * If \a compactPoints is false the returned grid shares the points and the point arrays of \a ds. Otherwise only the points
+ * of the selected cells are kept, in ascending order of their ids in \a ds, and the connectivity is renumbered accordingly.
+ * \a ids are expected to be valid cell ids of \a ds. \a ds is only read so this method can be called concurrently on the same input.
+ */
+vtkUnstructuredGrid *vtkUgSelectCellIds::SelectCells(vtkUnstructuredGrid *ds, const vtkIdType *ids, vtkIdType nbOfIds, bool compactPoints)
+{
+  vtkUnstructuredGrid *output(vtkUnstructuredGrid::New());
+  vtkCellData *inputCellData(ds->GetCellData());
+  vtkPointData *inputPointData(ds->GetPointData());
+  vtkCellData *outCellData(output->GetCellData());
+  vtkPointData *outPointData(output->GetPointData());
+  vtkIdType inpNbPts( ds->GetNumberOfPoints() );
+  vtkNew<vtkIdTypeArray> outOffsets;
+  outOffsets->SetNumberOfTuples(nbOfIds+1);
+  vtkIdType *outOffsetsPt(outOffsets->GetPointer(0));
+  vtkNew<vtkIdList> ptIds;
+  // points of the selected cells are flagged with 0 in pointMap, then numbered
+  std::vector<vtkIdType> pointMap( compactPoints ? inpNbPts : 0, -1 );
+  outOffsetsPt[0] = 0;
+  for( vtkIdType i = 0 ; i < nbOfIds ; ++i )
+  {
+    vtkIdType npts;
+    const vtkIdType *pts;
+    ds->GetCellPoints(ids[i], npts, pts, ptIds);
+    outOffsetsPt[i+1] = outOffsetsPt[i] + npts;
+    if( compactPoints )
+      for( vtkIdType j = 0 ; j < npts ; ++j )
+        pointMap[pts[j]] = 0;
+  }
+  std::vector<vtkIdType> keptPts;
+  if( compactPoints )
+    for( vtkIdType i = 0 ; i < inpNbPts ; ++i )
+      if( pointMap[i] == 0 )
+      {
+        pointMap[i] = (vtkIdType)keptPts.size();
+        keptPts.push_back(i);
+      }
+  vtkNew<vtkIdTypeArray> outConn;
+  outConn->SetNumberOfTuples(outOffsetsPt[nbOfIds]);
+  vtkNew<vtkUnsignedCharArray> outCellTypes;
+  outCellTypes->SetNumberOfComponents(1); outCellTypes->SetNumberOfTuples(nbOfIds);
+  vtkIdType *outConnPt(outConn->GetPointer(0));
   unsigned char *outCellTypePt(outCellTypes->GetPointer(0));
-  for( const vtkIdType *cellId = _ids->GetPointer(0) ; cellId != _ids->GetPointer(outputNbCells) ; ++cellId )
+  const vtkIdType *pointMapPt( compactPoints ? pointMap.data() : nullptr );
+  vtkSMPThreadLocalObject<vtkIdList> tmpIds;
+  vtkSMPTools::For(0,nbOfIds,[ds,ids,outOffsetsPt,outConnPt,outCellTypePt,pointMapPt,&tmpIds](vtkIdType begin, vtkIdType end)
   {
-      outCellLocPt[0] = outCurCellLoc;
+    vtkIdList *tmp(tmpIds.Local());
+    for( vtkIdType i = begin ; i < end ; ++i )
+    {
       vtkIdType npts;
       const vtkIdType *pts;
-      ds->GetCellPoints(*cellId, npts, pts);
-      *outConnPt++ = npts;
-      outConnPt = std::copy(pts,pts+npts,outConnPt);
-      *outCellTypePt++ = ds->GetCellType(*cellId);
-      outCurCellLoc += npts+1;//not sure
-  }
+      ds->GetCellPoints(ids[i], npts, pts, tmp);
+      vtkIdType *dst(outConnPt+outOffsetsPt[i]);
+      if( pointMapPt )
+        for( vtkIdType j = 0 ; j < npts ; ++j )
+          dst[j] = pointMapPt[pts[j]];
+      else
+        std::copy(pts,pts+npts,dst);
+      outCellTypePt[i] = ds->GetCellType(ids[i]);
+    }
+  });
   for( int cellFieldId = 0 ; cellFieldId < inputCellData->GetNumberOfArrays() ; ++cellFieldId )
   {
     vtkDataArray *array( inputCellData->GetArray(cellFieldId) );
+    if( !array )
+      continue;
     vtkSmartPointer<vtkDataArray> outArray;
-    outArray.TakeReference( array->NewInstance() );
-    outArray->SetNumberOfComponents(array->GetNumberOfComponents()); outArray->SetNumberOfTuples(outputNbCells);
-    outArray->SetName(array->GetName());
-    vtkIdType pos(0);
-    for( const vtkIdType *cellId = _ids->GetPointer(0) ; cellId != _ids->GetPointer(outputNbCells) ; ++cellId )
+    outArray.TakeReference( GatherTuples(array,ids,nbOfIds) );
+    outCellData->AddArray(outArray);
+  }
+  if( compactPoints )
+  {
+    vtkIdType outNbPts( (vtkIdType)keptPts.size() );
+    vtkNew<vtkPoints> outPts;
+    vtkSmartPointer<vtkDataArray> outCoords;
+    outCoords.TakeReference( GatherTuples(ds->GetPoints()->GetData(),keptPts.data(),outNbPts) );
+    outPts->SetData(outCoords);
+    output->SetPoints(outPts);
+    for( int pointFieldId = 0 ; pointFieldId < inputPointData->GetNumberOfArrays() ; ++pointFieldId )
     {
-      outArray->SetTuple(pos++,*cellId,array);
+      vtkDataArray *array( inputPointData->GetArray(pointFieldId) );
+      if( !array )
+        continue;
+      vtkSmartPointer<vtkDataArray> outArray;
+      outArray.TakeReference( GatherTuples(array,keptPts.data(),outNbPts) );
+      outPointData->AddArray(outArray);
     }
-    outCellData->AddArray(outArray);
   }
-  for( int pointFieldId = 0 ; pointFieldId < inputPointData->GetNumberOfArrays() ; ++pointFieldId )
+  else
   {
-    vtkDataArray *array( inputPointData->GetArray(pointFieldId) );
-    vtkSmartPointer<vtkDataArray> outArray;
-    outArray.TakeReference( array->NewInstance() );
-    outArray->ShallowCopy(array);
-    outPointData->AddArray(outArray);
+    output->SetPoints(ds->GetPoints());
+    for( int pointFieldId = 0 ; pointFieldId < inputPointData->GetNumberOfArrays() ; ++pointFieldId )
+    {
+      vtkDataArray *array( inputPointData->GetArray(pointFieldId) );
+      if( !array )
+        continue;
+      vtkSmartPointer<vtkDataArray> outArray;
+      outArray.TakeReference( array->NewInstance() );
+      outArray->ShallowCopy(array);
+      outPointData->AddArray(outArray);
+    }
   }
   //
-  outCellArray->SetCells(outputNbCells,outNodalConn);
-  output->SetCells(outCellTypes,outCellLocations,outCellArray);
+  vtkNew<vtkCellArray> outCellArray;
+  outCellArray->SetData(outOffsets,outConn);
+  output->SetCells(outCellTypes,outCellArray);
   //
-  return 1;
+  return output;
 }
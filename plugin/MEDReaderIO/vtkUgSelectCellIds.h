@@ -26,8 +26,8 @@
 
 /*!
  * Class taking only specified cellIds of input vtkUnstructuredGrid dataset
- * For performance reasons orphan nodes are not removed here.
- * The output vtkUnstructuredGrid is lying on the same points than input one.
+ * By default, for performance reasons, orphan nodes are not removed here : the output vtkUnstructuredGrid is lying on the same points than input one.
+ * If CompactPoints is on, the output only keeps the points of the selected cells (in ascending order of their ids in input).
  */
 class vtkUgSelectCellIds : public vtkUnstructuredGridAlgorithm
 {
@@ -35,10 +35,14 @@ public:
     static vtkUgSelectCellIds* New();
     vtkTypeMacro(vtkUgSelectCellIds, vtkUnstructuredGridAlgorithm)
     void SetIds(vtkIdTypeArray *ids);
+    void SetCompactPoints(bool compactPoints);
+    bool GetCompactPoints() const { return _compact_points; }
+    static vtkUnstructuredGrid *SelectCells(vtkUnstructuredGrid *ds, const vtkIdType *ids, vtkIdType nbOfIds, bool compactPoints = false);
     vtkUgSelectCellIds() = default;
     ~vtkUgSelectCellIds() override = default;
 protected:
     int RequestData(vtkInformation*, vtkInformationVector**, vtkInformationVector*) override;
 private:
     vtkSmartPointer<vtkIdTypeArray> _ids;
+    bool _compact_points = false;
 };
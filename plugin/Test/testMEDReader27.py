@@ -0,0 +1,56 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ Mesh with a cell field on 4 time steps. Values of time step #i are in [10*i,10*i+3]."""
+    fname="testMEDReader27.med"
+    arr=DataArrayDouble([0,1,2])
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    mm.write(fname,2)
+    for i in range(4):
+        f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("MyField") ; f.setTime(float(i),i,0)
+        arr2=DataArrayDouble(4) ; arr2.iota(10.*i) ; f.setArray(arr2)
+        WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+@WriteInTmpDir
+def test():
+    """ Check that the time steps prefetched in background by MEDReader are the ones read from file, whatever the direction of play."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/MyField@@][@@P0']
+    reader.PrefetchDepth=2
+    reader.PrefetchMemoryInMB=10
+    for t in [0.,1.,2.,3.,2.,1.,0.,3.,0.,2.]:
+        reader.UpdatePipeline(t)
+        assert(reader.CellData['MyField'].GetRange()==(10.*t,10.*t+3.))
+    reader.PrefetchDepth=0
+    reader.UpdatePipeline(1.)
+    assert(reader.CellData['MyField'].GetRange()==(10.,13.))
+
+if __name__ == "__main__":
+  test()
+  pass
@@ -0,0 +1,64 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ Mesh with 6 cell fields and 6 node fields, some of them being integer ones, on 2 time steps."""
+    fname="testMEDReader28.med"
+    arr=DataArrayDouble([0,1,2,3])
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    mm.write(fname,2)
+    for i in range(2):
+        for j in range(6):
+            for tof,nb,prefix in [(ON_CELLS,9,"Cell"),(ON_NODES,16,"Node")]:
+                f=MEDCouplingFieldDouble(tof) ; f.setMesh(m) ; f.setName("%sField%d"%(prefix,j)) ; f.setTime(float(i),i,0)
+                arr2=DataArrayDouble(nb) ; arr2.iota(100.*j+10.*i) ; f.setArray(arr2)
+                if j%2==0:
+                    WriteFieldUsingAlreadyWrittenMesh(fname,f)
+                else:
+                    f2=f.convertToIntField()
+                    WriteFieldUsingAlreadyWrittenMesh(fname,f2)
+    return fname
+
+def GetRanges(reader,t):
+    reader.UpdatePipeline(t)
+    return [(k,reader.CellData[k].GetRange()) for k in reader.CellData.keys()]+[(k,reader.PointData[k].GetRange()) for k in reader.PointData.keys()]
+
+@WriteInTmpDir
+def test():
+    """ Check that converting the fields with several threads gives the same arrays, in the same order, than the serial conversion."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/CellField%d@@][@@P0'%j for j in range(6)]+['TS0/Mesh/ComSup0/NodeField%d@@][@@P1'%j for j in range(6)]
+    refs=[GetRanges(reader,t) for t in [0.,1.]]
+    assert(len(refs[0])==12)
+    assert(refs[1][0]==('CellField0',(10.,18.)))
+    reader.NumberOfFieldsThreads=4 # the time requested changes at each UpdatePipeline so conversion is done again
+    for t,ref in zip([0.,1.],refs):
+        assert(GetRanges(reader,t)==ref)
+
+if __name__ == "__main__":
+  test()
+  pass
@@ -0,0 +1,117 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from MEDReaderHelper import WriteInTmpDir
+import glob
+import os
+
+def GenerateCase(fname,withNodeField):
+    """ Mesh with a group, a cell field on 2 time steps, a cell field on the 2 first cells only and optionally a node field on 3 time steps.
+    A second mesh has no field."""
+    arr=DataArrayDouble([0,1,2])
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    grp=DataArrayInt([1,3]) ; grp.setName("grp") ; mm.setGroupsAtLevel(0,[grp])
+    mm.write(fname,2)
+    m2=MEDCouplingCMesh() ; m2.setCoords(arr) ; m2=m2.buildUnstructured() ; m2.setName("Mesh2")
+    mm2=MEDFileUMesh() ; mm2.setMeshAtLevel(0,m2)
+    mm2.write(fname,0)
+    for i in range(2):
+        f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("CellField") ; f.setTime(float(i),i,0)
+        arr2=DataArrayDouble(4) ; arr2.iota(10.*i) ; f.setArray(arr2)
+        WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    pfl=DataArrayInt([0,1]) ; pfl.setName("pfl")
+    f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m[pfl]) ; f.setName("PartialField") ; f.setTime(0.,0,0)
+    f.setArray(DataArrayDouble([7.,8.]))
+    ff=MEDFileField1TS() ; ff.setFieldProfile(f,mm,0,pfl) ; ff.write(fname,0)
+    if withNodeField:
+        for i in range(3):
+            f=MEDCouplingFieldDouble(ON_NODES) ; f.setMesh(m) ; f.setName("NodeField") ; f.setTime(float(i),i,0)
+            arr2=DataArrayDouble(9) ; arr2.iota(100.*i) ; f.setArray(arr2)
+            WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+def GetTreeInfo(fname,indexDir):
+    """ Returns the leaves, the time steps, the geometric types and the groups of the first leaf shown by MEDReader."""
+    reader=MEDReader(FileNames=[fname])
+    reader.UseStructureIndex=1
+    reader.StructureIndexDirectory=indexDir
+    reader.UpdatePipelineInformation()
+    extractCT=ExtractCellType(Input=reader)
+    extractCT.UpdatePipelineInformation()
+    extGrp=ExtractGroup(Input=reader)
+    extGrp.UpdatePipelineInformation()
+    ret=(reader.GetProperty("FieldsTreeInfo")[::2],list(reader.TimestepValues),list(extractCT.GetProperty("GeoTypesInfo")),list(extGrp.GetProperty("GroupsFlagsInfo")[::2]))
+    Delete(extGrp) ; Delete(extractCT) ; Delete(reader)
+    return ret
+
+def GetValues(fname,indexDir,useIndex,fieldsStatus,t):
+    """ Returns the ranges of the cell and node arrays read by MEDReader at time t with the leaf fieldsStatus."""
+    reader=MEDReader(FileNames=[fname])
+    reader.UseStructureIndex=useIndex
+    reader.StructureIndexDirectory=indexDir
+    reader.FieldsStatus=fieldsStatus
+    reader.UpdatePipeline(t)
+    ret={}
+    for data in [reader.CellData,reader.PointData]:
+        for name in data.keys():
+            ret[name]=data[name].GetRange()
+    Delete(reader)
+    return ret
+
+@WriteInTmpDir
+def test():
+    """ Check that the index of MEDReader gives the same tree and the same data than the scan of the file and that it is invalidated when the file changes."""
+    fname="testMEDReader29.med"
+    indexDir=os.path.abspath("index")
+    GenerateCase(fname,False)
+    ref=GetTreeInfo(fname,indexDir)
+    # the index is written in the given directory, never next to the MED file
+    assert(not os.path.exists(fname+".mrindex"))
+    indexes=glob.glob(os.path.join(indexDir,"testMEDReader29.med_*.mrindex"))
+    assert(len(indexes)==1)
+    assert(ref[3].count("GRP_grp")==1)
+    assert(GetTreeInfo(fname,indexDir)==ref)
+    # leaves read from the index give the same data than the ones read from the MED file
+    for fieldName,t in [("CellField",1.),("PartialField",0.),("Mesh2",0.)]:
+        leaves=[elt for elt in ref[0] if elt.split("/")[-1].startswith(fieldName+"@@][@@")]
+        assert(len(leaves)==1)
+        fieldsStatus=[leaves[0]]
+        values=GetValues(fname,indexDir,0,fieldsStatus,t)
+        assert(len(values)!=0)
+        assert(GetValues(fname,indexDir,1,fieldsStatus,t)==values)
+    # the file is modified -> index must be recomputed
+    os.remove(fname)
+    GenerateCase(fname,True)
+    ref2=GetTreeInfo(fname,indexDir)
+    assert(len(ref2[0])==len(ref[0])+1)
+    assert(len([elt for elt in ref2[0] if "NodeField" in elt])==1)
+    assert(GetTreeInfo(fname,indexDir)==ref2)
+    # a corrupted index is ignored
+    with open(indexes[0],"w") as f:
+        f.write("garbage")
+    assert(GetTreeInfo(fname,indexDir)==ref2)
+
+if __name__ == "__main__":
+  test()
+  pass
@@ -0,0 +1,90 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ Mesh with a cell field on 4 time steps. Values of time step #i are in [10*i,10*i+3]."""
+    fname="testMEDReader30.med"
+    arr=DataArrayDouble([0,1,2])
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    mm.write(fname,2)
+    for i in range(4):
+        f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("MyField") ; f.setTime(float(i),i,0)
+        arr2=DataArrayDouble(4) ; arr2.iota(10.*i) ; f.setArray(arr2)
+        WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+def GenerateBigCase():
+    """ 400x400 cartesian mesh with 2 cell fields on 3 time steps. Each time step of a field is 1.28 MB of values."""
+    fname="testMEDReader30_1.med"
+    arr=DataArrayDouble(401) ; arr.iota()
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m.setName("Mesh")
+    mm=MEDFileCMesh() ; mm.setMesh(m)
+    mm.write(fname,2)
+    for i in range(3):
+        for name in ["MyField","MyField2"]:
+            f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName(name) ; f.setTime(float(i),i,0)
+            arr2=DataArrayDouble(m.getNumberOfCells()) ; arr2[:]=float(i) ; f.setArray(arr2)
+            WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+@WriteInTmpDir
+def test():
+    """ Check the packing of the modes and that a memory limit not reached does not change the output."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/MyField@@][@@P0']
+    reader.TimeModeProperty=1
+    reader.TimesFlagsStatus=['0000','0001','0002','0003']
+    reader.ModeMemoryLimitInMB=100
+    reader.UpdatePipeline()
+    names=[reader.CellData.GetArray(i).GetName() for i in range(reader.CellData.GetNumberOfArrays())]
+    assert(len([elt for elt in names if elt.startswith("MyField")])==4)
+    #
+    reader.PackModes=1
+    reader.UpdatePipeline()
+    arr=reader.CellData['MyField']
+    assert(arr.GetNumberOfComponents()==4)
+    for i in range(4):
+        assert(arr.GetRange(i)==(10.*i,10.*i+3.))
+    # limit reached by the first mode -> the other modes are loaded for none of the fields whatever the number of threads
+    fname = GenerateBigCase()
+    for nbOfThreads in [1,2]:
+        reader=MEDReader(FileNames=[fname])
+        reader.FieldsStatus=['TS0/Mesh/ComSup0/MyField@@][@@P0','TS0/Mesh/ComSup0/MyField2@@][@@P0']
+        reader.TimeModeProperty=1
+        reader.TimesFlagsStatus=['0000','0001','0002']
+        reader.ModeMemoryLimitInMB=1
+        reader.NumberOfFieldsThreads=nbOfThreads
+        reader.UpdatePipeline()
+        names=sorted([reader.CellData.GetArray(i).GetName() for i in range(reader.CellData.GetNumberOfArrays())])
+        names=[elt for elt in names if elt.startswith("MyField")]
+        assert(names==["MyField [0] - 0","MyField2 [0] - 0"])
+        Delete(reader)
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass
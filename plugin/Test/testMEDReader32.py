@@ -0,0 +1,67 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ Mesh with a cell field on 10 time steps. Time step #i is at time 0.5*i and its values are in [10*i,10*i+3]."""
+    fname="testMEDReader32.med"
+    arr=DataArrayDouble([0,1,2])
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    mm.write(fname,2)
+    for i in range(10):
+        f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("MyField") ; f.setTime(0.5*i,i,0)
+        arr2=DataArrayDouble(4) ; arr2.iota(10.*i) ; f.setArray(arr2)
+        WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+@WriteInTmpDir
+def test():
+    """ Check the decimation of the published time steps, that all the time steps remain reachable and the playback with prefetch."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/MyField@@][@@P0']
+    reader.UpdatePipelineInformation()
+    assert(list(reader.TimestepValues)==[0.5*i for i in range(10)])
+    reader.MaxNumberOfPublishedTimeSteps=4
+    reader.UpdatePipelineInformation()
+    assert(list(reader.TimestepValues)==[0.,1.5,3.,4.5])
+    # time steps not published
+    for t,i in [(2.,4),(0.5,1),(4.,8)]:
+        reader.UpdatePipeline(t)
+        assert(reader.CellData['MyField'].GetRange()==(10.*i,10.*i+3.))
+    # times between time steps or out of range
+    for t,i in [(2.2,4),(-1.,0),(10.,9)]:
+        reader.UpdatePipeline(t)
+        assert(reader.CellData['MyField'].GetRange()==(10.*i,10.*i+3.))
+    # playback of the published time steps, forward then backward, with the next published ones prefetched
+    reader.PrefetchDepth=2
+    for t,i in [(0.,0),(1.5,3),(3.,6),(4.5,9),(3.,6),(1.5,3),(0.,0)]:
+        reader.UpdatePipeline(t)
+        assert(reader.CellData['MyField'].GetRange()==(10.*i,10.*i+3.))
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass
@@ -0,0 +1,73 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from paraview import servermanager
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ Mesh with two FLOAT64 cell fields MyField and Disp on 1 time step."""
+    fname="testMEDReader33.med"
+    arr=DataArrayDouble([0,1,2])
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    mm.write(fname,2)
+    for name,start in [("MyField",0.5),("Disp",1e-9)]:
+        f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName(name) ; f.setTime(0.,0,0)
+        arr2=DataArrayDouble(4) ; arr2.iota(start) ; f.setArray(arr2)
+        WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+@WriteInTmpDir
+def test():
+    """ Check that coordinates and FLOAT64 fields are converted to single precision, except the ones explicitly kept in double precision."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/MyField@@][@@P0','TS0/Mesh/ComSup0/Disp@@][@@P0']
+    reader.UpdatePipeline()
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    assert(ds.GetPoints().GetData().GetDataTypeAsString()=="double")
+    assert(ds.GetCellData().GetArray("MyField").GetDataTypeAsString()=="double")
+    #
+    reader.SinglePrecision=1
+    reader.DoublePrecisionArrays=["Disp"]
+    reader.UpdatePipeline()
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    assert(ds.GetPoints().GetData().GetDataTypeAsString()=="float")
+    assert(ds.GetNumberOfPoints()==9 and ds.GetPoints().GetBounds()==(0.,2.,0.,2.,0.,0.))
+    myField=ds.GetCellData().GetArray("MyField")
+    assert(myField.GetDataTypeAsString()=="float")
+    assert(myField.GetRange()==(0.5,3.5))
+    disp=ds.GetCellData().GetArray("Disp")
+    assert(disp.GetDataTypeAsString()=="double")
+    assert(disp.GetValue(0)==1e-9)
+    #
+    reader.SinglePrecision=0
+    reader.UpdatePipeline()
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    assert(ds.GetPoints().GetData().GetDataTypeAsString()=="double")
+    assert(ds.GetCellData().GetArray("MyField").GetDataTypeAsString()=="double")
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass
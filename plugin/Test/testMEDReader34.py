@@ -0,0 +1,83 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from paraview import servermanager
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ 3x3 quadrangles split in two groups grp0 (first row) and grp1 (the rest). A cell field and a node field on 2 time steps."""
+    fname="testMEDReader34.med"
+    arr=DataArrayDouble(4) ; arr.iota()
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    grp0=DataArrayInt([0,1,2]) ; grp0.setName("grp0")
+    grp1=DataArrayInt([3,4,5,6,7,8]) ; grp1.setName("grp1")
+    mm.setGroupsAtLevel(0,[grp0,grp1])
+    mm.write(fname,2)
+    for i in range(2):
+        f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("CellField") ; f.setTime(float(i),i,0)
+        arr2=DataArrayDouble(9) ; arr2.iota(100.*i) ; f.setArray(arr2)
+        WriteFieldUsingAlreadyWrittenMesh(fname,f)
+        f=MEDCouplingFieldDouble(ON_NODES) ; f.setMesh(m) ; f.setName("NodeField") ; f.setTime(float(i),i,0)
+        f.setArray(m.getCoords()[:,1]+100.*i)
+        WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+@WriteInTmpDir
+def test():
+    """ Check that GroupsToLoad only loads the cells lying on the selected groups, with the field values on them."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/CellField@@][@@P0','TS0/Mesh/ComSup0/NodeField@@][@@P1']
+    reader.UpdatePipeline(1.)
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    assert(ds.GetNumberOfCells()==9 and ds.GetNumberOfPoints()==16)
+    #
+    reader.GroupsToLoad=["GRP_grp0"]
+    reader.UpdatePipeline(1.)
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    assert(ds.GetNumberOfCells()==3 and ds.GetNumberOfPoints()==8)
+    assert(ds.GetCellData().GetArray("CellField").GetRange()==(100.,102.))
+    assert(ds.GetPointData().GetArray("NodeField").GetRange()==(100.,101.))
+    assert(ds.GetBounds()==(0.,3.,0.,1.,0.,0.))
+    # the families and the groups of the whole mesh are still available for ExtractGroup
+    extractGroup=ExtractGroup(Input=reader)
+    extractGroup.AllGroups=["GRP_grp0"]
+    extractGroup.UpdatePipeline(1.)
+    assert(extractGroup.GetDataInformation().GetNumberOfCells()==3)
+    #
+    reader.GroupsToLoad=["GRP_grp1","GRP_grp0"]
+    reader.UpdatePipeline(0.)
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    assert(ds.GetNumberOfCells()==9 and ds.GetNumberOfPoints()==16)
+    assert(ds.GetCellData().GetArray("CellField").GetRange()==(0.,8.))
+    #
+    reader.GroupsToLoad=[]
+    reader.UpdatePipeline(0.)
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    assert(ds.GetNumberOfCells()==9)
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass
@@ -0,0 +1,73 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from paraview import servermanager
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ Mesh with a 6 components cell field Stress (component #j of cell #i is 10*i+j) and a 2 components node field Disp."""
+    fname="testMEDReader35.med"
+    arr=DataArrayDouble([0,1,2])
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    mm.write(fname,2)
+    f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("Stress") ; f.setTime(0.,0,0)
+    arr2=DataArrayDouble([10.*i+j for i in range(4) for j in range(6)],4,6)
+    arr2.setInfoOnComponents(["SIXX [Pa]","SIYY [Pa]","SIZZ [Pa]","SIXY [Pa]","SIXZ [Pa]","SIYZ [Pa]"])
+    f.setArray(arr2)
+    WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    f=MEDCouplingFieldDouble(ON_NODES) ; f.setMesh(m) ; f.setName("Disp") ; f.setTime(0.,0,0)
+    arr3=m.getCoords().deepCopy() ; arr3.setInfoOnComponents(["DX","DY"]) ; f.setArray(arr3)
+    WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+@WriteInTmpDir
+def test():
+    """ Check that ComponentsToLoad restricts the components of a field given to VTK."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/Stress@@][@@P0','TS0/Mesh/ComSup0/Disp@@][@@P1']
+    reader.UpdatePipeline()
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    assert(ds.GetCellData().GetArray("Stress").GetNumberOfComponents()==6)
+    #
+    reader.ComponentsToLoad=["Stress","SIYY","Stress","SIXY [Pa]","Stress","0"]
+    reader.UpdatePipeline()
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    stress=ds.GetCellData().GetArray("Stress")
+    assert(stress.GetNumberOfComponents()==3 and stress.GetNumberOfTuples()==4)
+    assert(stress.GetComponentName(0)=="SIYY" and stress.GetComponentName(1)=="SIXY" and stress.GetComponentName(2)=="SIXX")
+    for i in range(4):
+        assert(stress.GetTuple(i)==(10.*i+1.,10.*i+3.,10.*i))
+    # fields not listed keep all their components
+    assert(ds.GetPointData().GetArray("Disp").GetNumberOfComponents()==2)
+    #
+    reader.ComponentsToLoad=[]
+    reader.UpdatePipeline()
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    assert(ds.GetCellData().GetArray("Stress").GetNumberOfComponents()==6)
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass
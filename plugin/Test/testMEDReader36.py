@@ -0,0 +1,60 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from paraview import servermanager
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ 8x8 quadrangles and their boundary segments, with a cell field equal to the cell id."""
+    fname="testMEDReader36.med"
+    arr=DataArrayDouble(9) ; arr.iota()
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    m1=m.computeSkin()
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m) ; mm.setMeshAtLevel(-1,m1)
+    mm.write(fname,2)
+    f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("CellId") ; f.setTime(0.,0,0)
+    arr2=DataArrayDouble(m.getNumberOfCells()) ; arr2.iota() ; f.setArray(arr2)
+    WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+@WriteInTmpDir
+def test():
+    """ Check that the partitioning strategy does not change the output when the file is not distributed."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/CellId@@][@@P0']
+    assert(reader.PartitioningStrategy=="Slices Of Cell Ids")
+    reader.UpdatePipeline()
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    ref=(ds.GetNumberOfCells(),ds.GetNumberOfPoints(),ds.GetCellData().GetArray("CellId").GetRange())
+    assert(ref==(64,81,(0.,63.)))
+    #
+    reader.PartitioningStrategy="Space Filling Curve"
+    reader.UpdatePipeline()
+    ds=servermanager.Fetch(reader).GetBlock(0)
+    assert((ds.GetNumberOfCells(),ds.GetNumberOfPoints(),ds.GetCellData().GetArray("CellId").GetRange())==ref)
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass
@@ -0,0 +1,61 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from paraview import servermanager
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ Three files of different sizes : file #j has a (j+2)x(j+2) grid with a cell field equal to j."""
+    fnames=[]
+    for j in range(3):
+        fname="testMEDReader38_%d.med"%(j)
+        arr=DataArrayDouble(j+3) ; arr.iota()
+        m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+        mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+        mm.write(fname,2)
+        f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("MyField") ; f.setTime(0.,0,0)
+        arr2=DataArrayDouble(m.getNumberOfCells()) ; arr2[:]=float(j) ; f.setArray(arr2)
+        WriteFieldUsingAlreadyWrittenMesh(fname,f)
+        fnames.append(fname)
+    return fnames
+
+@WriteInTmpDir
+def test():
+    """ Check that the assignment of the files to the processes is exposed and that each file goes to its block."""
+    fnames = GenerateCase()
+    reader=MEDReader(FileNames=fnames)
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/MyField@@][@@P0']
+    reader.UpdatePipeline()
+    reader.UpdatePropertyInformation()
+    assert(list(reader.GetProperty("FileAssignment"))==[0,0,0])
+    mb=servermanager.Fetch(reader)
+    assert(mb.GetNumberOfBlocks()==3)
+    for j in range(3):
+        ds=mb.GetBlock(j)
+        assert(ds.GetNumberOfCells()==(j+2)*(j+2))
+        assert(ds.GetCellData().GetArray("MyField").GetRange()==(float(j),float(j)))
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass
@@ -0,0 +1,62 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from paraview import servermanager
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ Five files with the same mesh and a cell field on 2 time steps. Values of time step #i of file #j are in [100*j+10*i,100*j+10*i+3]."""
+    fnames=[]
+    for j in range(5):
+        fname="testMEDReader39_%d.med"%(j)
+        arr=DataArrayDouble([0,1,2])
+        m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+        mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+        mm.write(fname,2)
+        for i in range(2):
+            f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("MyField") ; f.setTime(float(i),i,0)
+            arr2=DataArrayDouble(4) ; arr2.iota(100.*j+10.*i) ; f.setArray(arr2)
+            WriteFieldUsingAlreadyWrittenMesh(fname,f)
+        fnames.append(fname)
+    return fnames
+
+@WriteInTmpDir
+def test():
+    """ Check that the files read by several threads give the same blocks than the ones read one after another."""
+    fnames = GenerateCase()
+    reader=MEDReader(FileNames=fnames)
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/MyField@@][@@P0']
+    reader.NumberOfReadingThreads=3
+    for t in [0.,1.,0.]:
+        reader.UpdatePipeline(t)
+        mb=servermanager.Fetch(reader)
+        assert(mb.GetNumberOfBlocks()==5)
+        for j in range(5):
+            ds=mb.GetBlock(j)
+            assert(ds.GetNumberOfCells()==4)
+            assert(ds.GetCellData().GetArray("MyField").GetRange()==(100.*j+10.*t,100.*j+10.*t+3.))
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass
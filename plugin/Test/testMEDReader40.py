@@ -0,0 +1,76 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from paraview import servermanager
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ 3x3 quadrangles with groups grp0 (first row) and grp1 (cells 4 and 8) on cells, and a cell field equal to the cell ids."""
+    fname="testMEDReader40.med"
+    arr=DataArrayDouble(4) ; arr.iota()
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    grp0=DataArrayInt([0,1,2]) ; grp0.setName("grp0")
+    grp1=DataArrayInt([4,8]) ; grp1.setName("grp1")
+    mm.setGroupsAtLevel(0,[grp0,grp1])
+    mm.write(fname,2)
+    f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("CellField") ; f.setTime(0.,0,0)
+    arr2=DataArrayDouble(9) ; arr2.iota() ; f.setArray(arr2)
+    WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+def CellFieldValues(ds):
+    arr=ds.GetCellData().GetArray("CellField")
+    return [arr.GetValue(i) for i in range(arr.GetNumberOfTuples())]
+
+@WriteInTmpDir
+def test():
+    """ Check the cells and the points extracted by ExtractGroup, straight and inside out, when the selection changes on the same mesh."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/CellField@@][@@P0']
+    extractGroup=ExtractGroup(Input=reader)
+    extractGroup.AllGroups=["GRP_grp0","GRP_grp1"]
+    extractGroup.UpdatePipeline()
+    ds=servermanager.Fetch(extractGroup).GetBlock(0)
+    assert(ds.GetNumberOfCells()==5 and ds.GetNumberOfPoints()==13)
+    assert(CellFieldValues(ds)==[0.,1.,2.,4.,8.])
+    #
+    extractGroup.InsideOut=1
+    extractGroup.UpdatePipeline()
+    ds=servermanager.Fetch(extractGroup).GetBlock(0)
+    assert(ds.GetNumberOfCells()==4 and ds.GetNumberOfPoints()==11)
+    assert(CellFieldValues(ds)==[3.,5.,6.,7.])
+    #
+    extractGroup.InsideOut=0
+    extractGroup.AllGroups=["GRP_grp1"]
+    extractGroup.UpdatePipeline()
+    ds=servermanager.Fetch(extractGroup).GetBlock(0)
+    assert(ds.GetNumberOfCells()==2 and ds.GetNumberOfPoints()==7)
+    assert(CellFieldValues(ds)==[4.,8.])
+    assert(ds.GetBounds()==(1.,3.,1.,3.,0.,0.))
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass
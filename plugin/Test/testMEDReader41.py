@@ -0,0 +1,110 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from paraview import servermanager
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ 3x3 quadrangles with overlapping groups : All (every cell), Diag (cells 0, 4 and 8) and Left (cells 0, 3 and 6), so each group lies on several families.
+    NodeField is the id of each node."""
+    fname="testMEDReader41.med"
+    arr=DataArrayDouble(4) ; arr.iota()
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    grpAll=DataArrayInt([0,1,2,3,4,5,6,7,8]) ; grpAll.setName("All")
+    grpDiag=DataArrayInt([0,4,8]) ; grpDiag.setName("Diag")
+    grpLeft=DataArrayInt([0,3,6]) ; grpLeft.setName("Left")
+    mm.setGroupsAtLevel(0,[grpAll,grpDiag,grpLeft])
+    mm.write(fname,2)
+    f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("CellField") ; f.setTime(0.,0,0)
+    arr2=DataArrayDouble(9) ; arr2.iota() ; f.setArray(arr2)
+    WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    f=MEDCouplingFieldDouble(ON_NODES) ; f.setMesh(m) ; f.setName("NodeField") ; f.setTime(0.,0,0)
+    arr3=DataArrayDouble(16) ; arr3.iota() ; f.setArray(arr3)
+    WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+def CellsNodeIds(ds):
+    """ Returns, for each cell of ds, the NodeField values of its points, i.e. the ids of its nodes in the input mesh."""
+    arr=ds.GetPointData().GetArray("NodeField")
+    ret=[]
+    for i in range(ds.GetNumberOfCells()):
+        ptIds=ds.GetCell(i).GetPointIds()
+        ret.append([int(arr.GetValue(ptIds.GetId(j))) for j in range(ptIds.GetNumberOfIds())])
+    return ret
+
+def CellFieldValues(ds):
+    arr=ds.GetCellData().GetArray("CellField")
+    return [arr.GetValue(i) for i in range(arr.GetNumberOfTuples())]
+
+@WriteInTmpDir
+def test():
+    """ Check that each block of GroupsAsMultiBlocks gathers, in ascending order, the cells of all the families of its group."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/CellField@@][@@P0']
+    groupsAsMultiBlocks=GroupsAsMultiBlocks(Input=reader)
+    groupsAsMultiBlocks.UpdatePipeline()
+    blocks=servermanager.Fetch(groupsAsMultiBlocks)
+    assert(blocks.GetNumberOfBlocks()==3)
+    assert(CellFieldValues(blocks.GetBlock(0))==[float(i) for i in range(9)])
+    assert(CellFieldValues(blocks.GetBlock(1))==[0.,4.,8.])
+    assert(CellFieldValues(blocks.GetBlock(2))==[0.,3.,6.])
+    for i in range(3):
+        assert(blocks.GetBlock(i).GetNumberOfPoints()==16)
+    pass
+
+@WriteInTmpDir
+def testCompactPoints():
+    """ Check that with CompactPoints each block only keeps the points of its cells, with a renumbered connectivity and the point data of the kept points."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/CellField@@][@@P0','TS0/Mesh/ComSup0/NodeField@@][@@P1']
+    reader.UpdatePipeline()
+    mesh=servermanager.Fetch(reader).GetBlock(0)
+    inputCells=CellsNodeIds(mesh)
+    groupsAsMultiBlocks=GroupsAsMultiBlocks(Input=reader)
+    groupsAsMultiBlocks.CompactPoints=1
+    groupsAsMultiBlocks.UpdatePipeline()
+    blocks=servermanager.Fetch(groupsAsMultiBlocks)
+    assert(blocks.GetNumberOfBlocks()==3)
+    expectedNodes=[list(range(16)),[0,1,4,5,6,9,10,11,14,15],[0,1,4,5,8,9,12,13]]
+    expectedCells=[list(range(9)),[0,4,8],[0,3,6]]
+    for i in range(3):
+        block=blocks.GetBlock(i)
+        assert(block.GetNumberOfPoints()==len(expectedNodes[i]))
+        # point data of the kept points, in ascending order of their ids in the input
+        arr=block.GetPointData().GetArray("NodeField")
+        nodeIds=[int(arr.GetValue(j)) for j in range(block.GetNumberOfPoints())]
+        assert(nodeIds==expectedNodes[i])
+        for j in range(block.GetNumberOfPoints()):
+            assert(block.GetPoint(j)==mesh.GetPoint(nodeIds[j]))
+        # renumbered connectivity leads to the nodes of the input cells
+        assert(CellFieldValues(block)==[float(c) for c in expectedCells[i]])
+        assert(CellsNodeIds(block)==[inputCells[c] for c in expectedCells[i]])
+    pass
+
+if __name__ == "__main__":
+  test()
+  testCompactPoints()
+  pass
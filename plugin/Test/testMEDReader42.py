@@ -0,0 +1,72 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+from medcoupling import *
+from paraview.simple import *
+from MEDReaderHelper import WriteInTmpDir
+
+def GenerateCase():
+    """ Mesh with a cell field on 4 time steps. Values of time step #i are in [10*i,10*i+3]."""
+    fname="testMEDReader42.med"
+    arr=DataArrayDouble([0,1,2])
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    mm.write(fname,2)
+    for i in range(4):
+        f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("MyField") ; f.setTime(float(i),i,0)
+        arr2=DataArrayDouble(4) ; arr2.iota(10.*i) ; f.setArray(arr2)
+        WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+def CheckModes(reader):
+    names=sorted([reader.CellData.GetArray(i).GetName() for i in range(reader.CellData.GetNumberOfArrays())])
+    names=[elt for elt in names if elt.startswith("MyField")]
+    assert(len(names)==4)
+    for i,name in enumerate(names):
+        assert(reader.CellData[name].GetRange()==(10.*i,10.*i+3.))
+
+@WriteInTmpDir
+def test():
+    """ Check that the time steps prefetched and used by the output are not released when the prefetch stops : when switching to mode or when the depth is set to 0."""
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/MyField@@][@@P0']
+    reader.PrefetchDepth=3
+    reader.UpdatePipeline(0.)
+    # modes built with the prefetched time steps
+    reader.TimeModeProperty=1
+    reader.TimesFlagsStatus=['0000','0001','0002','0003']
+    reader.UpdatePipeline()
+    CheckModes(reader)
+    # time step built with a prefetched one just before disabling the prefetch
+    reader.TimeModeProperty=0
+    reader.UpdatePipeline(0.)
+    reader.UpdatePipeline(1.)
+    reader.PrefetchDepth=0
+    reader.UpdatePipeline(2.)
+    assert(reader.CellData['MyField'].GetRange()==(20.,23.))
+    reader.UpdatePipeline(3.)
+    assert(reader.CellData['MyField'].GetRange()==(30.,33.))
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass
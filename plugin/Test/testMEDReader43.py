@@ -0,0 +1,80 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+# To be run by pvbatch with several MPI processes.
+
+from medcoupling import *
+from paraview.simple import *
+from paraview import servermanager
+from MEDReaderHelper import WriteInTmpDir
+import os
+
+def GenerateCase():
+    """ Locally refined mesh with a cell field equal to the cell id : 300x300 quadrangles in [0,1]x[0,1] and 10x10 quadrangles in [1,1001]x[0,1000].
+    The refined part lies in a tiny corner of the bounding box, so its 90000 cells share a few bins of the first histogram of the curve."""
+    fname=os.path.abspath("testMEDReader43.med")# the other processes do not share the current directory
+    arr=DataArrayDouble(301) ; arr.iota() ; arr/=300.
+    fine=MEDCouplingCMesh() ; fine.setCoords(arr,arr) ; fine=fine.buildUnstructured()
+    arrX=DataArrayDouble(11) ; arrX.iota() ; arrX*=100. ; arrY=arrX.deepCopy() ; arrX+=1.
+    coarse=MEDCouplingCMesh() ; coarse.setCoords(arrX,arrY) ; coarse=coarse.buildUnstructured()
+    m=MEDCouplingUMesh.MergeUMeshes([fine,coarse]) ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    mm.write(fname,2)
+    f=MEDCouplingFieldDouble(ON_CELLS) ; f.setMesh(m) ; f.setName("CellId") ; f.setTime(0.,0,0)
+    arr2=DataArrayDouble(m.getNumberOfCells()) ; arr2.iota() ; f.setArray(arr2)
+    WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+def CellIdsPerProcess(reader,nbOfProcs):
+    """ Returns for each process the ids of the cells it has loaded."""
+    ret=[]
+    for rank in range(nbOfProcs):
+        ds=servermanager.Fetch(reader,rank).GetBlock(0)
+        arr=ds.GetCellData().GetArray("CellId")
+        ret.append([int(arr.GetValue(i)) for i in range(arr.GetNumberOfTuples())])
+    return ret
+
+@WriteInTmpDir
+def test():
+    """ Check that the cells distributed along the space filling curve are balanced over the processes and that each cell is loaded once."""
+    nbOfProcs=servermanager.ActiveConnection.GetNumberOfDataPartitions()
+    assert(nbOfProcs>1)
+    fname = GenerateCase()
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=['TS0/Mesh/ComSup0/CellId@@][@@P0']
+    reader.GhostCellGeneratorCallForPara=0
+    reader.PartitioningStrategy="Space Filling Curve"
+    reader.UpdatePipeline()
+    ids=CellIdsPerProcess(reader,nbOfProcs)
+    counts=[len(elt) for elt in ids]
+    # cuts of the curve are exact quantiles, whatever the density of the cells -> numbers of cells differ by 1 at most
+    assert(min(counts)>0 and max(counts)-min(counts)<=1)
+    assert(sorted(sum(ids,[]))==list(range(90100)))
+    # slices of cell ids cover the same cells
+    reader.PartitioningStrategy="Slices Of Cell Ids"
+    reader.UpdatePipeline()
+    ids2=CellIdsPerProcess(reader,nbOfProcs)
+    assert(sorted(sum(ids2,[]))==list(range(90100)))
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass
@@ -0,0 +1,92 @@
+#  -*- coding: iso-8859-1 -*-
+# Copyright (C) 2026  CEA, EDF
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+#
+# See http://www.salome-platform.org/ or email : webmaster.salome@opencascade.com
+#
+# Author : Anthony Geay (EDF R&D)
+
+# To be run by pvbatch with several MPI processes.
+
+from medcoupling import *
+from paraview.simple import *
+from paraview import servermanager
+from MEDReaderHelper import WriteInTmpDir
+import os
+
+def GenerateCase():
+    """ 6x6 quadrangles with a cell field and a node field on 2 time steps. Values of time step #i are the ids plus 100*i."""
+    fname=os.path.abspath("testMEDReader44.med")# the other processes do not share the current directory
+    arr=DataArrayDouble(7) ; arr.iota()
+    m=MEDCouplingCMesh() ; m.setCoords(arr,arr) ; m=m.buildUnstructured() ; m.setName("Mesh")
+    mm=MEDFileUMesh() ; mm.setMeshAtLevel(0,m)
+    mm.write(fname,2)
+    for i in range(2):
+        for name,tof,nb in [("CellField",ON_CELLS,m.getNumberOfCells()),("NodeField",ON_NODES,m.getNumberOfNodes())]:
+            f=MEDCouplingFieldDouble(tof) ; f.setMesh(m) ; f.setName(name) ; f.setTime(float(i),i,0)
+            arr2=DataArrayDouble(nb) ; arr2.iota(100.*i) ; f.setArray(arr2)
+            WriteFieldUsingAlreadyWrittenMesh(fname,f)
+    return fname
+
+def OutputPerProcess(reader,nbOfProcs):
+    """ Returns for each process the number of cells and points and the values of its cell and point arrays (ghosts included)."""
+    ret=[]
+    for rank in range(nbOfProcs):
+        ds=servermanager.Fetch(reader,rank).GetBlock(0)
+        res=[ds.GetNumberOfCells(),ds.GetNumberOfPoints()]
+        for att in [ds.GetCellData(),ds.GetPointData()]:
+            for i in range(att.GetNumberOfArrays()):
+                arr=att.GetArray(i)
+                res.append((arr.GetName(),[arr.GetTuple(j) for j in range(arr.GetNumberOfTuples())]))
+        ret.append(res)
+    return ret
+
+def ReferenceOutput(fname,fieldsStatus,t,nbOfProcs):
+    """ Output of a new reader : the ghost cells are computed by vtkGhostCellsGenerator."""
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=fieldsStatus
+    reader.UpdatePipeline(t)
+    ret=OutputPerProcess(reader,nbOfProcs)
+    Delete(reader)
+    return ret
+
+@WriteInTmpDir
+def test():
+    """ Check that the ghost layer reused for a new time step or for other arrays on the same mesh gives the output of vtkGhostCellsGenerator."""
+    nbOfProcs=servermanager.ActiveConnection.GetNumberOfDataPartitions()
+    assert(nbOfProcs>1)
+    fname = GenerateCase()
+    status=['TS0/Mesh/ComSup0/CellField@@][@@P0']
+    reader=MEDReader(FileNames=[fname])
+    reader.FieldsStatus=status
+    reader.UpdatePipeline(0.)
+    out0=OutputPerProcess(reader,nbOfProcs)
+    assert(out0==ReferenceOutput(fname,status,0.,nbOfProcs))
+    # same mesh, other time step -> arrays exchanged with the ghost layer of the previous request
+    reader.UpdatePipeline(1.)
+    out1=OutputPerProcess(reader,nbOfProcs)
+    assert(out1!=out0)
+    assert(out1==ReferenceOutput(fname,status,1.,nbOfProcs))
+    # same mesh, other arrays
+    status=['TS0/Mesh/ComSup0/CellField@@][@@P0','TS0/Mesh/ComSup0/NodeField@@][@@P1']
+    reader.FieldsStatus=status
+    reader.UpdatePipeline(1.)
+    assert(OutputPerProcess(reader,nbOfProcs)==ReferenceOutput(fname,status,1.,nbOfProcs))
+    pass
+
+if __name__ == "__main__":
+  test()
+  pass